@@ -0,0 +1,91 @@
+"""Kaltstart- und Rerun-Zeiten der App pro Seite (headless über Streamlit ``AppTest``).
+
+Jede Messung läuft in einem eigenen Prozess, damit Modul-Imports beim
+Kaltstart mitgezählt werden. Daten kommen aus einem synthetischen User in
+einem temporären Arbeitsordner.
+
+    python -m benchmarks.bench_app [--reruns 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+from benchmarks.synthetic import PROFILES, make_store, write_user
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+PAGES = [
+    "Tagesübersicht",
+    "Stundenplan",
+    "Klausuren & Lernen",
+    "To-Do & Hausaufgaben",
+    "Seminare & Punkte",
+    "Lernplan Woche",
+    "Lernzettel erstellen",
+    "PDFs zusammenfügen",
+    "PDF erstellen",
+    "LaTeX",
+    "Mood-Tracker & Stressradar",
+]
+
+_CHILD = textwrap.dedent(
+    """
+    import json, statistics, sys, time
+    from streamlit.testing.v1 import AppTest
+
+    app_path, page, reruns = sys.argv[1], sys.argv[2], int(sys.argv[3])
+    at = AppTest.from_file(app_path, default_timeout=120)
+    at.session_state["logged_in"] = True
+    at.session_state["user"] = "bench"
+
+    t0 = time.perf_counter()
+    at.run()
+    if page != "Tagesübersicht":
+        at.sidebar.radio[0].set_value(page).run()
+    cold = time.perf_counter() - t0
+
+    times = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+    print(json.dumps({"cold": cold, "rerun": statistics.median(times), "error": bool(at.exception)}))
+    """
+)
+
+
+def seed_user(workdir: str, seed: int = 1):
+    """Legt einen User ``bench`` (Profil "klein") an."""
+    write_user(os.path.join(workdir, "data"), "bench", make_store(**PROFILES["klein"], seed=seed))
+
+
+def measure(page: str, reruns: int, workdir: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(APP_PATH))
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, APP_PATH, page, str(reruns)],
+        cwd=workdir, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kaltstart/Rerun pro Seite messen.")
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--page", action="append", help="Nur diese Seite(n)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        seed_user(workdir)
+        print(f"{'Seite':<30} {'Kaltstart':>10} {'Rerun (Median)':>15}")
+        for page in args.page or PAGES:
+            res = measure(page, args.reruns, workdir)
+            flag = "  (Fehler!)" if res["error"] else ""
+            print(f"{page:<30} {res['cold'] * 1000:>8.0f}ms {res['rerun'] * 1000:>13.0f}ms{flag}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""Benchmark-Suite für Store, Loader und Seitenlogik (ohne Streamlit).
+
+Erzeugt einen synthetischen User (Profil "gross": 500 Klausuren, 50k To-Dos,
+5 Jahre Mood, 2 MB Stundenplan), misst Laufzeit (Median/Min über mehrere
+Läufe) und Speicher-Spitze (tracemalloc) pro Fall und vergleicht mit einer
+gespeicherten Baseline. Absolute Zeiten sind nur auf demselben Rechner
+vergleichbar – die Baseline liegt daher pro Rechner unter
+``benchmarks/baselines/`` (nicht eingecheckt) und wird auf jeder Maschine
+einmal mit ``--save-baseline`` angelegt. Aufruf aus dem Projektordner:
+
+    python -m benchmarks.bench_data                    # messen + mit Baseline vergleichen
+    python -m benchmarks.bench_data --save-baseline    # aktuelle Werte als Baseline speichern
+    python -m benchmarks.bench_data --profil klein --runs 3 --nur load_
+
+Exit-Code 1, wenn die Bestzeit eines Falls über Baseline × (1 + Toleranz) liegt.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import tempfile
+import textwrap
+import time
+import tracemalloc
+from datetime import date
+
+from benchmarks.synthetic import PROFILES, make_ics_feed, make_script, make_store, write_user
+from dashboard import archive, ical
+from dashboard.backup import build_backup_zip
+from dashboard.docx_export import build_docx
+from dashboard.grades import GradeStats
+from dashboard.intervals import build_index, dated_intervals
+from dashboard.latex_library import search
+from dashboard.model import (
+    compute_exam_risk,
+    klausuren_frame,
+    klausuren_records,
+    lernplan_frame,
+    mood_frame,
+    mood_records,
+    normalize_todos,
+    seminare_frame,
+    seminare_records,
+    vorlesungen_frame,
+)
+from dashboard.mood_chart import MOOD_RANGES, build_mood_pyramid, mood_chart_data
+from dashboard.scheduler import busy_intervals, schedule_week, week_start_of
+from dashboard.schema import VERSION_KEY, upgrade_store
+from dashboard.store import DASHBOARD_JSON, atomic_write_json, read_store_file
+from dashboard.summarize import build_summary
+from dashboard.workload import workload_forecast
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+TODAY = date(2026, 1, 15)
+
+# Unterhalb dieser Differenz gilt nichts als Regression (Messrauschen)
+MIN_REGRESSION_MS = 2.0
+
+
+def machine_id() -> str:
+    """Rechnername + Architektur, z.B. ``laptop-x86_64``."""
+    name = "".join(c if c.isalnum() or c in "-_" else "_" for c in platform.node()) or "rechner"
+    return f"{name}-{platform.machine() or 'unbekannt'}"
+
+
+def baseline_path() -> str:
+    return os.path.join(BASELINE_DIR, f"{machine_id()}.json")
+
+
+def build_cases(workdir: str, profil: str) -> dict:
+    """``{name: funktion}``; vorbereitete Daten stecken in den Closures."""
+    store = make_store(**PROFILES[profil], today=TODAY)
+    path = write_user(workdir, "bench", store)
+    out_path = os.path.join(workdir, "out", DASHBOARD_JSON)
+
+    klausuren = klausuren_frame(store["klausuren"])
+    seminare = seminare_frame(store["seminare"])
+    mood = mood_frame(store["mood"])
+    lernplan = lernplan_frame(store["lernplan"])
+    vorlesungen = vorlesungen_frame(store["vorlesungen"])
+    todos = normalize_todos(store["todos"])
+    pyramid = build_mood_pyramid(mood)
+    # Lernzettel: 300-seitiges Skript (ca. 900 KB Text)
+    script = make_script(300)
+    # Dasselbe Skript mit Zeilenumbrüchen wie aus der PDF-Extraktion (ca. 11k Zeilen)
+    script_lines = "\n".join(textwrap.wrap(script, 80))
+    # Store von vor der Versionierung: einmalige Migration beim ersten Laden
+    unversioned = {k: v for k, v in store.items() if k != VERSION_KEY}
+    # Derselbe User nach dem Archivieren: alte Mood-Einträge/Klausuren in Jahres-Shards
+    archived_dir = os.path.join(workdir, "archiviert")
+    os.makedirs(archived_dir)
+    hot, _ = archive.archive_store(archived_dir, store, TODAY)
+    hot_path = os.path.join(archived_dir, DASHBOARD_JSON)
+    atomic_write_json(hot_path, hot)
+
+    def archive_cold_read():
+        archive._cache.clear()
+        return archive.cold_rows(archived_dir, "mood")
+
+    # Notenstatistik: eine Klausur wird archiviert und benotet
+    grade_stats = GradeStats.from_rows(store["klausuren"])
+    graded = [dict(r) for r in store["klausuren"]]
+    graded[1].update(archiviert=True, note="11.0")
+
+    # Kalender: Uni-Feed eines Semesters (ca. 1,5 MB, 40 Serien + 3000 Einzeltermine)
+    feed = make_ics_feed()
+    imported, _ = ical.parse_feed(io.StringIO(feed), "uni.ics")
+    synced, _, _ = ical.sync_rows(store["vorlesungen"], "uni.ics", imported)
+    calendar = [ical.CalendarPart.build(c, store[c]) for c in ical.EXPORT_COLLECTIONS]
+    # Export nach dem Abhaken eines einzelnen To-Dos
+    todos_done = [dict(t) for t in store["todos"]]
+    todos_done[0]["done"] = not todos_done[0].get("done")
+
+    def ics_export():
+        return [ical.CalendarPart.build(c, store[c]) for c in ical.EXPORT_COLLECTIONS]
+
+    def ics_export_update():
+        parts = [p if p.collection != "todos" else ical.CalendarPart.build("todos", todos_done, p) for p in calendar]
+        return ical.calendar_text(parts)
+
+    def exam_risk_all():
+        for _, row in klausuren.iterrows():
+            compute_exam_risk(row, TODAY)
+
+    return {
+        "store_read": lambda: read_store_file(path),
+        "store_write": lambda: atomic_write_json(out_path, store),
+        "store_migrate": lambda: upgrade_store(unversioned),
+        "store_read_archiviert": lambda: read_store_file(hot_path),
+        "archive_cold_read": archive_cold_read,
+        "archive_full_store": lambda: archive.full_store(archived_dir, hot),
+        "load_klausuren": lambda: klausuren_frame(store["klausuren"]),
+        "load_todos": lambda: [dict(t) for t in store["todos"]],
+        "load_seminare": lambda: seminare_frame(store["seminare"]),
+        "load_mood": lambda: mood_frame(store["mood"]),
+        "load_lernplan": lambda: lernplan_frame(store["lernplan"]),
+        "load_vorlesungen": lambda: vorlesungen_frame(store["vorlesungen"]),
+        "save_klausuren": lambda: klausuren_records(klausuren),
+        "save_seminare": lambda: seminare_records(seminare),
+        "save_mood": lambda: mood_records(mood),
+        # Änderungsprüfung in store_collection() bei jedem Rerun der To-Do-Seite
+        "todos_change_check": lambda: store["todos"] == [dict(t) for t in todos],
+        "exam_risk_all": exam_risk_all,
+        "grade_stats": lambda: GradeStats.from_rows(store["klausuren"]),
+        "grade_stats_update": lambda: grade_stats.updated(store["klausuren"], graded),
+        "workload_26w": lambda: workload_forecast(klausuren, todos, seminare, TODAY, weeks=26),
+        "mood_pyramid": lambda: build_mood_pyramid(mood),
+        "mood_chart_alles": lambda: mood_chart_data(pyramid, TODAY, MOOD_RANGES["Alles"]),
+        "schedule_week": lambda: schedule_week(
+            lernplan, klausuren, busy_intervals(seminare, klausuren, vorlesungen), week_start_of(TODAY)
+        ),
+        "seminar_conflicts": lambda: build_index(dated_intervals(seminare, klausuren, vorlesungen)),
+        "backup_zip": lambda: build_backup_zip(store, "bench"),
+        "latex_search": lambda: search("int", None),
+        "lernzettel_summary": lambda: build_summary(script),
+        "lernzettel_docx": lambda: build_docx(script_lines),
+        "ics_import": lambda: ical.parse_feed(io.StringIO(feed), "uni.ics"),
+        "ics_sync_unchanged": lambda: ical.sync_rows(synced, "uni.ics", imported),
+        "ics_export": ics_export,
+        "ics_export_update": ics_export_update,
+    }
+
+
+def measure(fn, runs: int) -> dict:
+    fn()  # Aufwärmen (Caches, Imports)
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"median_ms": statistics.median(times), "min_ms": min(times), "peak_kb": peak / 1024}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Fälle, deren Bestzeit die Baseline um mehr als ``tolerance`` überschreitet.
+
+    Verglichen wird das Minimum – es schwankt bei Last auf der Maschine am wenigsten.
+    """
+    regressions = []
+    for name, res in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        limit = base["min_ms"] * (1 + tolerance)
+        if res["min_ms"] > limit and res["min_ms"] - base["min_ms"] > MIN_REGRESSION_MS:
+            regressions.append((name, base["min_ms"], res["min_ms"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profil", choices=list(PROFILES), default="gross")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--nur", help="Nur Fälle, deren Name so beginnt")
+    parser.add_argument("--baseline", default=baseline_path(), help="Default: benchmarks/baselines/<rechner>.json")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--toleranz", type=float, default=0.5, help="Erlaubte Verlangsamung (0.5 = +50 %%)")
+    parser.add_argument("--json", help="Ergebnisse zusätzlich als JSON schreiben")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.isfile(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("profil") != args.profil:
+            print(f"Baseline ist für Profil {baseline.get('profil')!r} – kein Vergleich.")
+            baseline = {}
+        elif baseline.get("rechner") != machine_id():
+            print(f"Baseline stammt von {baseline.get('rechner')!r} – kein Vergleich (--save-baseline auf diesem Rechner).")
+            baseline = {}
+    elif not args.save_baseline:
+        print(f"Keine Baseline für diesen Rechner ({args.baseline}) – erst mit --save-baseline anlegen.")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        cases = build_cases(workdir, args.profil)
+        print(f"{'Fall':<22} {'Median':>10} {'Min':>10} {'Peak':>10} {'Base-Min':>10}")
+        for name, fn in cases.items():
+            if args.nur and not name.startswith(args.nur):
+                continue
+            res = measure(fn, args.runs)
+            results[name] = res
+            base = baseline.get("results", {}).get(name)
+            base_str = f"{base['min_ms']:>8.1f}ms" if base else f"{'-':>10}"
+            print(
+                f"{name:<22} {res['median_ms']:>8.1f}ms {res['min_ms']:>8.1f}ms "
+                f"{res['peak_kb'] / 1024:>8.1f}MB {base_str}"
+            )
+
+    payload = {
+        "profil": args.profil,
+        "runs": args.runs,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "rechner": machine_id(),
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        print(f"Baseline gespeichert: {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.toleranz)
+    for name, before, now in regressions:
+        print(f"REGRESSION {name}: {before:.1f} ms -> {now:.1f} ms")
+    if regressions:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
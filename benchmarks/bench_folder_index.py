@@ -0,0 +1,79 @@
+"""Lernordner-Index: Vollscan gegen inkrementellen Rescan.
+
+Legt einen synthetischen Ordnerbaum an (pro Klausur ein Lernordner mit
+Unterordnern und Dateien) und misst:
+
+- ``voll``: erster Scan, jeder Ordner wird mit ``os.scandir`` gelistet
+- ``unveraendert``: Rescan ohne Änderung – nur ein ``stat`` pro Ordner
+- ``eine_datei_neu``: Rescan, nachdem in einem Unterordner eine Datei dazukam
+
+    python -m benchmarks.bench_folder_index
+    python -m benchmarks.bench_folder_index --klausuren 300 --ordner 20 --dateien 30
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from dashboard.folder_index import FolderIndexer
+
+
+def make_tree(base: str, klausuren: int, ordner: int, dateien: int, seed: int) -> list:
+    rng = random.Random(seed)
+    roots = []
+    for k in range(klausuren):
+        root = os.path.join(base, f"klausur{k:03d}")
+        for o in range(ordner):
+            sub = os.path.join(root, f"kapitel{o:02d}", "uebungen" if o % 3 == 0 else "")
+            os.makedirs(sub, exist_ok=True)
+            for d in range(dateien):
+                with open(os.path.join(sub, f"blatt{d:03d}.pdf"), "wb") as f:
+                    f.write(b"x" * rng.randint(0, 2048))
+        roots.append(root)
+    return roots
+
+
+def timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--klausuren", type=int, default=100)
+    parser.add_argument("--ordner", type=int, default=10, help="Unterordner pro Lernordner")
+    parser.add_argument("--dateien", type=int, default=20, help="Dateien pro Unterordner")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as base:
+        roots = make_tree(base, args.klausuren, args.ordner, args.dateien, args.seed)
+        indexer = FolderIndexer(roots=[base])
+
+        def scan_all():
+            for root in roots:
+                indexer.scan(root)
+
+        voll = timed(scan_all)
+        listed = indexer.counter["listed"]
+        unveraendert = timed(scan_all)
+
+        target = os.path.join(roots[len(roots) // 2], "kapitel01")
+        with open(os.path.join(target, "neu.pdf"), "wb") as f:
+            f.write(b"neu")
+        before = indexer.counter["listed"]
+        neu = timed(scan_all)
+        relisted = indexer.counter["listed"] - before
+        summary = indexer.scan(roots[len(roots) // 2])
+
+    print(f"{len(roots)} Lernordner, {listed} Verzeichnisse, {args.klausuren * args.ordner * args.dateien} Dateien")
+    print(f"{'voll':<16} {voll:>9.1f}ms")
+    print(f"{'unveraendert':<16} {unveraendert:>9.1f}ms")
+    print(f"{'eine_datei_neu':<16} {neu:>9.1f}ms  ({relisted} Verzeichnis(se) neu gelistet)")
+    print(f"Neueste Datei: {summary['zuletzt'][0][0]}")
+
+
+if __name__ == "__main__":
+    main()
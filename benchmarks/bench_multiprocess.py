@@ -0,0 +1,130 @@
+"""Mehrere Worker-Prozesse schreiben gleichzeitig in denselben ``data/``-Ordner.
+
+Simuliert den Mehrprozess-Betrieb (siehe ``run_dashboard.py --workers``):
+Jeder Prozess liest wie eine Session den aktuellen Snapshot, hängt ein
+To-Do an oder hakt eins ab und speichert mit ``shared_store.commit()``
+(Sperre + Dreiwege-Merge). Ein Teil der Schreibvorgänge geht auf einen
+gemeinsamen "heißen" User, der Rest verteilt sich auf die übrigen.
+
+Am Ende wird geprüft, dass jedes angehängte To-Do in den Dateien steht
+(keine verlorenen Schreibvorgänge, sonst Exit-Code 1) und wie oft es als
+Konfliktkopie doppelt vorkommt (siehe ``dashboard.merge``). Ausgabe pro
+Prozessanzahl: Schreibvorgänge/s, Sperr-Wartezeit, Merges, Verluste.
+
+    python -m benchmarks.bench_multiprocess                    # 1, 2, 4 Prozesse
+    python -m benchmarks.bench_multiprocess --procs 1,8 --ops 300 --heiss 0.5
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.synthetic import make_store, write_user
+from dashboard.store import DASHBOARD_JSON
+
+
+def _worker(proc: int, base_dir: str, users: list, ops: int, hot: float, seed: int, start, out):
+    from dashboard import locking
+    from dashboard.shared_store import StoreRegistry
+
+    registry = StoreRegistry()
+    rng = random.Random(seed + proc)
+    added = []
+    start.wait()
+    t0 = time.perf_counter()
+    for i in range(ops):
+        user = users[0] if rng.random() < hot else rng.choice(users[1:] or users)
+        user_dir = os.path.join(base_dir, user)
+        todos = registry.get(user_dir).data["todos"]
+        if rng.random() < 0.5 or not todos:
+            text = f"p{proc}-{i}"
+            new = todos + [{"text": text, "done": False, "fach": "", "wichtig": False, "faellig": ""}]
+            added.append((user, text))
+        else:
+            idx = rng.randrange(len(todos))
+            new = list(todos)
+            new[idx] = dict(todos[idx], done=not todos[idx]["done"])
+        registry.commit(user_dir, {"todos": new}, {"todos": todos})
+    out.put({
+        "proc": proc,
+        "seconds": time.perf_counter() - t0,
+        "added": added,
+        "lock": locking.stats(),
+        "merges": registry.stats()["merges"],
+    })
+
+
+def run(procs: int, users: int, ops: int, hot: float, seed: int) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as base_dir:
+        names = [f"mp{i:02d}" for i in range(users)]
+        for n, name in enumerate(names):
+            write_user(base_dir, name, make_store(klausuren=10, todos=50, mood_years=1, seminare=5, timetable_kb=20, seed=n))
+
+        start = ctx.Barrier(procs + 1)
+        out = ctx.Queue()
+        workers = [
+            ctx.Process(target=_worker, args=(p, base_dir, names, ops, hot, seed, start, out))
+            for p in range(procs)
+        ]
+        for w in workers:
+            w.start()
+        start.wait()
+        t0 = time.perf_counter()
+        results = [out.get() for _ in workers]
+        wall = time.perf_counter() - t0
+        for w in workers:
+            w.join()
+
+        found = {}
+        for name in names:
+            with open(os.path.join(base_dir, name, DASHBOARD_JSON), "r", encoding="utf-8") as f:
+                for t in json.load(f)["todos"]:
+                    found[(name, t["text"])] = found.get((name, t["text"]), 0) + 1
+
+    expected = [tuple(a) for r in results for a in r["added"]]
+    lost = sum(1 for a in expected if found.get(a, 0) == 0)
+    doubled = sum(1 for a in expected if found.get(a, 0) > 1)
+    lock_ms = sum(r["lock"]["wait_ms"] for r in results)
+    acquired = sum(r["lock"]["acquired"] for r in results)
+    return {
+        "procs": procs,
+        "writes": procs * ops,
+        "wall_s": wall,
+        "writes_per_s": procs * ops / wall,
+        "lock_wait_ms_avg": lock_ms / max(acquired, 1),
+        "lock_wait_ms_max": max(r["lock"]["max_wait_ms"] for r in results),
+        "contended": sum(r["lock"]["contended"] for r in results),
+        "merges": sum(r["merges"] for r in results),
+        "lost": lost,
+        "doubled": doubled,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--procs", default="1,2,4", help="Prozessanzahlen, kommagetrennt")
+    parser.add_argument("--users", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=200, help="Schreibvorgänge pro Prozess")
+    parser.add_argument("--heiss", type=float, default=0.25, help="Anteil der Writes auf den gemeinsamen User")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'Prozesse':>8} {'Writes':>7} {'Writes/s':>9} {'Warten Ø':>9} {'max':>8} {'gewartet':>9} {'Merges':>7} {'verloren':>9} {'doppelt':>8}")
+    failed = False
+    for procs in [int(p) for p in args.procs.split(",")]:
+        r = run(procs, args.users, args.ops, args.heiss, args.seed)
+        print(
+            f"{r['procs']:>8} {r['writes']:>7} {r['writes_per_s']:>9.0f} {r['lock_wait_ms_avg']:>7.2f}ms "
+            f"{r['lock_wait_ms_max']:>6.0f}ms {r['contended']:>9} {r['merges']:>7} {r['lost']:>9} {r['doubled']:>8}"
+        )
+        failed = failed or r["lost"]
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
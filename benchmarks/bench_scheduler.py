@@ -0,0 +1,72 @@
+"""Benchmark für den Wochen-Lernplaner über synthetische Semester.
+
+Aufruf aus dem Projektordner:
+
+    python -m benchmarks.bench_scheduler [--faecher 12] [--wochen 26] [--runs 5]
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+from dashboard.scheduler import busy_intervals, schedule_range, week_start_of
+
+
+def synthetic_semester(n_faecher: int, weeks: int, seed: int = 1):
+    """Lernplan, Klausuren und Seminare für ein zufälliges Semester."""
+    rng = random.Random(seed)
+    start = week_start_of(date(2025, 10, 13))
+    end = start + timedelta(weeks=weeks)
+
+    lernplan = pd.DataFrame(
+        {
+            "fach": [f"Fach {i}" for i in range(n_faecher)],
+            "stunden_pro_woche": [rng.choice([2.0, 3.0, 4.0, 6.0, 8.0]) for _ in range(n_faecher)],
+            "priorität": [rng.randint(1, 3) for _ in range(n_faecher)],
+        }
+    )
+    klausuren = pd.DataFrame(
+        {
+            "fach": [f"Fach {i}" for i in range(n_faecher)],
+            "datum": [end - timedelta(days=rng.randint(0, 28)) for _ in range(n_faecher)],
+            "archiviert": [False] * n_faecher,
+        }
+    )
+    n_sem = weeks * 2
+    seminare = pd.DataFrame(
+        {
+            "datum": [start + timedelta(days=rng.randint(0, weeks * 7)) for _ in range(n_sem)],
+            "uhrzeit1": [f"{rng.randint(8, 16)}:00-{rng.randint(17, 19)}:00" for _ in range(n_sem)],
+            "datum2": [pd.NaT] * n_sem,
+            "uhrzeit2": [""] * n_sem,
+        }
+    )
+    return lernplan, klausuren, seminare, start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--faecher", type=int, default=12)
+    parser.add_argument("--wochen", type=int, default=26)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    lernplan, klausuren, seminare, start = synthetic_semester(args.faecher, args.wochen)
+
+    timings = []
+    for _ in range(args.runs):
+        t0 = time.perf_counter()
+        busy = busy_intervals(seminare, klausuren)
+        plan, rest = schedule_range(lernplan, klausuren, busy, start, args.wochen)
+        timings.append(time.perf_counter() - t0)
+
+    geplant = len(plan)
+    offen = sum(rest.values())
+    print(f"{args.faecher} Fächer, {args.wochen} Wochen: {geplant} Blöcke geplant, {offen:.0f} h nicht verplant")
+    print(f"min {min(timings) * 1000:.1f} ms · max {max(timings) * 1000:.1f} ms über {args.runs} Läufe")
+
+
+if __name__ == "__main__":
+    main()
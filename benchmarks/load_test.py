@@ -0,0 +1,322 @@
+"""Lasttest: viele gleichzeitige Sessions gegen einen App-Prozess (headless über ``AppTest``).
+
+Jeder simulierte User bekommt einen eigenen synthetischen Store, jede
+Session eine eigene ``AppTest``-Instanz in einem eigenen Thread – so teilen sich alle
+Sessions wie auf dem echten Server einen Prozess (und den GIL). Pro Schritt
+wählt ein User zufällig eine Aktion:
+
+- ``seite``: eine Seite im Sidebar-Radio anklicken
+- ``todo``: auf der To-Do-Seite eine Checkbox umschalten
+- ``timer``: auf der Tagesübersicht eine Lernphase mit einer Klausur
+  verknüpfen, starten und als abgelaufen verbuchen
+
+``AppTest`` setzt pro Lauf eine prozessweite Runtime und ist daher nicht
+threadsicher: Reruns laufen nacheinander unter einem Lock. Da Reruns
+CPU-gebunden sind und sich auf dem Server ohnehin den GIL teilen, entspricht
+das einem Server-Prozess unter Last. Gemessen wird pro Rerun die Latenz
+(Warten + Ausführung, wie sie der User spürt) und die reine Ausführungszeit.
+Ausgabe: Perzentile pro Aktion, Durchsatz (Reruns/s über alle Sessions),
+Schreibrate pro User (Store-Versionen laut ``store_rev`` und ca. geschriebene
+KB) und der Spitzen-Speicher des Prozesses. Mit ``--tabs`` öffnet jeder User
+mehrere Sessions auf denselben Store (Handy, Laptop, Tabs).
+
+Der Login läuft nicht über das Formular (die Zugangsdaten sind fest in
+``app.py``), sondern setzt ``logged_in``/``user`` direkt im Session-State.
+
+    python -m benchmarks.load_test                         # 8 User × 30 Schritte
+    python -m benchmarks.load_test --users 20 --steps 50 --think 0.5
+    python -m benchmarks.load_test --users 4 --tabs 3 --profil gross
+    python -m benchmarks.load_test --spans --json last.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from benchmarks.synthetic import PROFILES, make_store, write_user
+from dashboard import locking, profiling
+from dashboard.store import DASHBOARD_JSON
+from dashboard.views import PAGES
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+PAGE_TODOS = "To-Do & Hausaufgaben"
+PAGE_TIMER = "Tagesübersicht"
+TIMER_EXAM_LABEL = "Timer mit Klausur verknüpfen (optional)"
+
+# Gewichte der Aktionen pro Schritt
+ACTIONS = {"seite": 0.6, "todo": 0.25, "timer": 0.15}
+
+# Serialisiert at.run() über alle Sessions (siehe Modul-Docstring)
+_RUN_LOCK = threading.Lock()
+
+
+class SimUser:
+    """Eine simulierte Session (Browser-Tab) eines Users mit eigener ``AppTest``-Instanz."""
+
+    def __init__(self, user: str, name: str, seed: int, think: float, timeout: float):
+        self.user = user
+        self.name = name
+        self.rng = random.Random(seed)
+        self.think = think
+        self.timeout = timeout
+        self.at = None
+        self.page = None
+        self.samples = []  # (aktion, seite, latenz_ms, ausfuehrung_ms)
+        self.errors = []
+        self.rev_first = self.rev_last = 0
+        self.t_start = self.t_end = 0.0
+
+    # ---------- Hilfen ----------
+    def _rev(self) -> int:
+        return self.at.session_state["store_rev"] if "store_rev" in self.at.session_state else 0
+
+    def _run(self, action: str):
+        """Rerun mit den zuvor gesetzten Widget-Werten; misst Latenz und Ausführung."""
+        t0 = time.perf_counter()
+        with _RUN_LOCK:
+            t1 = time.perf_counter()
+            self.at.run()
+        t2 = time.perf_counter()
+        self.samples.append((action, self.page, (t2 - t0) * 1000, (t2 - t1) * 1000))
+        if self.at.exception:
+            self.errors.append(f"{action}/{self.page}: {self.at.exception[0].message}")
+        self.rev_last = self._rev()
+
+    def _goto(self, page: str):
+        if self.page == page:
+            return
+        self.page = page
+        self.at.sidebar.radio[0].set_value(page)
+        self._run("seite")
+
+    # ---------- Aktionen ----------
+    def login(self):
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(APP_PATH, default_timeout=self.timeout)
+        self.at.session_state["logged_in"] = True
+        self.at.session_state["user"] = self.user
+        self.page = PAGE_TIMER
+        self._run("login")
+        self.rev_first = self.rev_last
+
+    def click_page(self):
+        self._goto(self.rng.choice([p for p in PAGES if p != self.page]))
+
+    def toggle_todo(self):
+        self._goto(PAGE_TODOS)
+        boxes = [c for c in self.at.checkbox if c.key and c.key.startswith("done_")]
+        if boxes:
+            box = self.rng.choice(boxes)
+            box.set_value(not box.value)
+            self._run("todo")
+
+    def log_timer(self):
+        self._goto(PAGE_TIMER)
+        select = next((s for s in self.at.selectbox if s.label == TIMER_EXAM_LABEL), None)
+        if select is None or len(select.options) < 2:
+            return
+        exam = self.rng.choice(select.options[1:])
+        start = next(b for b in self.at.button if b.label == "Lernphase starten")
+        select.set_value(exam)
+        start.click()
+        self._run("timer")
+        # Lernphase als abgelaufen markieren – der nächste Rerun bucht die Stunden
+        duration = self.at.session_state["timer_duration"]
+        self.at.session_state["timer_start"] = (datetime.now() - timedelta(seconds=duration + 1)).isoformat()
+        self._run("timer")
+
+    def session(self, steps: int, start: threading.Barrier):
+        try:
+            start.wait()
+            self.t_start = time.perf_counter()
+            self.login()
+            actions, weights = list(ACTIONS), list(ACTIONS.values())
+            for _ in range(steps):
+                action = self.rng.choices(actions, weights)[0]
+                if action == "seite":
+                    self.click_page()
+                elif action == "todo":
+                    self.toggle_todo()
+                else:
+                    self.log_timer()
+                if self.think:
+                    time.sleep(self.rng.uniform(0, self.think))
+        except Exception:
+            self.errors.append(traceback.format_exc(limit=3))
+        finally:
+            self.t_end = time.perf_counter()
+
+
+def percentiles(values: list) -> dict:
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {"n": len(values), "p50": p50, "p90": p90, "p99": p99, "max": max(values)}
+
+
+def report(users: list, wall: float) -> dict:
+    samples = [s for u in users for s in u.samples]
+    by_action = {}
+    for action, _, ms, _ in samples:
+        by_action.setdefault(action, []).append(ms)
+    by_page = {}
+    for action, page, ms, _ in samples:
+        if action == "seite":
+            by_page.setdefault(page, []).append(ms)
+
+    # Schreibvorgänge pro User: die Store-Version zählt über alle Tabs hoch
+    per_user = {}
+    for u in users:
+        if u.user in per_user:
+            continue
+        sessions = [s for s in users if s.user == u.user]
+        writes = max(s.rev_last for s in sessions) - min(s.rev_first for s in sessions)
+        minutes = max(max(s.t_end for s in sessions) - min(s.t_start for s in sessions), 1e-9) / 60
+        kb = writes * os.path.getsize(os.path.join("data", u.user, DASHBOARD_JSON)) / 1024
+        per_user[u.user] = {
+            "sessions": len(sessions),
+            "reruns": sum(len(s.samples) for s in sessions),
+            "writes": writes,
+            "writes_per_min": writes / minutes,
+            "kb_written": kb,
+            "kb_per_min": kb / minutes,
+            "errors": sum(len(s.errors) for s in sessions),
+        }
+    return {
+        "sessions": len(users),
+        "users": len(per_user),
+        "wall_s": wall,
+        "reruns": len(samples),
+        "throughput": len(samples) / wall if wall else 0.0,
+        "rerun": percentiles([s[2] for s in samples]) if samples else {},
+        "ausfuehrung": percentiles([s[3] for s in samples]) if samples else {},
+        "actions": {k: percentiles(v) for k, v in by_action.items()},
+        "pages": {k: percentiles(v) for k, v in sorted(by_page.items())},
+        "per_user": per_user,
+        "errors": [e for u in users for e in u.errors],
+    }
+
+
+def max_rss_mb() -> float:
+    """Spitzen-RSS des Prozesses in MB (nur Unix, sonst 0)."""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def print_report(result: dict):
+    def row(name, p):
+        print(f"{name:<36} {p['n']:>6} {p['p50']:>9.1f} {p['p90']:>9.1f} {p['p99']:>9.1f} {p['max']:>9.1f}")
+
+    print(
+        f"\n{result['sessions']} Sessions ({result['users']} User), {result['reruns']} Reruns in "
+        f"{result['wall_s']:.1f} s → {result['throughput']:.1f} Reruns/s"
+    )
+    if result.get("max_rss_mb"):
+        print(f"Spitzen-Speicher des Prozesses: {result['max_rss_mb']:.0f} MB")
+    locks = result.get("locks")
+    if locks and locks["acquired"]:
+        print(
+            f"Datei-Sperren: {locks['acquired']}× · {locks['contended']}× gewartet · "
+            f"Ø {locks['wait_ms'] / locks['acquired']:.2f} ms · max {locks['max_wait_ms']:.0f} ms"
+        )
+    print(f"\n{'Rerun-Latenz (ms)':<36} {'n':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+    if result["rerun"]:
+        row("alle (Latenz)", result["rerun"])
+        row("alle (nur Ausführung)", result["ausfuehrung"])
+    for name, p in result["actions"].items():
+        row(f"  {name}", p)
+    for name, p in result["pages"].items():
+        row(f"  seite: {name}", p)
+
+    print(f"\n{'User':<12} {'Tabs':>5} {'Reruns':>7} {'Writes':>7} {'Writes/min':>11} {'KB':>9} {'KB/min':>9} {'Fehler':>7}")
+    for name, u in result["per_user"].items():
+        print(
+            f"{name:<12} {u['sessions']:>5} {u['reruns']:>7} {u['writes']:>7} {u['writes_per_min']:>11.1f} "
+            f"{u['kb_written']:>9.0f} {u['kb_per_min']:>9.0f} {u['errors']:>7}"
+        )
+
+    if result.get("spans"):
+        print(f"\n{'Span (ms, alle Sessions)':<36} {'n':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+        for p in result["spans"][:12]:
+            row(p["span"], p)
+    if result.get("counter"):
+        print("\nZähler (letzte Reruns im Profiler-Puffer):", json.dumps(result["counter"]))
+    for err in result["errors"][:10]:
+        print("FEHLER", err)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=8, help="Simulierte User")
+    parser.add_argument("--tabs", type=int, default=1, help="Gleichzeitige Sessions pro User")
+    parser.add_argument("--steps", type=int, default=30, help="Aktionen pro Session")
+    parser.add_argument("--profil", choices=list(PROFILES), default="klein", help="Datenmenge pro User")
+    parser.add_argument("--think", type=float, default=0.0, help="Max. Denkpause zwischen Aktionen (s)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Timeout pro Rerun (s)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--spans", action="store_true", help="Rerun-Profiling einschalten und Spans ausgeben")
+    parser.add_argument("--json", help="Ergebnisse zusätzlich als JSON schreiben")
+    args = parser.parse_args()
+
+    old_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            users = []
+            for i in range(args.users):
+                user = f"last{i:03d}"
+                write_user("data", user, make_store(**PROFILES[args.profil], seed=args.seed + i))
+                for tab in range(args.tabs):
+                    seed = args.seed + i * args.tabs + tab
+                    users.append(SimUser(user, f"{user}/{tab}", seed, args.think, args.timeout))
+
+            if args.spans:
+                profiling.set_enabled(True)
+                profiling.clear()
+
+            start = threading.Barrier(len(users) + 1)
+            threads = [threading.Thread(target=u.session, args=(args.steps, start), daemon=True) for u in users]
+            for t in threads:
+                t.start()
+            start.wait()
+            t0 = time.perf_counter()
+            for t in threads:
+                t.join()
+            wall = time.perf_counter() - t0
+            result = report(users, wall)
+        finally:
+            os.chdir(old_cwd)
+
+    result["max_rss_mb"] = max_rss_mb()
+    result["locks"] = locking.stats()
+    if args.spans:
+        records = profiling.history()
+        result["spans"] = profiling.summary(records) if records else []
+        counters = {}
+        for rec in records:
+            for key, n in rec["counter"].items():
+                counters[key] = counters.get(key, 0) + n
+        result["counter"] = counters
+    print_report(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False, default=float)
+    if result["errors"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
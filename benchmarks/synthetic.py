@@ -0,0 +1,189 @@
+"""Synthetische User-Stores für Benchmarks und Lasttests.
+
+``make_store()`` erzeugt einen vollständigen, schema-konformen Store mit
+frei wählbarer Größe; ``write_user()`` legt ihn als
+``<base_dir>/<user>/dashboard_data.json`` ab. Gleicher Seed = gleiche Daten.
+"""
+import json
+import os
+import random
+from datetime import date, datetime, time, timedelta
+
+from dashboard.schema import SCHEMA_VERSION, VERSION_KEY
+
+FAECHER = ["Analysis", "Lineare Algebra", "Statistik", "BWL", "Recht", "Informatik", "Physik", "Chemie", "Ethik", "Englisch"]
+
+# Größenprofile: "gross" entspricht einem sehr fleißigen User nach ein paar Jahren
+PROFILES = {
+    "klein": {"klausuren": 40, "todos": 200, "mood_years": 3, "seminare": 30, "lernplan": 8, "timetable_kb": 100},
+    "gross": {"klausuren": 500, "todos": 50_000, "mood_years": 5, "seminare": 300, "lernplan": 12, "timetable_kb": 2048},
+}
+
+
+def _timetable_html(size_kb: int, rng: random.Random) -> str:
+    row = "<tr><td>{:02d}:00</td><td>{}</td><td>Raum {}</td></tr>"
+    parts = ["<html><body><table>"]
+    size = len(parts[0])
+    while size < size_kb * 1024:
+        cell = row.format(rng.randint(8, 18), rng.choice(FAECHER), rng.randint(100, 499))
+        parts.append(cell)
+        size += len(cell)
+    parts.append("</table></body></html>")
+    return "".join(parts)
+
+
+def make_store(
+    klausuren: int = 40,
+    todos: int = 200,
+    mood_years: int = 3,
+    seminare: int = 30,
+    lernplan: int = 8,
+    timetable_kb: int = 100,
+    today: date = None,
+    seed: int = 1,
+) -> dict:
+    """Store mit den angegebenen Mengen (Mood: ein Eintrag pro Tag)."""
+    rng = random.Random(seed)
+    today = today or date.today()
+
+    def day(lo, hi):
+        return (today + timedelta(days=rng.randint(lo, hi))).isoformat()
+
+    store = {
+        "klausuren": [
+            {
+                "fach": f"{rng.choice(FAECHER)} {i}",
+                "datum": day(-4 * 365, 180),
+                "lernordner": "",
+                "tage_vorher": rng.choice([14, 21, 28]),
+                "archiviert": i % 3 == 0,
+                "note": f"{rng.randint(5, 15)}.0" if i % 3 == 0 else "",
+                "ziel_stunden": float(rng.choice([10, 20, 40])),
+                "gelernt_stunden": float(rng.randint(0, 40)),
+                "ects": 5.0 if i % 2 else 10.0,
+            }
+            for i in range(klausuren)
+        ],
+        "todos": [
+            {
+                "text": f"Aufgabe {i}",
+                "done": rng.random() < 0.7,
+                "fach": rng.choice(FAECHER),
+                "wichtig": rng.random() < 0.2,
+                "faellig": day(-60, 120),
+            }
+            for i in range(todos)
+        ],
+        "seminare": [
+            {
+                "titel": f"Seminar {i}",
+                "datum": day(-365, 180),
+                "uhrzeit1": f"{rng.randint(8, 15)}:00-{rng.randint(16, 19)}:00",
+                "datum2": day(-365, 180) if i % 4 == 0 else "",
+                "uhrzeit2": "10:00-12:00" if i % 4 == 0 else "",
+                "notiz": "",
+                "punkte": float(rng.choice([0.5, 1, 2])),
+                "absolviert": rng.random() < 0.5,
+            }
+            for i in range(seminare)
+        ],
+        "lernplan": [
+            {"fach": FAECHER[i % len(FAECHER)], "stunden_pro_woche": float(rng.choice([2, 3, 4, 6])), "priorität": rng.randint(1, 3)}
+            for i in range(lernplan)
+        ],
+        "mood": [
+            {
+                "datum": (today - timedelta(days=d)).isoformat(),
+                "stimmung": rng.randint(1, 10),
+                "stress": rng.randint(1, 10),
+                "schlaf": rng.choice([5.0, 6.0, 6.5, 7.0, 8.0]),
+                "notiz": "",
+            }
+            for d in range(mood_years * 365, 0, -1)
+        ],
+        "vorlesungen": [
+            {"datum": day(-30, 120), "zeit": f"{rng.randint(8, 16)}:00-{rng.randint(17, 19)}:00", "fach": rng.choice(FAECHER), "raum": "", "quelle": ""}
+            for _ in range(100)
+        ],
+        "stundenplan_html": _timetable_html(timetable_kb, rng),
+        VERSION_KEY: SCHEMA_VERSION,
+    }
+    return store
+
+
+def write_user(base_dir: str, user: str, store: dict) -> str:
+    """Schreibt ``store`` als Store-Datei eines Users; gibt den Pfad zurück."""
+    path = os.path.join(base_dir, user, "dashboard_data.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(store, f, ensure_ascii=False)
+    return path
+
+
+_SILBEN = ["ver", "ab", "lei", "tung", "funk", "ti", "on", "ma", "trix", "wert", "grenz", "ko", "sten", "markt",
+           "stoff", "re", "ak", "kraft", "feld", "norm", "raum", "ver", "tei", "lung", "pro", "zess", "mo", "dell"]
+_FUELL = ["ist", "wird", "hat", "zeigt", "ergibt", "beschreibt", "liefert", "folgt aus", "hängt ab von"]
+
+
+def make_script(pages: int = 300, seed: int = 0, chars_per_page: int = 3000) -> str:
+    """Vorlesungsskript-ähnlicher Text (Kapitel, Absätze, Definitionen) für den Lernzettel-Benchmark."""
+    rng = random.Random(seed)
+    words = sorted({"".join(rng.choice(_SILBEN) for _ in range(rng.randint(2, 4))) for _ in range(3000)})
+    parts, size, kapitel = [], 0, 0
+    target = pages * chars_per_page
+    while size < target:
+        if rng.random() < 0.05:
+            kapitel += 1
+            block = f"{kapitel} {rng.choice(FAECHER)} und {rng.choice(words).capitalize()}"
+        else:
+            sentences = []
+            for _ in range(rng.randint(3, 8)):
+                if rng.random() < 0.03:
+                    sentences.append(f"Unter {rng.choice(words)} versteht man {' '.join(rng.choices(words, k=8))}.")
+                else:
+                    a, b = rng.choice(words).capitalize(), " ".join(rng.choices(words, k=rng.randint(6, 16)))
+                    sentences.append(f"{a} {rng.choice(_FUELL)} {b}.")
+            block = " ".join(sentences)
+        parts.append(block)
+        size += len(block) + 2
+    return "\n\n".join(parts)
+
+
+def make_ics_feed(series: int = 40, single_events: int = 3000, seed: int = 0, start: date = date(2025, 10, 13)) -> str:
+    """Semester-Feed wie aus dem Uni-Portal: wöchentliche Serien (RRULE, EXDATE, TZID)
+    plus einzeln aufgeführte Termine mit langen, gefalteten Beschreibungen."""
+    rng = random.Random(seed)
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Uni//Portal//DE"]
+
+    def event(uid, day, hour, minutes, summary, extra=()):
+        start = datetime.combine(day, time(hour, 15))
+        end = start + timedelta(minutes=minutes)
+        lines.extend([
+            "BEGIN:VEVENT",
+            f"UID:{uid}@uni.example",
+            "DTSTAMP:20250901T080000Z",
+            f"DTSTART;TZID=Europe/Berlin:{start:%Y%m%dT%H%M%S}",
+            f"DTEND;TZID=Europe/Berlin:{end:%Y%m%dT%H%M%S}",
+            f"SUMMARY:{summary}",
+            f"LOCATION:Hörsaal {rng.randint(1, 30)}\\, Gebäude {rng.choice('ABCDE')}",
+            *extra,
+            "DESCRIPTION:" + " ".join(rng.choice(FAECHER) for _ in range(20)),
+            " Fortsetzung der Beschreibung über mehrere gefaltete Zeilen.",
+            "BEGIN:VALARM", "ACTION:DISPLAY", "TRIGGER:-PT15M", "END:VALARM",
+            "END:VEVENT",
+        ])
+
+    for i in range(series):
+        day = start + timedelta(days=rng.randint(0, 4))
+        skip = day + timedelta(weeks=rng.randint(3, 10))
+        hour = rng.randint(8, 16)
+        event(
+            f"serie-{i}", day, hour, 90, f"{rng.choice(FAECHER)} (Vorlesung {i})",
+            ["RRULE:FREQ=WEEKLY;UNTIL=20260206T230000Z", f"EXDATE;TZID=Europe/Berlin:{skip:%Y%m%d}T{hour:02d}1500"],
+        )
+    for i in range(single_events):
+        day = start + timedelta(days=rng.randint(0, 120))
+        status = ["STATUS:CANCELLED"] if rng.random() < 0.02 else []
+        event(f"termin-{i}", day, rng.randint(8, 17), rng.choice([45, 90, 105]), f"{rng.choice(FAECHER)} Übung {i % 50}", status)
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
@@ -0,0 +1 @@
+"""Logik-Bausteine des Uni-Dashboards (ohne Streamlit-UI)."""
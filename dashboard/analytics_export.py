@@ -0,0 +1,128 @@
+"""Spaltenbasierter Analytics-Export (Parquet/Arrow) aller Collections.
+
+Jede Collection wird als typisierte Tabelle geschrieben (Typen aus
+``dashboard.schema``); eine zusätzliche Spalte ``user`` erlaubt Auswertungen
+über mehrere User. Collections ohne Schema (z.B. ein Lernzeit-Log) werden
+mit abgeleiteten Typen exportiert, sofern sie im Store vorhanden sind.
+
+Kommandozeile (alle User unter ``data/`` oder einzelne per ``--user``):
+
+    python -m dashboard.analytics_export [--format parquet|arrow] [--out export] [--user NAME ...]
+"""
+import argparse
+import os
+import zipfile
+from io import BytesIO
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from dashboard import archive
+from dashboard.frames import coerce_frame
+from dashboard.schema import COLLECTION_SCHEMAS
+from dashboard.store import DASHBOARD_JSON, read_store_file
+
+ARROW_TYPES = {
+    "str": pa.string(),
+    "int": pa.int64(),
+    "float": pa.float64(),
+    "bool": pa.bool_(),
+    "date": pa.date32(),
+}
+
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+def arrow_schema(collection: str) -> pa.Schema:
+    """Arrow-Schema einer Collection inkl. ``user``-Spalte."""
+    fields = [pa.field("user", pa.string())]
+    fields += [pa.field(col, ARROW_TYPES[typ]) for col, (typ, _) in COLLECTION_SCHEMAS[collection].items()]
+    return pa.schema(fields)
+
+
+def collection_table(collection: str, records: list, user: str) -> pa.Table:
+    """Eine Collection eines Users als typisierte Arrow-Tabelle."""
+    if collection not in COLLECTION_SCHEMAS:
+        table = pa.Table.from_pylist(records) if records else pa.table({})
+        return table.add_column(0, "user", pa.array([user] * table.num_rows, pa.string()))
+
+    df = coerce_frame(collection, pd.DataFrame(records))
+    for col, (typ, _) in COLLECTION_SCHEMAS[collection].items():
+        if typ == "date":
+            df[col] = pd.to_datetime(df[col], errors="coerce").dt.date
+    df.insert(0, "user", user)
+    return pa.Table.from_pandas(df, schema=arrow_schema(collection), preserve_index=False)
+
+
+def export_tables(stores: dict) -> dict:
+    """``{user: store}`` -> ``{collection: pa.Table}`` (alle User zusammengeführt)."""
+    tables = {}
+    for user, store in stores.items():
+        for key, value in store.items():
+            if not isinstance(value, list):
+                continue
+            if key not in COLLECTION_SCHEMAS and not value:
+                continue
+            tables.setdefault(key, []).append(collection_table(key, value, user))
+    return {k: pa.concat_tables(v, promote_options="default") for k, v in tables.items()}
+
+
+def _write_table(table: pa.Table, sink, fmt: str):
+    if fmt == "parquet":
+        pq.write_table(table, sink, compression="zstd")
+    else:
+        feather.write_feather(table, sink, compression="zstd")
+
+
+def write_tables(tables: dict, out_dir: str, fmt: str = "parquet") -> list:
+    """Schreibt jede Tabelle als ``<out_dir>/<collection>.<fmt>``; gibt die Pfade zurück."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for name, table in tables.items():
+        path = os.path.join(out_dir, name + FORMATS[fmt])
+        _write_table(table, path, fmt)
+        paths.append(path)
+    return paths
+
+
+def tables_zip(tables: dict, fmt: str = "parquet") -> bytes:
+    """Alle Tabellen als ZIP (für den Download im Browser)."""
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as zf:
+        for name, table in tables.items():
+            member = BytesIO()
+            _write_table(table, member, fmt)
+            zf.writestr(name + FORMATS[fmt], member.getvalue())
+    return buf.getvalue()
+
+
+def load_user_stores(base_dir: str = "data", users: list = None) -> dict:
+    """Liest ``data/*/dashboard_data.json`` (oder nur die angegebenen User) samt Archiv."""
+    if users is None:
+        users = sorted(
+            e.name for e in os.scandir(base_dir)
+            if e.is_dir() and os.path.isfile(os.path.join(e.path, DASHBOARD_JSON))
+        )
+    return {
+        u: archive.full_store(os.path.join(base_dir, u), read_store_file(os.path.join(base_dir, u, DASHBOARD_JSON)))
+        for u in users
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collections als Parquet/Arrow exportieren.")
+    parser.add_argument("--base-dir", default="data")
+    parser.add_argument("--out", default="export")
+    parser.add_argument("--format", choices=list(FORMATS), default="parquet")
+    parser.add_argument("--user", action="append", help="Nur diese User (mehrfach möglich)")
+    args = parser.parse_args()
+
+    tables = export_tables(load_user_stores(args.base_dir, args.user))
+    for path in write_tables(tables, args.out, args.format):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""Zeitlich partitioniertes Archiv für alte Mood-Einträge und Klausuren (ohne Streamlit).
+
+Der Store (``dashboard_data.json``) wird bei jedem Laden komplett geparst –
+Mood-Einträge und archivierte Klausuren wachsen aber mit jedem Semester,
+obwohl die Seiten fast nur die letzten Wochen und aktive Klausuren zeigen.
+Kalte Datensätze wandern deshalb in komprimierte Jahres-Shards:
+
+    <user_dir>/archiv/mood-2021.json.gz
+    <user_dir>/archiv/klausuren-2022.json.gz
+
+- Kalt ist, was vor ``cutoff()`` liegt (``HOT_DAYS``, auf den Monatsanfang
+  abgerundet); Klausuren nur, wenn sie zusätzlich archiviert sind.
+- ``archive_store()`` läuft höchstens einmal pro Monat (Marker
+  ``ARCHIVE_KEY`` im Store) unter der User-Sperre, siehe ``store.load_user_store``.
+- Gelesen wird nur bei Bedarf: ``cold_rows()`` lädt nur die Jahre im
+  angefragten Zeitraum, ``query()`` und ``full_store()`` kombinieren heiß und
+  kalt transparent (Archiv-Ansicht, langer Mood-Verlauf, Exporte).
+  Gelesene Shards werden prozessweit nach Datei-Signatur gecacht.
+"""
+import gzip
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+
+from dashboard import locking, profiling
+from dashboard.schema import ARCHIVE_KEY
+
+ARCHIVE_DIR = "archiv"
+SHARD_CACHE_SIZE = 64
+
+# Collection -> Tage, die mindestens im Store bleiben
+HOT_DAYS = {"mood": 400, "klausuren": 365}
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+# -------------------------------------------------
+# Regeln
+# -------------------------------------------------
+def cutoff(collection: str, today: date) -> str:
+    """ISO-Datum, vor dem Datensätze kalt sind (Monatsanfang, damit die Grenze stabil bleibt)."""
+    return (today - timedelta(days=HOT_DAYS[collection])).replace(day=1).isoformat()
+
+
+def hot_covers(collection: str, days) -> bool:
+    """Liegen die letzten ``days`` Tage sicher im Store? (``None`` = gesamter Verlauf)"""
+    return days is not None and days <= HOT_DAYS[collection] - 31
+
+
+def archive_stamp(today: date) -> str:
+    return today.strftime("%Y-%m")
+
+
+def is_cold(collection: str, rec: dict, limit: str) -> bool:
+    datum = rec.get("datum") or ""
+    if not datum or datum >= limit:
+        return False
+    return collection != "klausuren" or bool(rec.get("archiviert"))
+
+
+def split_cold(collection: str, rows: list, limit: str) -> tuple:
+    """``(heiß, kalt)`` – Reihenfolge bleibt erhalten."""
+    hot, cold = [], []
+    for rec in rows:
+        (cold if is_cold(collection, rec, limit) else hot).append(rec)
+    return hot, cold
+
+
+def _identity(rec: dict) -> str:
+    return json.dumps(rec, sort_keys=True, ensure_ascii=False, default=str)
+
+
+# -------------------------------------------------
+# Shards
+# -------------------------------------------------
+def shard_path(user_dir: str, collection: str, year: int) -> str:
+    return os.path.join(user_dir, ARCHIVE_DIR, f"{collection}-{year}.json.gz")
+
+
+def _shards(user_dir: str, collection: str) -> dict:
+    """``{jahr: DirEntry}`` der vorhandenen Shards einer Collection."""
+    prefix, suffix = f"{collection}-", ".json.gz"
+    found = {}
+    try:
+        with os.scandir(os.path.join(user_dir, ARCHIVE_DIR)) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith(suffix) and name[len(prefix):-len(suffix)].isdigit():
+                    found[int(name[len(prefix):-len(suffix)])] = entry
+    except OSError:
+        pass
+    return found
+
+
+def shard_years(user_dir: str, collection: str) -> list:
+    return sorted(_shards(user_dir, collection))
+
+
+def revision(user_dir: str, collection: str) -> tuple:
+    """Ändert sich bei jedem Schreiben eines Shards der Collection (für Caches)."""
+    rev = []
+    for year, entry in sorted(_shards(user_dir, collection).items()):
+        try:
+            info = entry.stat()
+        except OSError:
+            continue
+        rev.append((year, info.st_mtime_ns, info.st_size))
+    return tuple(rev)
+
+
+def revisions(user_dir: str) -> tuple:
+    """``revision()`` aller archivierten Collections (für Caches über ``full_store``)."""
+    return tuple(revision(user_dir, collection) for collection in HOT_DAYS)
+
+
+def read_shard(user_dir: str, collection: str, year: int) -> list:
+    """Datensätze eines Jahres (geteilt gecacht – nicht verändern)."""
+    path = shard_path(user_dir, collection, year)
+    try:
+        info = os.stat(path)
+    except OSError:
+        return []
+    key = (os.path.abspath(path), info.st_mtime_ns, info.st_size)
+    with _cache_lock:
+        rows = _cache.get(key)
+        if rows is not None:
+            _cache.move_to_end(key)
+            return rows
+    with profiling.span("archive_read"):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            rows = json.load(f)
+    with _cache_lock:
+        _cache[key] = rows
+        while len(_cache) > SHARD_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return rows
+
+
+class StagedShards:
+    """Geschriebene, aber noch nicht sichtbare Shards (``.tmp`` neben dem Ziel).
+
+    ``commit()`` tauscht sie ein bzw. löscht geleerte Shards, ``discard()``
+    verwirft sie. So kann ein Restore erst den Store speichern und das Archiv
+    danach umschalten – schlägt das Speichern fehl, bleibt das Archiv, wie es war.
+    """
+
+    def __init__(self):
+        self._ops = []  # (ziel, tmp | None = löschen)
+
+    def commit(self):
+        for path, tmp in self._ops:
+            if tmp is None:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            else:
+                os.replace(tmp, path)
+                profiling.count("archive_writes")
+        self._ops = []
+
+    def discard(self):
+        for _, tmp in self._ops:
+            if tmp is not None:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+        self._ops = []
+
+
+def _stage_shard(user_dir: str, collection: str, year: int, rows: list, staged: StagedShards):
+    path = shard_path(user_dir, collection, year)
+    if not rows:
+        staged._ops.append((path, None))
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    rows = sorted(rows, key=lambda r: r.get("datum") or "")
+    tmp = path + ".tmp"
+    with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=6) as f:
+        json.dump(rows, f, ensure_ascii=False)
+    staged._ops.append((path, tmp))
+
+
+def _write_shard(user_dir: str, collection: str, year: int, rows: list):
+    staged = StagedShards()
+    _stage_shard(user_dir, collection, year, rows, staged)
+    staged.commit()
+
+
+def _by_year(rows: list) -> dict:
+    years = {}
+    for rec in rows:
+        years.setdefault(int(rec["datum"][:4]), []).append(rec)
+    return years
+
+
+def add_to_shards(user_dir: str, collection: str, rows: list):
+    """Hängt Datensätze an die Jahres-Shards an (bereits vorhandene werden nicht doppelt abgelegt).
+
+    Erwartet die gehaltene User-Sperre.
+    """
+    for year, new in _by_year(rows).items():
+        existing = read_shard(user_dir, collection, year)
+        seen = {_identity(r) for r in existing}
+        fresh = [r for r in new if _identity(r) not in seen]
+        if fresh:
+            _write_shard(user_dir, collection, year, existing + fresh)
+
+
+def stage_replace(user_dir: str, collection: str, rows: list, staged: StagedShards):
+    """Bereitet das Ersetzen aller Shards der Collection durch ``rows`` vor (nur geänderte Jahre)."""
+    years = _by_year(rows)
+    for year in set(shard_years(user_dir, collection)) | set(years):
+        new = years.get(year, [])
+        if new != read_shard(user_dir, collection, year):
+            _stage_shard(user_dir, collection, year, new, staged)
+
+
+def replace_shards(user_dir: str, collection: str, rows: list):
+    """Ersetzt alle Shards der Collection durch ``rows``. Erwartet die gehaltene User-Sperre."""
+    staged = StagedShards()
+    try:
+        stage_replace(user_dir, collection, rows, staged)
+    except BaseException:
+        staged.discard()
+        raise
+    staged.commit()
+
+
+def replace_cold(user_dir: str, collection: str, rows: list):
+    """Ersetzt die kalten Datensätze nach Änderungen in der Archiv-Ansicht (nimmt die Sperre selbst)."""
+    with locking.user_lock(user_dir) as lock:
+        replace_shards(user_dir, collection, rows)
+        lock.bump()
+
+
+# -------------------------------------------------
+# Archivieren
+# -------------------------------------------------
+def archive_due(store: dict, today: date) -> bool:
+    return store.get(ARCHIVE_KEY) != archive_stamp(today)
+
+
+def archive_store(
+    user_dir: str, store: dict, today: date = None, replace: bool = False, staged: StagedShards = None
+) -> tuple:
+    """Verschiebt kalte Datensätze in die Shards. Gibt ``(store, geändert?)`` zurück.
+
+    ``replace=True`` (Restore eines vollständigen Stands): die Shards werden
+    durch die kalten Datensätze des Stores ersetzt statt ergänzt. Mit
+    ``staged`` werden die ersetzten Shards nur vorbereitet; sichtbar werden
+    sie erst mit ``staged.commit()`` nach dem Speichern des Stores. Erwartet
+    die gehaltene User-Sperre; ``store`` selbst wird nicht verändert.
+    """
+    today = today or date.today()
+    if not replace and not archive_due(store, today):
+        return store, False
+
+    out = dict(store)
+    with profiling.span("archive_store"):
+        for collection in HOT_DAYS:
+            rows = store.get(collection) or []
+            hot, cold = split_cold(collection, rows, cutoff(collection, today))
+            if replace and staged is not None:
+                stage_replace(user_dir, collection, cold, staged)
+            elif replace:
+                replace_shards(user_dir, collection, cold)
+            elif cold:
+                add_to_shards(user_dir, collection, cold)
+            if cold:
+                out[collection] = hot
+    out[ARCHIVE_KEY] = archive_stamp(today)
+    return out, True
+
+
+# -------------------------------------------------
+# Abfragen über heiß + kalt
+# -------------------------------------------------
+def cold_rows(user_dir: str, collection: str, start: str = None, end: str = None) -> list:
+    """Kalte Datensätze, optional auf ``start <= datum < end`` (ISO) eingeschränkt.
+
+    Es werden nur die Shards der betroffenen Jahre gelesen.
+    """
+    first = int(start[:4]) if start else None
+    last = int(end[:4]) if end else None
+    rows = []
+    for year in shard_years(user_dir, collection):
+        if (first is not None and year < first) or (last is not None and year > last):
+            continue
+        for rec in read_shard(user_dir, collection, year):
+            datum = rec.get("datum") or ""
+            if (start and datum < start) or (end and datum >= end):
+                continue
+            rows.append(rec)
+    return rows
+
+
+def query(user_dir: str, store: dict, collection: str, start: str = None, end: str = None) -> list:
+    """Heiße und kalte Datensätze einer Collection, kalte zuerst (chronologisch vor den heißen)."""
+    hot = store.get(collection) or []
+    if start or end:
+        hot = [r for r in hot if not ((start and (r.get("datum") or "") < start) or (end and (r.get("datum") or "") >= end))]
+    cold = cold_rows(user_dir, collection, start, end) if collection in HOT_DAYS else []
+    if cold and hot:
+        # Nach einem abgebrochenen Archivieren kann ein Datensatz kurz in beiden liegen
+        seen = {_identity(r) for r in hot}
+        cold = [r for r in cold if _identity(r) not in seen]
+    return cold + list(hot)
+
+
+def full_store(user_dir: str, store: dict) -> dict:
+    """Vollständiger Store inkl. Archiv (Backup, Analytics-Export); ohne Archiv-Marker."""
+    out = {k: v for k, v in store.items() if k != ARCHIVE_KEY}
+    for collection in HOT_DAYS:
+        out[collection] = query(user_dir, store, collection)
+    return out
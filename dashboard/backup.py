@@ -0,0 +1,43 @@
+"""Backup-Archiv (ZIP) des Stores.
+
+Jede Collection landet als eigenes Member im Archiv, der HTML-Stundenplan als
+``stundenplan.html``. ``manifest.json`` hält Format-Version, User und die
+Zuordnung Store-Key -> Member fest. Eingelesen wird über ``dashboard.restore``.
+"""
+import json
+import zipfile
+from datetime import datetime
+from io import BytesIO
+
+from dashboard.schema import ARCHIVE_KEY, SCHEMA_VERSION, VERSION_KEY
+
+BACKUP_FORMAT = 1
+
+# Store-Keys mit eigenem Dateinamen; alle übrigen Keys werden als <key>.json abgelegt
+MEMBER_NAMES = {"stundenplan_html": "stundenplan.html"}
+
+
+def build_backup_zip(store: dict, user: str) -> bytes:
+    """Serialisiert den Store als komprimiertes ZIP-Archiv."""
+    # Die Schema-Version steht im Manifest, nicht als eigenes Member
+    members = {key: MEMBER_NAMES.get(key, f"{key}.json") for key in store if key not in (VERSION_KEY, ARCHIVE_KEY)}
+    manifest = {
+        "format": BACKUP_FORMAT,
+        "schema_version": SCHEMA_VERSION,
+        "user": user,
+        "erstellt": datetime.now().isoformat(timespec="seconds"),
+        "members": members,
+        "anzahl": {k: len(v) for k, v in store.items() if isinstance(v, list)},
+    }
+
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+        zf.writestr("manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2))
+        for key, name in members.items():
+            value = store[key]
+            if name.endswith(".json"):
+                zf.writestr(name, json.dumps(value, ensure_ascii=False))
+            else:
+                zf.writestr(name, value or "")
+    return buf.getvalue()
+
@@ -0,0 +1,145 @@
+"""Word-Export der Lernzettel (ohne Streamlit).
+
+Früher entstand das Dokument per ``add_paragraph()`` für jede einzelne Zeile
+des zusammengeführten Textes – bei einem langen Skript zehntausende Aufrufe,
+und bei jedem Rerun wieder von vorn. Jetzt:
+
+- Pro Quelldatei (Trennzeile ``##### Datei: X #####``) wird der Body-XML
+  als ein Stück erzeugt und mit einem einzigen ``parse_xml()`` eingehängt.
+  Die Datei wird zur Überschrift, Markdown-Überschriften (``#``) und
+  Aufzählungen (``- ``) aus der lokalen Zusammenfassung bekommen die
+  passenden Word-Formatvorlagen, ``**fett**`` wird fett.
+- Das Ergebnis liegt pro Inhalts-Hash als Datei im Cache-Ordner des Users
+  (``CACHE_FILES`` neueste bleiben); derselbe Text wird nie zweimal gebaut.
+"""
+import os
+import re
+import threading
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+from dashboard import profiling
+from dashboard.summarize import SOURCE_RE, content_hash
+
+# Bei Änderungen am Layout erhöhen – alte Cache-Dateien passen dann nicht mehr
+FORMAT_VERSION = 1
+CACHE_FILES = 16
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# In XML nicht erlaubte Zeichen (kommen z.B. aus der PDF-Extraktion)
+_INVALID_XML_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_MD_HEADING_RE = re.compile(r"^(#{1,3})\s+(.+)$")
+_TAB = '</w:t><w:tab/><w:t xml:space="preserve">'
+
+_build_lock = threading.Lock()
+
+
+# -------------------------------------------------
+# Body-XML
+# -------------------------------------------------
+def _runs(text: str) -> str:
+    parts = text.split("**")
+    if len(parts) % 2 == 0:
+        # Unpaarige ** bleiben normaler Text
+        parts = [text]
+    runs = []
+    for i, part in enumerate(parts):
+        if part:
+            rpr = "<w:rPr><w:b/></w:rPr>" if i % 2 else ""
+            runs.append(f'<w:r>{rpr}<w:t xml:space="preserve">{escape(part).replace(chr(9), _TAB)}</w:t></w:r>')
+    return "".join(runs)
+
+
+def _paragraph(text: str, style: str = None) -> str:
+    ppr = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f"<w:p>{ppr}{_runs(text)}</w:p>"
+
+
+def _section_xml(name: str, body: str) -> str:
+    """Eine Quelle als Folge von ``<w:p>``; ``name`` wird Überschrift 1 (``None`` = ohne)."""
+    shift = 1 if name is not None else 0
+    parts = [_paragraph(name, "Heading1")] if name is not None else []
+    for line in body.strip("\n").split("\n"):
+        line = line.rstrip()
+        heading = _MD_HEADING_RE.match(line)
+        if heading:
+            parts.append(_paragraph(heading.group(2), f"Heading{len(heading.group(1)) + shift}"))
+        elif line.lstrip().startswith(("- ", "• ")):
+            parts.append(_paragraph(line.lstrip()[2:], "ListBullet"))
+        else:
+            parts.append(_paragraph(line))
+    return "".join(parts)
+
+
+def _sections(text: str) -> list:
+    """``[(überschrift oder None, text)]`` – Text vor der ersten Trennzeile ohne Überschrift."""
+    parts = SOURCE_RE.split(text)
+    sections = [(None, parts[0])] if parts[0].strip() else []
+    for i in range(1, len(parts) - 1, 2):
+        sections.append((parts[i].strip(), parts[i + 1]))
+    return sections
+
+
+def build_docx(text: str) -> bytes:
+    """Lernzettel-Text als DOCX (ein ``parse_xml()`` pro Quelldatei)."""
+    text = _INVALID_XML_RE.sub("", text)
+    doc = Document()
+    doc.core_properties.title = "Lernzettel"
+    sect_pr = doc.element.body.sectPr
+    for name, body in _sections(text):
+        fragment = parse_xml(f"<w:body {nsdecls('w')}>{_section_xml(name, body)}</w:body>")
+        for p in list(fragment):
+            sect_pr.addprevious(p)
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+# -------------------------------------------------
+# Cache auf der Platte
+# -------------------------------------------------
+def cache_path(text: str, cache_dir: str) -> str:
+    key = content_hash(f"{FORMAT_VERSION}\n{text}")[:32]
+    return os.path.join(cache_dir, f"lernzettel-{key}.docx")
+
+
+def _prune(cache_dir: str, keep: int):
+    try:
+        entries = [e for e in os.scandir(cache_dir) if e.name.startswith("lernzettel-") and e.name.endswith(".docx")]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    except OSError:
+        return
+    for entry in entries[keep:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def cached_docx(text: str, cache_dir: str) -> str:
+    """Pfad der DOCX-Datei zu ``text``; gebaut wird nur beim ersten Mal pro Inhalt."""
+    path = cache_path(text, cache_dir)
+    with _build_lock:
+        if os.path.exists(path):
+            profiling.count("docx_cache_hits")
+            os.utime(path)
+            return path
+        with profiling.span("docx_export"):
+            data = build_docx(text)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        _prune(cache_dir, CACHE_FILES)
+    return path
+
+
+def lernzettel_docx(text: str, cache_dir: str) -> bytes:
+    """DOCX-Inhalt für den Download-Button (aus dem Cache, sonst frisch gebaut)."""
+    with open(cached_docx(text, cache_dir), "rb") as f:
+        return f.read()
@@ -0,0 +1,279 @@
+"""Inkrementeller Index der Lernordner (ohne Streamlit).
+
+Jede Klausur hat einen ``lernordner``. Die Klausuren-Seite zeigt dazu
+Dateianzahl, Gesamtgröße und die neuesten Dateien – ohne beim Rendern auf
+die Platte zu warten:
+
+- ``FolderIndexer.get()`` gibt sofort den letzten bekannten Stand zurück
+  (``None`` beim ersten Mal) und stellt den Ordner bei Bedarf in die
+  Warteschlange eines Hintergrund-Threads.
+- Der Thread läuft mit ``os.scandir`` durch den Baum und merkt sich pro
+  Unterordner dessen mtime und Dateiliste. Beim nächsten Scan wird ein
+  Ordner nur neu gelistet, wenn sich seine mtime geändert hat (Datei
+  angelegt, gelöscht, umbenannt); sonst kostet er einen ``stat``-Aufruf.
+- In-place geänderte Dateien ändern die Ordner-mtime nicht – daher wird
+  jeder Ordner spätestens nach ``FULL_RESCAN`` Sekunden trotzdem neu gelistet.
+
+Versteckte Einträge (``.git`` usw.) und Symlinks werden übersprungen; sehr
+große Bäume werden nach ``MAX_DIRS`` Ordnern abgeschnitten.
+
+Gelistet wird nur unterhalb der Basisordner aus ``DASHBOARD_LERNORDNER_ROOT``
+(mehrere mit ``os.pathsep`` getrennt) – sonst könnte auf einem geteilten
+Server jeder User beliebige Verzeichnisse des Servers einsehen. Ist die
+Variable nicht gesetzt, gilt das Home-Verzeichnis, solange Streamlit ohne
+``server.address`` oder auf localhost läuft (``streamlit run app.py``,
+Devcontainer, ``run_dashboard.py``); bei jeder anderen Adresse wird ohne
+Freigabe nichts gelistet.
+"""
+import heapq
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+
+REFRESH_INTERVAL = 30.0
+FULL_RESCAN = 600.0
+MAX_FOLDERS = 512
+MAX_DIRS = 20_000
+RECENT_FILES = 10
+ROOTS_ENV = "DASHBOARD_LERNORDNER_ROOT"
+NOT_ALLOWED = f"Ordner liegt außerhalb der freigegebenen Lernordner ({ROOTS_ENV})"
+
+
+LOCAL_ADDRESSES = ("", "localhost", "127.0.0.1", "::1")
+
+
+def _server_address() -> str:
+    """``server.address`` aus der Streamlit-Konfiguration (leer, wenn nicht gesetzt)."""
+    try:
+        from streamlit import config
+        return config.get_option("server.address") or ""
+    except Exception:
+        return ""
+
+
+def allowed_roots() -> list:
+    """Freigegebene Basisordner (aufgelöst, ohne Symlinks); Default siehe Modul-Docstring."""
+    raw = os.environ.get(ROOTS_ENV)
+    if raw is None:
+        raw = os.path.expanduser("~") if _server_address() in LOCAL_ADDRESSES else ""
+    return [os.path.realpath(os.path.expanduser(p.strip())) for p in raw.split(os.pathsep) if p.strip()]
+
+
+def is_within(path: str, roots: list) -> bool:
+    """Liegt der (aufgelöste) ``path`` in einem der ``roots``?"""
+    for root in roots:
+        try:
+            if os.path.commonpath([path, root]) == root:
+                return True
+        except ValueError:  # anderes Laufwerk (Windows)
+            continue
+    return False
+
+
+class _Dir:
+    """Gelisteter Ordner: mtime beim Listen, Dateien ``(name, size, mtime)`` und Unterordner."""
+
+    __slots__ = ("mtime_ns", "listed_at", "files", "subdirs")
+
+    def __init__(self, mtime_ns: int, listed_at: float, files: list, subdirs: list):
+        self.mtime_ns = mtime_ns
+        self.listed_at = listed_at
+        self.files = files
+        self.subdirs = subdirs
+
+
+def _list_dir(path: str, mtime_ns: int, now: float) -> _Dir:
+    files, subdirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file(follow_symlinks=False):
+                        info = entry.stat(follow_symlinks=False)
+                        files.append((entry.name, info.st_size, info.st_mtime))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return _Dir(mtime_ns, now, files, subdirs)
+
+
+def scan_tree(root: str, nodes: dict, counter: dict = None, now: float = None):
+    """Scannt ``root`` und nutzt unveränderte Einträge aus ``nodes`` (relativer Pfad -> ``_Dir``).
+
+    Gibt ``(neue_nodes, zusammenfassung)`` zurück; ``counter`` zählt
+    ``listed``/``reused`` Ordner.
+    """
+    now = time.time() if now is None else now
+    counter = counter if counter is not None else {}
+    try:
+        if not os.path.isdir(root):
+            return {}, {"fehler": "Ordner nicht gefunden"}
+    except OSError as e:
+        return {}, {"fehler": str(e)}
+
+    seen = {}
+    total_files = total_bytes = 0
+    recent = []  # Min-Heap der neuesten Dateien: (mtime, relpfad, size)
+    truncated = False
+    stack = [""]
+    while stack:
+        rel = stack.pop()
+        path = os.path.join(root, rel) if rel else root
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        node = nodes.get(rel)
+        if node is None or node.mtime_ns != mtime_ns or now - node.listed_at > FULL_RESCAN:
+            node = _list_dir(path, mtime_ns, now)
+            counter["listed"] = counter.get("listed", 0) + 1
+        else:
+            counter["reused"] = counter.get("reused", 0) + 1
+        seen[rel] = node
+
+        total_files += len(node.files)
+        for name, size, mtime in node.files:
+            total_bytes += size
+            item = (mtime, os.path.join(rel, name) if rel else name, size)
+            if len(recent) < RECENT_FILES:
+                heapq.heappush(recent, item)
+            elif item > recent[0]:
+                heapq.heapreplace(recent, item)
+        if len(seen) >= MAX_DIRS:
+            truncated = bool(stack or node.subdirs)
+            break
+        stack.extend(os.path.join(rel, d) if rel else d for d in node.subdirs)
+
+    recent.sort(reverse=True)
+    return seen, {
+        "dateien": total_files,
+        "bytes": total_bytes,
+        "ordner": len(seen),
+        "zuletzt": [(p, size, mtime) for mtime, p, size in recent],
+        "gescannt": now,
+        "unvollstaendig": truncated,
+        "fehler": None,
+    }
+
+
+class _Folder:
+    __slots__ = ("nodes", "summary", "refreshed_at", "pending")
+
+    def __init__(self):
+        self.nodes = {}
+        self.summary = None
+        self.refreshed_at = None
+        self.pending = False
+
+
+class FolderIndexer:
+    """Prozessweiter Index aller angefragten Lernordner mit einem Hintergrund-Thread."""
+
+    def __init__(
+        self, refresh_interval: float = REFRESH_INTERVAL, max_folders: int = MAX_FOLDERS, clock=time.monotonic, roots=None
+    ):
+        self.refresh_interval = refresh_interval
+        self.roots = allowed_roots() if roots is None else [os.path.realpath(r) for r in roots]
+        self.max_folders = max(1, max_folders)
+        self._clock = clock
+        self._folders = OrderedDict()
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = None
+        self.counter = {"scans": 0, "listed": 0, "reused": 0}
+
+    @staticmethod
+    def _key(path: str) -> str:
+        # realpath: ``..`` und Symlinks dürfen nicht aus den Basisordnern herausführen
+        return os.path.realpath(os.path.expanduser(path.strip()))
+
+    def _ensure_thread(self):
+        """Erwartet gehaltenes ``self._lock``."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="lernordner-index", daemon=True)
+            self._thread.start()
+
+    def get(self, path: str):
+        """Letzter bekannter Stand (``None``, solange noch nie gescannt); plant ggf. einen Scan ein."""
+        key = self._key(path)
+        if not is_within(key, self.roots):
+            return {"fehler": NOT_ALLOWED}
+        now = self._clock()
+        with self._lock:
+            folder = self._folders.get(key)
+            if folder is None:
+                folder = self._folders[key] = _Folder()
+                while len(self._folders) > self.max_folders:
+                    self._folders.popitem(last=False)
+            self._folders.move_to_end(key)
+            stale = folder.refreshed_at is None or now - folder.refreshed_at > self.refresh_interval
+            if stale and not folder.pending:
+                folder.pending = True
+                self._queue.put(key)
+                self._ensure_thread()
+            return folder.summary
+
+    def scan(self, path: str) -> dict:
+        """Scannt sofort im aufrufenden Thread (Benchmarks, Hintergrund-Thread)."""
+        key = self._key(path)
+        if not is_within(key, self.roots):
+            return {"fehler": NOT_ALLOWED}
+        with self._lock:
+            folder = self._folders.get(key)
+            nodes = folder.nodes if folder is not None else {}
+        counter = {}
+        nodes, summary = scan_tree(key, nodes, counter)
+        with self._lock:
+            folder = self._folders.get(key)
+            if folder is None:
+                folder = self._folders[key] = _Folder()
+            folder.nodes = nodes
+            folder.summary = summary
+            folder.refreshed_at = self._clock()
+            self.counter["scans"] += 1
+            self.counter["listed"] += counter.get("listed", 0)
+            self.counter["reused"] += counter.get("reused", 0)
+        return summary
+
+    def _run(self):
+        while True:
+            key = self._queue.get()
+            try:
+                self.scan(key)
+            except Exception as e:
+                with self._lock:
+                    folder = self._folders.get(key)
+                    if folder is not None:
+                        folder.summary = {"fehler": str(e)}
+                        folder.refreshed_at = self._clock()
+            finally:
+                with self._lock:
+                    folder = self._folders.get(key)
+                    if folder is not None:
+                        folder.pending = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "ordner": len(self._folders),
+                "warteschlange": self._queue.qsize(),
+                **self.counter,
+            }
+
+
+_indexer = FolderIndexer()
+
+
+def folder_summary(path: str):
+    return _indexer.get(path)
+
+
+def stats() -> dict:
+    return _indexer.stats()
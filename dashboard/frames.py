@@ -0,0 +1,38 @@
+"""Schema-konforme DataFrames aus beliebigen Rohdaten (spaltenweise, ohne Zeilenschleifen)."""
+import pandas as pd
+
+from dashboard.schema import COLLECTION_SCHEMAS, REQUIRED_FIELDS
+
+_MISSING = ["", "nan", "none", "nat"]
+_BOOL_MAP = {"true": True, "1": True, "ja": True, "yes": True, "false": False, "0": False, "nein": False, "no": False}
+
+
+def coerce_frame(collection: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Bringt einen beliebigen DataFrame spaltenweise auf das Collection-Schema."""
+    schema = COLLECTION_SCHEMAS[collection]
+    out = pd.DataFrame(index=df.index)
+
+    for col, (typ, default) in schema.items():
+        if col not in df.columns:
+            out[col] = default
+            continue
+
+        s = df[col].astype(str).str.strip()
+        missing = s.str.lower().isin(_MISSING)
+        if typ == "str":
+            out[col] = s.where(~missing, default)
+        elif typ in ("int", "float"):
+            num = pd.to_numeric(s.where(~missing), errors="coerce").fillna(default)
+            out[col] = num.astype(int) if typ == "int" else num.astype(float)
+        elif typ == "bool":
+            out[col] = s.str.lower().map(_BOOL_MAP).fillna(default).astype(bool)
+        elif typ == "date":
+            d = pd.to_datetime(s.where(~missing), errors="coerce", format="ISO8601")
+            retry = d.isna() & ~missing
+            if retry.any():
+                d[retry] = pd.to_datetime(s[retry], errors="coerce", dayfirst=True, format="mixed")
+            out[col] = d.dt.strftime("%Y-%m-%d").fillna(default)
+
+    for col in REQUIRED_FIELDS.get(collection, []):
+        out = out[out[col] != schema[col][1]]
+    return out.reset_index(drop=True)
@@ -0,0 +1,202 @@
+"""Notenstatistik über alle Klausuren: ECTS-gewichteter Schnitt, Bestehensquote,
+Notenverteilung und Verlauf pro Semester.
+
+Noten liegen im Store als String (Punkte 0–15, leer = noch keine Note).
+``GradeStats`` hält nur Summen und Zähler; jede Klausur trägt einmal bei
+und wird beim Ändern wieder abgezogen. ``updated()`` überspringt dafür den
+gemeinsamen Anfang und das gemeinsame Ende von altem und neuem Stand (reiner
+Listenvergleich) und verrechnet nur die Zeilen dazwischen – ist eine Klausur
+archiviert oder benotet worden, sind das zwei Schritte statt eines
+Neuaufbaus über alle Klausuren.
+Die Statistik selbst wird nie verändert (geteilt über Sessions, siehe
+``shared_store.Snapshot.derived_update``).
+"""
+from collections import Counter
+
+# Wie auf der Klausuren-Seite: bestanden ab mehr als 4 Punkten
+PASS_ABOVE = 4.0
+
+# Felder, von denen der Beitrag einer Klausur abhängt
+_FIELDS = ("archiviert", "note", "ects", "datum")
+
+# Rundungsreste nach vielen Zu- und Abgängen gelten als 0 ECTS
+_EPS = 1e-9
+
+
+def parse_note(value):
+    """Punkte als float oder ``None`` (keine/ungültige Note)."""
+    if value is None or value == "":
+        return None
+    try:
+        note = float(value)
+    except (TypeError, ValueError):
+        return None
+    return note if 0.0 <= note <= 15.0 else None
+
+
+def passed(note: float) -> bool:
+    return note > PASS_ABOVE
+
+
+def semester_of(datum: str):
+    """``(jahr, 0|1)`` für Sortierung – SoSe April bis September, sonst WiSe."""
+    if not datum or len(datum) < 7:
+        return None
+    try:
+        year, month = int(datum[:4]), int(datum[5:7])
+    except ValueError:
+        return None
+    if 4 <= month <= 9:
+        return (year, 0)
+    return (year, 1) if month >= 10 else (year - 1, 1)
+
+
+def semester_label(key) -> str:
+    year, half = key
+    return f"SoSe {year}" if half == 0 else f"WiSe {year}/{(year + 1) % 100:02d}"
+
+
+def _key(rec: dict) -> tuple:
+    return tuple(rec.get(f) for f in _FIELDS)
+
+
+def _changed(old_rows, new_rows) -> tuple:
+    """``(alt, neu)``: die Zeilen zwischen gemeinsamem Anfang und Ende beider Listen."""
+    n_old, n_new = len(old_rows), len(new_rows)
+    limit = min(n_old, n_new)
+    head = 0
+    while head < limit and (old_rows[head] is new_rows[head] or old_rows[head] == new_rows[head]):
+        head += 1
+    tail = 0
+    while tail < limit - head:
+        a, b = old_rows[n_old - 1 - tail], new_rows[n_new - 1 - tail]
+        if a is not b and a != b:
+            break
+        tail += 1
+    return old_rows[head:n_old - tail], new_rows[head:n_new - tail]
+
+
+class GradeStats:
+    """Laufende Summen der benoteten, archivierten Klausuren."""
+
+    __slots__ = ("graded", "passed", "note_sum", "ects_sum", "weighted_sum", "ects_passed", "verteilung", "semester")
+
+    def __init__(self):
+        self.graded = 0
+        self.passed = 0
+        self.note_sum = 0.0
+        self.ects_sum = 0.0
+        self.weighted_sum = 0.0
+        self.ects_passed = 0.0
+        self.verteilung = Counter()  # ganze Punkte -> Anzahl
+        self.semester = {}  # (jahr, hälfte) -> [anzahl, punkte, ects, punkte*ects]
+
+    @classmethod
+    def from_rows(cls, rows) -> "GradeStats":
+        stats = cls()
+        for rec in rows:
+            stats._apply(_key(rec), 1)
+        return stats
+
+    def copy(self) -> "GradeStats":
+        out = GradeStats()
+        for name in ("graded", "passed", "note_sum", "ects_sum", "weighted_sum", "ects_passed"):
+            setattr(out, name, getattr(self, name))
+        out.verteilung = Counter(self.verteilung)
+        out.semester = {k: list(v) for k, v in self.semester.items()}
+        return out
+
+    def _apply(self, key: tuple, sign: int):
+        archiviert, note, ects, datum = key
+        note = parse_note(note)
+        if not archiviert or note is None:
+            return
+        try:
+            ects = max(float(ects or 0.0), 0.0)
+        except (TypeError, ValueError):
+            ects = 0.0
+
+        self.graded += sign
+        self.note_sum += sign * note
+        self.ects_sum += sign * ects
+        self.weighted_sum += sign * note * ects
+        if passed(note):
+            self.passed += sign
+            self.ects_passed += sign * ects
+        bucket = int(note)
+        self.verteilung[bucket] += sign
+        if not self.verteilung[bucket]:
+            del self.verteilung[bucket]
+
+        sem = semester_of(datum or "")
+        if sem is not None:
+            acc = self.semester.setdefault(sem, [0, 0.0, 0.0, 0.0])
+            acc[0] += sign
+            acc[1] += sign * note
+            acc[2] += sign * ects
+            acc[3] += sign * note * ects
+            if not acc[0]:
+                del self.semester[sem]
+
+    def updated(self, old_rows, new_rows) -> "GradeStats":
+        """Neue Statistik für ``new_rows`` (``old_rows``: der Stand, aus dem diese stammt).
+
+        Nur geänderte, eingefügte oder gelöschte Zeilen werden verrechnet;
+        innerhalb des geänderten Bereichs zählt die Multimenge, umsortierte
+        Zeilen heben sich also auf.
+        """
+        old, new = _changed(old_rows, new_rows)
+        old, new = Counter(_key(r) for r in old), Counter(_key(r) for r in new)
+        removed, added = old - new, new - old
+        if not removed and not added:
+            return self
+        out = self.copy()
+        for key, n in removed.items():
+            for _ in range(n):
+                out._apply(key, -1)
+        for key, n in added.items():
+            for _ in range(n):
+                out._apply(key, 1)
+        return out
+
+    def __add__(self, other: "GradeStats") -> "GradeStats":
+        out = self.copy()
+        for name in ("graded", "passed", "note_sum", "ects_sum", "weighted_sum", "ects_passed"):
+            setattr(out, name, getattr(out, name) + getattr(other, name))
+        out.verteilung.update(other.verteilung)
+        for sem, acc in other.semester.items():
+            mine = out.semester.setdefault(sem, [0, 0.0, 0.0, 0.0])
+            for i, v in enumerate(acc):
+                mine[i] += v
+        return out
+
+    # ---------- Kennzahlen ----------
+    @staticmethod
+    def _mean(count, note_sum, ects_sum, weighted_sum):
+        """ECTS-gewichtet, solange ECTS hinterlegt sind – sonst einfacher Schnitt."""
+        if ects_sum > _EPS:
+            return weighted_sum / ects_sum
+        return note_sum / count if count else None
+
+    @property
+    def schnitt(self):
+        return self._mean(self.graded, self.note_sum, self.ects_sum, self.weighted_sum)
+
+    @property
+    def gewichtet(self) -> bool:
+        return self.ects_sum > _EPS
+
+    @property
+    def bestehensquote(self):
+        return self.passed / self.graded if self.graded else None
+
+    def verteilung_punkte(self) -> dict:
+        """``{punkte: anzahl}`` für 0–15 (auch leere Stufen, fürs Diagramm)."""
+        return {p: self.verteilung.get(p, 0) for p in range(16)}
+
+    def verlauf(self) -> list:
+        """``[(semester, schnitt, anzahl)]`` chronologisch."""
+        return [
+            (semester_label(sem), self._mean(*acc), acc[0])
+            for sem, acc in sorted(self.semester.items())
+        ]
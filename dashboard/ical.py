@@ -0,0 +1,503 @@
+"""iCalendar-Export und -Import (ohne Streamlit).
+
+Export: Klausuren, Seminartermine (beide Termine), fällige To-Dos und
+Vorlesungen werden zu VEVENTs. ``CalendarPart`` hält pro Collection
+``Datensatz-Inhalt -> VEVENT-Text`` und übernimmt beim nächsten Stand alle
+Texte, deren Datensatz sich nicht geändert hat (``Snapshot.derived_update``). Neu gerendert wird nur, was neu
+oder geändert ist – UID und DTSTAMP bleiben für unveränderte Termine gleich.
+Identische Datensätze ergeben denselben Termin und erscheinen nur einmal.
+
+Import: ``iter_events()`` liest einen Kalender-Feed der Uni zeilenweise aus
+einem Stream (Zeilen-Entfaltung nach RFC 5545) und hält immer nur das
+aktuelle VEVENT im Speicher. Wöchentliche/tägliche Serien (RRULE mit
+INTERVAL, COUNT, UNTIL, BYDAY, EXDATE) werden zu einzelnen Vorlesungen
+aufgeklappt, abgesagte Termine übersprungen; andere Regeln landen als
+``unlesbar`` im Bericht. Zeiten in UTC oder einer anderen TZID werden in
+die Wandzeit von ``TIMEZONE`` umgerechnet.
+Ergebnisse werden nach SHA-256 des Feeds gecacht – derselbe Feed noch
+einmal kostet nur den Vergleich mit dem Store.
+"""
+import codecs
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from itertools import chain
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from dashboard import profiling
+from dashboard.timeslots import format_minutes, parse_time_range
+
+PRODID = "-//Uni-Dashboard//Kalender//DE"
+CALENDAR_NAME = "Uni-Dashboard"
+EXPORT_COLLECTIONS = ["klausuren", "seminare", "todos", "vorlesungen"]
+
+# Obergrenze pro Serie (ein Semester wöchentlich sind ~15 Termine)
+MAX_OCCURRENCES = 500
+IMPORT_CACHE_SIZE = 8
+_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+_RRULE_PARTS = {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "WKST"}
+
+# Zeitzone, in deren Wandzeit importierte Termine gespeichert werden (Feeds in UTC oder anderer TZID)
+TIMEZONE = os.environ.get("DASHBOARD_TIMEZONE", "Europe/Berlin")
+
+_PARAM_RE = re.compile(r';([A-Za-z0-9-]+)=("[^"]*"|[^;:]*)')
+_DURATION_RE = re.compile(r"^P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+
+
+# -------------------------------------------------
+# Export
+# -------------------------------------------------
+def record_hash(rec: dict) -> str:
+    """Stabiler Inhalts-Hash (für UIDs – gleich über Neustarts hinweg)."""
+    return hashlib.sha1(json.dumps(rec, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+
+def _record_key(rec: dict):
+    """Schneller Cache-Schlüssel für einen Datensatz (nur prozessintern gültig).
+
+    Ohne Sortieren: andere Feldreihenfolge heißt nur neu rendern, die UID bleibt gleich.
+    """
+    try:
+        key = tuple(rec.items())
+        hash(key)
+        return key
+    except TypeError:
+        return record_hash(rec)
+
+
+def _escape(text) -> str:
+    return (
+        str(text).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Zeilen über 75 Bytes umbrechen (Folgezeilen beginnen mit Leerzeichen)."""
+    if len(line.encode("utf-8")) <= 75:
+        return line
+    chunks, current, size, limit = [], [], 0, 75
+    for ch in line:
+        n = len(ch.encode("utf-8"))
+        if size + n > limit:
+            chunks.append("".join(current))
+            current, size, limit = [], 0, 74
+        current.append(ch)
+        size += n
+    chunks.append("".join(current))
+    return "\r\n ".join(chunks)
+
+
+def _to_date(value):
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _klausur_events(rec: dict) -> list:
+    d = _to_date(rec.get("datum"))
+    if d is None:
+        return []
+    beschreibung = f"Note: {rec['note']}" if rec.get("archiviert") and rec.get("note") else ""
+    return [(f"Klausur: {rec.get('fach') or '?'}", d, None, "", beschreibung)]
+
+
+def _seminar_events(rec: dict) -> list:
+    events = []
+    for nr, (datum, zeit) in enumerate([(rec.get("datum"), rec.get("uhrzeit1")), (rec.get("datum2"), rec.get("uhrzeit2"))], start=1):
+        d = _to_date(datum)
+        if d is not None:
+            titel = rec.get("titel") or "Seminar"
+            events.append((f"Seminar: {titel}" + (f" (Termin {nr})" if nr > 1 else ""), d, parse_time_range(zeit), "", rec.get("notiz", "")))
+    return events
+
+
+def _todo_events(rec: dict) -> list:
+    d = _to_date(rec.get("faellig"))
+    if d is None or rec.get("done"):
+        return []
+    prefix = "❗ " if rec.get("wichtig") else ""
+    return [(f"{prefix}To-Do: {rec.get('text') or '?'}", d, None, "", rec.get("fach", ""))]
+
+
+def _vorlesung_events(rec: dict) -> list:
+    d = _to_date(rec.get("datum"))
+    if d is None:
+        return []
+    return [(rec.get("fach") or "Vorlesung", d, parse_time_range(rec.get("zeit")), rec.get("raum", ""), "")]
+
+
+EVENT_BUILDERS = {
+    "klausuren": _klausur_events,
+    "seminare": _seminar_events,
+    "todos": _todo_events,
+    "vorlesungen": _vorlesung_events,
+}
+
+
+def _stamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def render_record(collection: str, rec: dict, stamp: str) -> str:
+    """VEVENT-Text (CRLF) aller Termine eines Datensatzes; leer, wenn er keinen hat."""
+    out = []
+    events = EVENT_BUILDERS[collection](rec)
+    uid = f"{collection}-{record_hash(rec)[:20]}" if events else ""
+    for nr, (summary, d, span, location, description) in enumerate(events, start=1):
+        lines = ["BEGIN:VEVENT", f"UID:{uid}-{nr}@uni-dashboard", f"DTSTAMP:{stamp}"]
+        if span is None:
+            lines += [f"DTSTART;VALUE=DATE:{d:%Y%m%d}", f"DTEND;VALUE=DATE:{d + timedelta(days=1):%Y%m%d}"]
+        else:
+            start = datetime.combine(d, time()) + timedelta(minutes=span[0])
+            end = datetime.combine(d, time()) + timedelta(minutes=span[1])
+            lines += [f"DTSTART:{start:%Y%m%dT%H%M%S}", f"DTEND:{end:%Y%m%dT%H%M%S}"]
+        lines.append(f"SUMMARY:{_escape(summary)}")
+        if location:
+            lines.append(f"LOCATION:{_escape(location)}")
+        if description:
+            lines.append(f"DESCRIPTION:{_escape(description)}")
+        lines.append("END:VEVENT")
+        out.append("".join(_fold(line) + "\r\n" for line in lines))
+    return "".join(out)
+
+
+class CalendarPart:
+    """VEVENTs einer Collection, nach Datensatz-Inhalt (wird nie verändert)."""
+
+    __slots__ = ("collection", "events", "rendered")
+
+    def __init__(self, collection: str, events: dict, rendered: int):
+        self.collection = collection
+        self.events = events
+        self.rendered = rendered
+
+    @classmethod
+    def build(cls, collection: str, rows, previous: "CalendarPart" = None) -> "CalendarPart":
+        """Rendert nur Datensätze, die ``previous`` noch nicht kennt."""
+        old = previous.events if previous is not None else {}
+        events, rendered, stamp = {}, 0, None
+        for rec in rows or []:
+            key = _record_key(rec)
+            if key in events:
+                continue
+            text = old.get(key)
+            if text is None:
+                stamp = stamp or _stamp()
+                text = render_record(collection, rec, stamp)
+                rendered += 1
+            events[key] = text
+        return cls(collection, events, rendered)
+
+    def text(self) -> str:
+        return "".join(self.events.values())
+
+
+def calendar_parts(snapshot) -> list:
+    """``CalendarPart`` pro Collection, am Snapshot fortgeschrieben (``derived_update``)."""
+    parts = []
+    for collection in EXPORT_COLLECTIONS:
+        def build(rows, c=collection):
+            with profiling.span("ics_export"):
+                return CalendarPart.build(c, rows)
+
+        def update(part, old_rows, rows, c=collection):
+            with profiling.span("ics_export"):
+                return CalendarPart.build(c, rows, part)
+
+        parts.append(snapshot.derived_update(f"ics_{collection}", collection, build, update))
+    return parts
+
+
+def calendar_text(parts) -> str:
+    head = [
+        "BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{PRODID}", "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH", f"X-WR-CALNAME:{CALENDAR_NAME}",
+    ]
+    return "\r\n".join(head) + "\r\n" + "".join(p.text() for p in parts) + "END:VCALENDAR\r\n"
+
+
+# -------------------------------------------------
+# Import
+# -------------------------------------------------
+def _unfold(lines):
+    """Logische Zeilen aus physischen (Folgezeilen beginnen mit Leerzeichen/Tab)."""
+    current = None
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if current is not None:
+                current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _split_property(line: str):
+    """``NAME;PARAM=x:wert`` -> ``(NAME, {PARAM: x}, wert)``; Doppelpunkte in Anführungszeichen zählen nicht."""
+    in_quotes = False
+    for i, ch in enumerate(line):
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif ch == ":" and not in_quotes:
+            head, value = line[:i], line[i + 1:]
+            break
+    else:
+        return None, {}, ""
+    name = head.split(";", 1)[0].upper()
+    params = {k.upper(): v.strip('"') for k, v in _PARAM_RE.findall(head[len(name):])}
+    return name, params, value
+
+
+def _unescape(text: str) -> str:
+    return re.sub(r"\\([\\;,nN])", lambda m: "\n" if m.group(1) in "nN" else m.group(1), text)
+
+
+_zones = {}
+
+
+def _zone(name):
+    """``ZoneInfo`` oder ``None`` (leer/unbekannt); gecacht, da pro Termin gebraucht."""
+    if not name:
+        return None
+    if name not in _zones:
+        try:
+            _zones[name] = ZoneInfo(name)
+        except (KeyError, ValueError, OSError):
+            _zones[name] = None
+    return _zones[name]
+
+
+def _parse_dt(value: str, params: dict):
+    """``datetime`` (lokale Wandzeit) bzw. ``date`` bei ganztägigen Terminen; ``None`` wenn unlesbar."""
+    value = value.strip()
+    try:
+        if params.get("VALUE") == "DATE" or len(value) == 8:
+            return datetime.strptime(value[:8], "%Y%m%d").date()
+        dt = datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+    except ValueError:
+        return None
+    target = _zone(TIMEZONE)
+    if value.endswith("Z"):
+        return dt.replace(tzinfo=timezone.utc).astimezone(target).replace(tzinfo=None)
+    source = _zone(params.get("TZID"))
+    if source is not None and target is not None:
+        return dt.replace(tzinfo=source).astimezone(target).replace(tzinfo=None)
+    # Ohne TZID (Wandzeit) oder bei unbekannter Zeitzone (z.B. Windows-Namen) wie angegeben
+    return dt
+
+
+def _parse_duration(value: str):
+    m = _DURATION_RE.match(value.strip().lstrip("+"))
+    if not m:
+        return None
+    w, d, h, mi, s = (int(x or 0) for x in m.groups())
+    return timedelta(weeks=w, days=d, hours=h, minutes=mi, seconds=s)
+
+
+def iter_events(stream):
+    """VEVENTs als ``{NAME: (params, wert)}`` (EXDATE als Liste) – Zeile für Zeile aus ``stream``."""
+    event, depth = None, 0
+    for line in _unfold(stream):
+        name, params, value = _split_property(line)
+        if name == "BEGIN":
+            if value.strip().upper() == "VEVENT" and event is None:
+                event, depth = {"EXDATE": []}, 0
+            elif event is not None:
+                depth += 1  # VALARM o.ä. innerhalb des Termins
+            continue
+        if name == "END" and event is not None:
+            if depth:
+                depth -= 1
+            elif value.strip().upper() == "VEVENT":
+                yield event
+                event = None
+            continue
+        if event is None or depth:
+            continue
+        if name == "EXDATE":
+            event["EXDATE"].extend((params, v) for v in value.split(","))
+        elif name not in event:
+            event[name] = (params, value)
+
+
+def _candidate_days(freq: str, day0: date, interval: int, weekdays, wkst: int):
+    """Kandidaten-Tage einer Serie ab ``day0`` in zeitlicher Reihenfolge (``day0`` selbst nicht)."""
+    if freq == "DAILY":
+        day = day0
+        # Passt BYDAY nie zum Intervall, endet die Suche trotzdem
+        for _ in range(MAX_OCCURRENCES * 7):
+            day += timedelta(days=interval)
+            if weekdays is None or day.weekday() in weekdays:
+                yield day
+        return
+    # Wochen beginnen an WKST (wichtig bei INTERVAL > 1)
+    week = day0 - timedelta(days=(day0.weekday() - wkst) % 7)
+    offsets = sorted((wd - wkst) % 7 for wd in (weekdays or {day0.weekday()}))
+    while True:
+        for offset in offsets:
+            day = week + timedelta(days=offset)
+            if day > day0:
+                yield day
+        week += timedelta(weeks=interval)
+
+
+def _rrule_dates(start, rule: str, exdates: set):
+    """Startzeitpunkte einer Serie oder ``None``, wenn die Regel nicht unterstützt wird.
+
+    Unterstützt FREQ=DAILY/WEEKLY mit INTERVAL, COUNT, UNTIL, WKST und BYDAY
+    als Liste von Wochentagen (``MO,WE``, ohne ``1MO``); DTSTART ist immer
+    das erste Vorkommen.
+    """
+    try:
+        parts = dict(p.split("=", 1) for p in rule.upper().strip().split(";") if p)
+    except ValueError:
+        return None
+    freq = parts.get("FREQ")
+    if freq not in ("DAILY", "WEEKLY") or set(parts) - _RRULE_PARTS:
+        return None
+    try:
+        interval = int(parts.get("INTERVAL") or 1)
+        count = int(parts["COUNT"]) if "COUNT" in parts else MAX_OCCURRENCES
+        weekdays = {_WEEKDAYS[d] for d in parts["BYDAY"].split(",")} if "BYDAY" in parts else None
+        wkst = _WEEKDAYS[parts.get("WKST", "MO")]
+    except (KeyError, ValueError):
+        return None
+    if interval < 1:
+        return None
+    until = None
+    if "UNTIL" in parts:
+        until = _parse_dt(parts["UNTIL"], {})
+        if until is None:
+            return None
+        if isinstance(until, datetime) and not isinstance(start, datetime):
+            until = until.date()
+        elif not isinstance(until, datetime) and isinstance(start, datetime):
+            until = datetime.combine(until, time.max)
+
+    day0 = start.date() if isinstance(start, datetime) else start
+    out, produced = [], 0
+    occurrences = chain(
+        [start],
+        (datetime.combine(d, start.time()) if isinstance(start, datetime) else d
+         for d in _candidate_days(freq, day0, interval, weekdays, wkst)),
+    )
+    for occurrence in occurrences:
+        if produced >= min(count, MAX_OCCURRENCES) or (until is not None and occurrence > until):
+            break
+        produced += 1
+        if occurrence not in exdates:
+            out.append(occurrence)
+    return out
+
+
+def parse_feed(stream, quelle: str) -> tuple:
+    """Kalender-Feed -> ``(vorlesungen, bericht)``; Vorlesungen chronologisch sortiert."""
+    records, overrides = [], set()
+    report = {"termine": 0, "serien": 0, "abgesagt": 0, "unlesbar": 0}
+    for event in iter_events(stream):
+        report["termine"] += 1
+        if event.get("STATUS", ({}, ""))[1].strip().upper() == "CANCELLED":
+            report["abgesagt"] += 1
+            continue
+        if "DTSTART" not in event:
+            report["unlesbar"] += 1
+            continue
+        start = _parse_dt(event["DTSTART"][1], event["DTSTART"][0])
+        if start is None:
+            report["unlesbar"] += 1
+            continue
+        end = _parse_dt(event["DTEND"][1], event["DTEND"][0]) if "DTEND" in event else None
+        if end is None and "DURATION" in event:
+            duration = _parse_duration(event["DURATION"][1])
+            end = start + duration if duration is not None else None
+        uid = event.get("UID", ({}, ""))[1]
+        if "RECURRENCE-ID" in event:
+            # Verschobener Einzeltermin einer Serie: ersetzt das ursprüngliche Vorkommen
+            original = _parse_dt(event["RECURRENCE-ID"][1], event["RECURRENCE-ID"][0])
+            if original is not None:
+                overrides.add((uid, original))
+
+        starts = [start]
+        if "RRULE" in event:
+            exdates = {_parse_dt(v, p) for p, v in event["EXDATE"]}
+            starts = _rrule_dates(start, event["RRULE"][1], exdates)
+            if starts is None:
+                # Nicht unterstützte Regel (z.B. FREQ=MONTHLY): lieber melden als nur den ersten Termin übernehmen
+                report["unlesbar"] += 1
+                continue
+            report["serien"] += 1
+
+        summary = _unescape(event.get("SUMMARY", ({}, ""))[1]).strip() or "Termin"
+        raum = _unescape(event.get("LOCATION", ({}, ""))[1]).strip()
+        is_override = "RECURRENCE-ID" in event
+        for occurrence in starts:
+            if isinstance(occurrence, datetime):
+                zeit = format_minutes(occurrence.hour * 60 + occurrence.minute)
+                if isinstance(end, datetime):
+                    stop = occurrence + (end - start)
+                    if stop.date() == occurrence.date() and stop > occurrence:
+                        zeit += "–" + format_minutes(stop.hour * 60 + stop.minute)
+                datum = occurrence.date()
+            else:
+                zeit, datum = "", occurrence
+            records.append((
+                uid, occurrence, is_override,
+                {"datum": datum.isoformat(), "zeit": zeit, "fach": summary, "raum": raum, "quelle": quelle},
+            ))
+
+    if overrides:
+        records = [r for r in records if r[2] or (r[0], r[1]) not in overrides]
+    rows = sorted((r[3] for r in records), key=lambda r: (r["datum"], r["zeit"]))
+    report["vorlesungen"] = len(rows)
+    return rows, report
+
+
+_import_cache = OrderedDict()
+_import_lock = threading.Lock()
+
+
+def parse_feed_cached(open_stream, sha256: str, quelle: str) -> tuple:
+    """Wie ``parse_feed``, aber pro Feed-Inhalt und Quelle nur einmal (Ergebnis nicht verändern).
+
+    ``open_stream()`` liefert einen Binär-Stream; er wird nur bei einem
+    Cache-Fehlschlag geöffnet und als UTF-8 zeilenweise dekodiert.
+    """
+    key = (sha256, quelle)
+    with _import_lock:
+        cached = _import_cache.get(key)
+        if cached is not None:
+            _import_cache.move_to_end(key)
+            return cached
+    with profiling.span("ics_import"), open_stream() as raw:
+        lines = codecs.iterdecode(raw, "utf-8-sig", errors="replace")
+        result = parse_feed(lines, quelle)
+    with _import_lock:
+        _import_cache[key] = result
+        while len(_import_cache) > IMPORT_CACHE_SIZE:
+            _import_cache.popitem(last=False)
+    return result
+
+
+def sync_rows(rows: list, quelle: str, imported: list) -> tuple:
+    """Ersetzt die Vorlesungen einer Quelle durch den neuen Import.
+
+    Gibt ``(neue_liste, neu, entfernt)`` zurück; andere Quellen (und manuell
+    bzw. per CSV angelegte Vorlesungen) bleiben unverändert. Hat sich nichts
+    geändert, ist ``neue_liste`` inhaltlich gleich ``rows``.
+    """
+    keep = [r for r in rows if r.get("quelle") != quelle]
+    before = [r for r in rows if r.get("quelle") == quelle]
+    if before == imported:
+        return rows, 0, 0
+    old_keys = {_record_key(r) for r in before}
+    new_keys = {_record_key(r) for r in imported}
+    return keep + [dict(r) for r in imported], len(new_keys - old_keys), len(old_keys - new_keys)
@@ -0,0 +1,114 @@
+"""Terminüberschneidungen zwischen Seminaren, Vorlesungen und Klausuren erkennen.
+
+Alle datierten Einträge eines Users werden zu Intervallen in absoluten
+Minuten (``Tagesordinal * 1440 + Minute``). ``IntervalIndex`` hält sie nach
+Startzeit sortiert; eine Überschneidungsabfrage sucht per Bisektion nur im
+Bereich ``[start - längstes Intervall, ende)`` statt alle Paare zu
+vergleichen.
+"""
+from bisect import bisect_left, insort
+from datetime import date
+
+import pandas as pd
+
+from dashboard.timeslots import format_minutes, parse_time_range
+
+DAY_MINUTES = 24 * 60
+
+
+class IntervalIndex:
+    """Sortierter Endpunkt-Index über halb-offene Intervalle ``[start, end)``."""
+
+    def __init__(self):
+        self._entries = []  # (start, end, seq, label), sortiert nach start
+        self._max_len = 0
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, start: int, end: int, label):
+        """Fügt ein Intervall ein (Suche O(log n))."""
+        insort(self._entries, (start, end, self._seq, label))
+        self._seq += 1
+        self._max_len = max(self._max_len, end - start)
+
+    def overlapping(self, start: int, end: int) -> list:
+        """Alle gespeicherten Intervalle, die ``[start, end)`` schneiden."""
+        lo = bisect_left(self._entries, (start - self._max_len,))
+        hi = bisect_left(self._entries, (end,))
+        return [(s, e, label) for s, e, _, label in self._entries[lo:hi] if e > start]
+
+
+def to_interval(d, uhrzeit=None):
+    """Datum + Freitext-Uhrzeit -> ``(start, end)`` in absoluten Minuten.
+
+    Ohne erkennbare Uhrzeit zählt der ganze Tag. ``None`` bei fehlendem Datum.
+    """
+    if d is None or pd.isna(d):
+        return None
+    span = parse_time_range(uhrzeit) or (0, DAY_MINUTES)
+    base = d.toordinal() * DAY_MINUTES
+    return base + span[0], base + span[1]
+
+
+def seminar_intervals(titel, datum, uhrzeit1, datum2=None, uhrzeit2=None) -> list:
+    """Intervalle eines Seminars (Termin 1 und ggf. Termin 2) mit Beschriftung."""
+    out = []
+    for nr, (d, zeit) in enumerate([(datum, uhrzeit1), (datum2, uhrzeit2)], start=1):
+        iv = to_interval(d, zeit)
+        if iv is not None:
+            out.append((*iv, f"Seminar „{titel}“ (Termin {nr})"))
+    return out
+
+
+def dated_intervals(seminare: pd.DataFrame, klausuren: pd.DataFrame, vorlesungen: pd.DataFrame = None) -> list:
+    """Alle datierten Einträge als ``(start, end, label, key)``.
+
+    ``key`` ist ``("seminar", idx)``, ``("vorlesung", idx)`` bzw. ``("klausur", idx)``.
+    Vorlesungen ohne erkennbare Uhrzeit (``zeit``) zählen – wie im Lernplan – den ganzen Tag.
+    """
+    out = []
+    for idx, row in seminare.iterrows():
+        for s, e, label in seminar_intervals(row["titel"], row["datum"], row["uhrzeit1"], row["datum2"], row["uhrzeit2"]):
+            out.append((s, e, label, ("seminar", idx)))
+
+    if vorlesungen is not None:
+        for idx, row in vorlesungen.iterrows():
+            iv = to_interval(row["datum"], row["zeit"])
+            if iv is not None:
+                out.append((*iv, f"Vorlesung „{row['fach'] or 'ohne Titel'}“", ("vorlesung", idx)))
+
+    aktiv = klausuren[~klausuren["archiviert"]]
+    for idx, row in aktiv.iterrows():
+        iv = to_interval(row["datum"])
+        if iv is not None:
+            out.append((*iv, f"Klausur „{row['fach']}“", ("klausur", idx)))
+    return out
+
+
+def build_index(intervals: list):
+    """Baut den Index inkrementell auf und sammelt dabei alle Konflikte.
+
+    Gibt ``(index, konflikte)`` zurück; ``konflikte`` bildet jeden ``key`` auf
+    die Beschriftungen der kollidierenden Einträge ab.
+    """
+    index = IntervalIndex()
+    konflikte = {}
+    for s, e, label, key in intervals:
+        for _, _, (other_label, other_key) in index.overlapping(s, e):
+            if other_key == key:
+                continue
+            konflikte.setdefault(key, []).append(other_label)
+            konflikte.setdefault(other_key, []).append(label)
+        index.add(s, e, (label, key))
+    return index, konflikte
+
+
+def describe_interval(start: int, end: int) -> str:
+    """Absolute Minuten -> ``"12.01.2026, 10:00–12:00"`` (ganzer Tag ohne Uhrzeit)."""
+    d = date.fromordinal(start // DAY_MINUTES)
+    s, e = start % DAY_MINUTES, end - (start - start % DAY_MINUTES)
+    if s == 0 and e == DAY_MINUTES:
+        return d.strftime("%d.%m.%Y")
+    return f"{d.strftime('%d.%m.%Y')}, {format_minutes(s)}–{format_minutes(e)}"
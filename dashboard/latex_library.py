@@ -0,0 +1,63 @@
+"""LaTeX-Snippets und Formelsammlung aus ``latex_library.json``.
+
+Die Datei wird einmal pro Prozess geladen und in einen kleinen Suchindex
+(Token -> Eintrags-IDs) über Titel und Beschreibung übersetzt. Suchbegriffe
+werden als Präfixe behandelt: ``"ab"`` findet auch ``"Ableitung"``.
+"""
+import json
+import os
+import re
+from bisect import bisect_left
+from functools import lru_cache
+
+LIBRARY_PATH = os.path.join(os.path.dirname(__file__), "latex_library.json")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _tokens(text: str) -> list:
+    return _TOKEN_RE.findall(text.lower())
+
+
+@lru_cache(maxsize=1)
+def load_library() -> tuple:
+    """Alle Einträge als Tupel von Dicts (``typ``, ``title``, ``desc``, ``latex``)."""
+    with open(LIBRARY_PATH, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return tuple(data.get("eintraege", []))
+
+
+@lru_cache(maxsize=1)
+def _search_index():
+    """``(sortierte Tokens, {token: frozenset(ids)})`` über Titel + Beschreibung."""
+    postings = {}
+    for i, entry in enumerate(load_library()):
+        for tok in _tokens(f"{entry.get('title', '')} {entry.get('desc', '')}"):
+            postings.setdefault(tok, set()).add(i)
+    return sorted(postings), {k: frozenset(v) for k, v in postings.items()}
+
+
+def _ids_for_prefix(prefix: str) -> set:
+    vocab, postings = _search_index()
+    ids = set()
+    pos = bisect_left(vocab, prefix)
+    while pos < len(vocab) and vocab[pos].startswith(prefix):
+        ids |= postings[vocab[pos]]
+        pos += 1
+    return ids
+
+
+def search(query: str = "", typ: str = None) -> list:
+    """IDs aller Einträge, deren Titel/Beschreibung alle Suchbegriffe enthalten."""
+    library = load_library()
+    ids = None
+    for tok in _tokens(query):
+        hits = _ids_for_prefix(tok)
+        ids = hits if ids is None else ids & hits
+        if not ids:
+            return []
+
+    result = range(len(library)) if ids is None else sorted(ids)
+    if typ is not None:
+        result = [i for i in result if library[i].get("typ") == typ]
+    return list(result)
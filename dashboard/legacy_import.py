@@ -0,0 +1,160 @@
+"""Einmalige Übernahme der alten CSV-/JSON-Dateien in ``dashboard_data.json``.
+
+Vor dem zentralen Store lagen die Daten pro User als einzelne Dateien vor
+(``klausuren.csv``, ``mood.csv``, ``seminare.csv``, ``lernplan.csv``,
+``stundenplan.csv``, ``todos.json``). Deren Formate weichen voneinander ab:
+``stundenplan.csv`` hat ein ``;`` am Zeilenende, ``seminare.csv`` eine Spalte
+``ort``, Noten stehen als ``nan`` drin. Jede Datei wird mit eigenem Dialekt
+eingelesen, spaltenweise (vektorisiert) auf das Schema gebracht und ohne
+Duplikate in den Store gemischt – ein zweiter Lauf ändert nichts mehr.
+
+Aufruf für alle User-Ordner (am besten bei gestopptem Server, sonst
+überschreiben offene Sessions das Ergebnis beim nächsten Speichern):
+
+    python -m dashboard.legacy_import [data] [--dry-run]
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import re
+
+import pandas as pd
+
+from dashboard import archive
+from dashboard.frames import coerce_frame
+from dashboard.locking import user_lock
+from dashboard.schema import COLLECTION_SCHEMAS, default_store
+from dashboard.store import DASHBOARD_JSON, StoreCorrupt, _read, atomic_write_json
+
+LEGACY_FILES = {
+    "klausuren.csv": "klausuren",
+    "mood.csv": "mood",
+    "seminare.csv": "seminare",
+    "lernplan.csv": "lernplan",
+    "stundenplan.csv": "vorlesungen",
+    "todos.json": "todos",
+}
+
+# Alte Spaltennamen -> aktuelle
+COLUMN_RENAMES = {"seminare": {"ort": "notiz"}}
+
+_TRAILING_SEMICOLON = re.compile(r";[ \t]*(?=\r?\n|\Z)")
+
+
+def sniff_dialect(sample: str) -> dict:
+    """Trennzeichen und Eigenheiten einer CSV-Datei anhand der ersten Zeilen."""
+    try:
+        sep = csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+    except csv.Error:
+        sep = ","
+    header = sample.splitlines()[0] if sample else ""
+    return {"sep": sep, "trailing_semicolon": sep != ";" and header.rstrip().endswith(";")}
+
+
+def read_legacy_file(path: str, collection: str) -> pd.DataFrame:
+    """Liest eine Altdatei (CSV mit erkanntem Dialekt oder JSON-Liste) schema-konform ein."""
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+        df = pd.DataFrame(rows if isinstance(rows, list) else [])
+    else:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            text = f.read()
+        dialect = sniff_dialect(text[:4096])
+        if dialect["trailing_semicolon"]:
+            text = _TRAILING_SEMICOLON.sub("", text)
+        df = pd.read_csv(io.StringIO(text), sep=dialect["sep"], dtype=str, keep_default_na=False)
+        df.columns = df.columns.str.strip()
+
+    renames = {old: new for old, new in COLUMN_RENAMES.get(collection, {}).items() if new not in df.columns}
+    return coerce_frame(collection, df.rename(columns=renames))
+
+
+def _row_keys(df: pd.DataFrame, cols: list) -> pd.Series:
+    return pd.util.hash_pandas_object(df[cols].astype(str), index=False)
+
+
+def merge_records(existing: list, new_df: pd.DataFrame, collection: str, known: list = None) -> tuple:
+    """Hängt nur Zeilen an, die (schema-normalisiert) noch nicht vorhanden sind.
+
+    ``known`` sind alle bekannten Datensätze (heiß und archiviert, Default: ``existing``);
+    angehängt wird an ``existing``. Gibt ``(liste, anzahl_neu)`` zurück; bestehende
+    Datensätze bleiben unverändert.
+    """
+    cols = list(COLLECTION_SCHEMAS[collection])
+    new_df = new_df.drop_duplicates(subset=cols)
+    if new_df.empty:
+        return existing, 0
+
+    known = existing if known is None else known
+    seen = set()
+    if known:
+        seen = set(_row_keys(coerce_frame(collection, pd.DataFrame(known)), cols))
+    fresh = new_df[~_row_keys(new_df, cols).isin(seen).to_numpy()]
+    return existing + fresh.to_dict(orient="records"), len(fresh)
+
+
+def import_user_dir(user_dir: str, dry_run: bool = False) -> dict:
+    """Übernimmt alle Altdateien eines User-Ordners. Bericht: ``{datei: (gelesen, neu)}``."""
+    path = os.path.join(user_dir, DASHBOARD_JSON)
+    report = {}
+    changed = False
+
+    # Unter der User-Sperre, damit ein laufender Server nichts überschreibt (siehe dashboard/locking.py)
+    with user_lock(user_dir) as lock:
+        try:
+            store = _read(path)[0] if os.path.exists(path) else default_store()
+        except StoreCorrupt as e:
+            # Nicht über eine kaputte Datei hinweg importieren: der Default plus Altdaten
+            # würde den echten Store ersetzen. Erst reparieren (oder wegsichern), dann erneut laufen lassen.
+            report[DASHBOARD_JSON] = f"Fehler: {e} – User übersprungen"
+            return report
+        for name, collection in LEGACY_FILES.items():
+            file_path = os.path.join(user_dir, name)
+            if not os.path.isfile(file_path):
+                continue
+            try:
+                df = read_legacy_file(file_path, collection)
+            except Exception as e:
+                report[name] = f"Fehler: {e}"
+                continue
+            # Gegen heiße und archivierte Zeilen prüfen, sonst kommen archivierte Altdaten doppelt zurück
+            known = archive.query(user_dir, store, collection)
+            store[collection], added = merge_records(store[collection], df, collection, known)
+            report[name] = (len(df), added)
+            changed = changed or added > 0
+
+        if changed and not dry_run:
+            atomic_write_json(path, store)
+            lock.bump()
+    return report
+
+
+def import_all(base_dir: str = "data", dry_run: bool = False) -> dict:
+    """Alle User-Ordner unter ``base_dir`` mit mindestens einer Altdatei übernehmen."""
+    results = {}
+    for entry in sorted(os.scandir(base_dir), key=lambda e: e.name):
+        if entry.is_dir() and any(os.path.isfile(os.path.join(entry.path, n)) for n in LEGACY_FILES):
+            results[entry.name] = import_user_dir(entry.path, dry_run=dry_run)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alte CSV-/JSON-Dateien in dashboard_data.json übernehmen.")
+    parser.add_argument("base_dir", nargs="?", default="data")
+    parser.add_argument("--dry-run", action="store_true", help="Nur anzeigen, nichts schreiben")
+    args = parser.parse_args()
+
+    for user, report in import_all(args.base_dir, dry_run=args.dry_run).items():
+        print(f"{user}:")
+        for name, res in report.items():
+            if isinstance(res, tuple):
+                print(f"  {name:<16} {res[0]:>6} gelesen, {res[1]:>6} neu")
+            else:
+                print(f"  {name:<16} {res}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Prozessübergreifende Sperre pro User-Ordner (ohne Streamlit).
+
+``atomic_write_json`` schützt nur vor halb geschriebenen Dateien. Laufen
+mehrere Server-Prozesse über denselben ``data/``-Ordner, muss jedes
+Lesen-Ändern-Schreiben zusätzlich unter ``user_lock()`` passieren, sonst
+überschreiben sich die Prozesse gegenseitig.
+
+Die Sperre ist advisory (``fcntl.flock``, unter Windows ``msvcrt.locking``)
+auf ``<user_dir>/.lock``. Die Datei enthält außerdem einen Generationszähler,
+den jeder Schreiber unter der Sperre mit ``bump()`` erhöht – daran erkennt ein
+Prozess zuverlässig (unabhängig von mtime-Auflösung), dass ein anderer den
+Store geändert hat. Wartezeiten landen im Rerun-Profiling
+(Zähler ``lock_wait_ms``/``lock_waits``) und in ``stats()``.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from dashboard import profiling
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+LOCK_FILE = ".lock"
+
+_stats_lock = threading.Lock()
+_stats = {"acquired": 0, "contended": 0, "wait_ms": 0.0, "max_wait_ms": 0.0}
+
+
+def _lock_fd(fd: int) -> bool:
+    """Sperrt exklusiv; gibt zurück, ob gewartet werden musste."""
+    if fcntl is not None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return False
+        except BlockingIOError:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            return True
+    if msvcrt is not None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return False
+        except OSError:
+            pass
+        while True:
+            try:
+                # LK_LOCK versucht es selbst 10× im Sekundentakt
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return True
+            except OSError:
+                continue
+    return False
+
+
+def _unlock_fd(fd: int):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _read_int(fd: int) -> int:
+    os.lseek(fd, 0, os.SEEK_SET)
+    raw = os.read(fd, 32)
+    try:
+        return int(raw.decode("ascii").strip() or 0)
+    except ValueError:
+        return 0
+
+
+def _record_wait(ms: float, contended: bool):
+    with _stats_lock:
+        _stats["acquired"] += 1
+        _stats["wait_ms"] += ms
+        _stats["max_wait_ms"] = max(_stats["max_wait_ms"], ms)
+        if contended:
+            _stats["contended"] += 1
+    profiling.count("lock_wait_ms", ms)
+    if contended:
+        profiling.count("lock_waits")
+
+
+class UserLock:
+    """Gehaltene Sperre; ``generation`` ist der Zählerstand beim Sperren."""
+
+    __slots__ = ("fd", "generation", "wait_ms")
+
+    def __init__(self, fd: int, wait_ms: float):
+        self.fd = fd
+        self.wait_ms = wait_ms
+        self.generation = _read_int(fd)
+
+    def bump(self) -> int:
+        """Nach dem Schreiben aufrufen: erhöht den Generationszähler und gibt ihn zurück."""
+        self.generation += 1
+        os.lseek(self.fd, 0, os.SEEK_SET)
+        os.ftruncate(self.fd, 0)
+        os.write(self.fd, str(self.generation).encode("ascii"))
+        return self.generation
+
+
+@contextmanager
+def user_lock(user_dir: str):
+    """``with user_lock(dir) as lock:`` – exklusiv für alle Threads und Prozesse."""
+    os.makedirs(user_dir, exist_ok=True)
+    t0 = time.perf_counter()
+    fd = os.open(os.path.join(user_dir, LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        contended = _lock_fd(fd)
+        wait_ms = (time.perf_counter() - t0) * 1000
+        _record_wait(wait_ms, contended)
+        try:
+            yield UserLock(fd, wait_ms)
+        finally:
+            _unlock_fd(fd)
+    finally:
+        os.close(fd)
+
+
+def read_generation(user_dir: str) -> int:
+    """Aktueller Generationszähler ohne Sperre (0, wenn noch nie gesperrt geschrieben)."""
+    try:
+        fd = os.open(os.path.join(user_dir, LOCK_FILE), os.O_RDONLY)
+    except OSError:
+        return 0
+    try:
+        return _read_int(fd)
+    finally:
+        os.close(fd)
+
+
+def stats() -> dict:
+    """Prozessweite Sperr-Statistik seit dem Start."""
+    with _stats_lock:
+        return dict(_stats)
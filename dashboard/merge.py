@@ -0,0 +1,75 @@
+"""Dreiwege-Merge einer Collection (ohne Streamlit).
+
+Beim Speichern kennt eine Session drei Stände: ``base`` (was sie gelesen
+hat), ``ours`` (was sie schreiben will) und ``theirs`` (was inzwischen auf
+der Platte steht, z.B. von einem anderen Prozess oder Tab). ``merge_collection``
+überträgt nur die eigenen Änderungen auf ``theirs``, damit keine fremde
+Änderung verloren geht.
+"""
+import json
+from collections import Counter
+
+
+def _key(record) -> str:
+    return json.dumps(record, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def merge_collection(base, ours, theirs):
+    """Überträgt die Änderungen ``base → ours`` auf ``theirs``.
+
+    - Skalare (z.B. Stundenplan-HTML): geändert gewinnt, sonst ``theirs``.
+    - Gleich lange Listen (nur Felder geändert, z.B. To-Do abgehakt): jeder
+      geänderte Datensatz ersetzt seinen alten Stand in ``theirs`` – an der
+      gleichen Position oder, falls verschoben, per Inhalt gesucht. Haben
+      beide denselben Datensatz geändert, gewinnt die eigene Änderung.
+    - Sonst (hinzugefügt/gelöscht): eigene gelöschte Datensätze werden aus
+      ``theirs`` entfernt, eigene neue hinten angehängt.
+    """
+    if ours == base:
+        return theirs
+    if theirs == base or not isinstance(ours, list) or not isinstance(base, list) or not isinstance(theirs, list):
+        return ours
+
+    if len(base) == len(ours):
+        changed = [i for i, (b, o) in enumerate(zip(base, ours)) if b != o]
+        merged = list(theirs)
+        # Schneller Weg: an allen geänderten Positionen steht in theirs noch der alte Stand
+        if len(theirs) > changed[-1] and all(theirs[i] == base[i] for i in changed):
+            for i in changed:
+                merged[i] = ours[i]
+            return merged
+
+        slots = {}
+        for j, record in enumerate(theirs):
+            slots.setdefault(_key(record), []).append(j)
+        base_keys = {_key(r) for r in base}
+        extra = []
+        for i in changed:
+            free = slots.get(_key(base[i]))
+            if free:
+                merged[free.pop(0)] = ours[i]
+            elif len(theirs) >= len(base) and _key(theirs[i]) not in base_keys:
+                # Dort steht eine fremde Änderung desselben Datensatzes – letzte Änderung gewinnt
+                merged[i] = ours[i]
+            else:
+                # Alter Stand nicht mehr auffindbar (dort geändert oder gelöscht) – nichts verlieren
+                extra.append(ours[i])
+        return merged + extra
+
+    base_keys = Counter(_key(r) for r in base)
+    our_keys = [_key(r) for r in ours]
+    removed = base_keys - Counter(our_keys)
+    added = Counter(our_keys) - base_keys
+
+    merged = []
+    for record in theirs:
+        k = _key(record)
+        if removed[k] > 0:
+            removed[k] -= 1
+            continue
+        merged.append(record)
+    for k, record in zip(our_keys, ours):
+        if added[k] > 0:
+            added[k] -= 1
+            merged.append(record)
+    return merged
@@ -0,0 +1,176 @@
+"""Datenmodell der App: Store-Collections <-> DataFrames (ohne Streamlit).
+
+``*_frame(rows)`` baut aus der Liste im Store einen typisierten DataFrame
+für die Seiten, ``*_records(df)`` macht daraus wieder speicherbare Dicts.
+Alles hier ist ohne laufende App importierbar (Benchmarks, Skripte).
+"""
+from datetime import datetime
+
+import pandas as pd
+
+from dashboard import profiling
+from dashboard.schema import KLAUSUREN_COLS, LERNPLAN_COLS, MOOD_COLS, SEMINAR_COLS, VORLESUNG_COLS
+
+
+# -------------------------------------------------
+# Helper: Date parsing/formatting
+# -------------------------------------------------
+def to_date_safe(x):
+    if x is None or x == "" or (isinstance(x, float) and pd.isna(x)):
+        return pd.NaT
+    try:
+        return pd.to_datetime(x, errors="coerce").date()
+    except Exception:
+        return pd.NaT
+
+def date_to_str(d):
+    try:
+        if pd.isna(d):
+            return ""
+    except Exception:
+        pass
+    if isinstance(d, datetime):
+        return d.date().isoformat()
+    return str(d)
+
+
+# -------------------------------------------------
+# Klausuren
+# -------------------------------------------------
+def klausuren_frame(rows) -> pd.DataFrame:
+    # Store-Datensätze sind vollständig (siehe schema.upgrade_store) – keine Spalten nachtragen
+    df = pd.DataFrame(rows, columns=KLAUSUREN_COLS)
+
+    df["datum"] = df["datum"].apply(to_date_safe)
+    df["tage_vorher"] = pd.to_numeric(df["tage_vorher"], errors="coerce").fillna(21).astype(int)
+    df["archiviert"] = df["archiviert"].astype(bool)
+    df["note"] = df["note"].astype(str)
+    df["ziel_stunden"] = pd.to_numeric(df["ziel_stunden"], errors="coerce").fillna(0.0)
+    df["gelernt_stunden"] = pd.to_numeric(df["gelernt_stunden"], errors="coerce").fillna(0.0)
+    # Ältere Archiv-Shards (dashboard.archive) haben noch keine ECTS
+    df["ects"] = pd.to_numeric(df["ects"], errors="coerce").fillna(0.0)
+
+    return df
+
+def klausuren_records(df) -> list:
+    out = df.copy()
+    out["datum"] = out["datum"].apply(date_to_str)
+    out = out[KLAUSUREN_COLS]
+    return out.to_dict(orient="records")
+
+@profiling.timed()
+def compute_exam_risk(row, today):
+    datum = row["datum"]
+    if pd.isna(datum):
+        return "unbekannt", "Datum fehlt"
+
+    days_until = (datum - today).days
+    if days_until < 0:
+        return "vorbei", "Klausur liegt in der Vergangenheit."
+    if days_until == 0:
+        return "heute", "Heute ist Klausurtag – GO! 🚀"
+
+    ziel = float(row.get("ziel_stunden", 0.0) or 0.0)
+    gelernt = float(row.get("gelernt_stunden", 0.0) or 0.0)
+    tage_vorher = int(row.get("tage_vorher", 21) or 21)
+
+    if ziel <= 0:
+        return "unbekannt", "Keine geplanten Lernstunden hinterlegt."
+
+    progress = gelernt / ziel
+    total_window = max(tage_vorher, 1)
+    days_elapsed = max(total_window - days_until, 0)
+    expected_progress = min(max(days_elapsed / total_window, 0.0), 1.0)
+
+    if progress >= expected_progress * 0.9:
+        return "grün", "Du liegst gut im Plan. Weiter so! ✅"
+    elif progress >= expected_progress * 0.6:
+        return "gelb", "Okay, aber da geht noch was. ⚠️"
+    else:
+        return "rot", "Rückstand zum Plan – besser Gas geben. ❗"
+
+
+# -------------------------------------------------
+# Todos
+# -------------------------------------------------
+def normalize_todos(data) -> list:
+    """To-Dos aus ungeprüften Quellen; Store-Datensätze sind schon vollständig (siehe load_todos)."""
+    norm = []
+    for t in data:
+        norm.append(
+            {
+                "text": t.get("text", ""),
+                "done": bool(t.get("done", False)),
+                "fach": t.get("fach", ""),
+                "wichtig": bool(t.get("wichtig", False)),
+                "faellig": t.get("faellig", ""),
+            }
+        )
+    return norm
+
+
+# -------------------------------------------------
+# Mood
+# -------------------------------------------------
+def mood_frame(rows) -> pd.DataFrame:
+    df = pd.DataFrame(rows, columns=MOOD_COLS)
+
+    df["datum"] = df["datum"].apply(to_date_safe)
+    df["stimmung"] = pd.to_numeric(df["stimmung"], errors="coerce").fillna(0).astype(int)
+    df["stress"] = pd.to_numeric(df["stress"], errors="coerce").fillna(0).astype(int)
+    df["schlaf"] = pd.to_numeric(df["schlaf"], errors="coerce").fillna(0.0)
+    df["notiz"] = df["notiz"].astype(str)
+    return df
+
+def mood_records(df) -> list:
+    out = df.copy()
+    out["datum"] = out["datum"].apply(date_to_str)
+    return out[MOOD_COLS].to_dict(orient="records")
+
+
+# -------------------------------------------------
+# Seminare
+# -------------------------------------------------
+def seminare_frame(rows) -> pd.DataFrame:
+    df = pd.DataFrame(rows, columns=SEMINAR_COLS)
+
+    df["datum"] = df["datum"].apply(to_date_safe)
+    df["datum2"] = df["datum2"].apply(to_date_safe)
+    df["punkte"] = pd.to_numeric(df["punkte"], errors="coerce").fillna(0.0)
+    df["absolviert"] = df["absolviert"].astype(bool)
+    df["titel"] = df["titel"].astype(str)
+    df["uhrzeit1"] = df["uhrzeit1"].astype(str)
+    df["uhrzeit2"] = df["uhrzeit2"].astype(str)
+    df["notiz"] = df["notiz"].astype(str)
+    return df
+
+def seminare_records(df) -> list:
+    out = df.copy()
+    out["datum"] = out["datum"].apply(date_to_str)
+    out["datum2"] = out["datum2"].apply(date_to_str)
+    return out[SEMINAR_COLS].to_dict(orient="records")
+
+
+# -------------------------------------------------
+# Lernplan
+# -------------------------------------------------
+def lernplan_frame(rows) -> pd.DataFrame:
+    df = pd.DataFrame(rows, columns=LERNPLAN_COLS)
+
+    df["fach"] = df["fach"].astype(str)
+    df["stunden_pro_woche"] = pd.to_numeric(df["stunden_pro_woche"], errors="coerce").fillna(0.0)
+    df["priorität"] = pd.to_numeric(df["priorität"], errors="coerce").fillna(2).astype(int)
+    return df
+
+def lernplan_records(df) -> list:
+    return df[LERNPLAN_COLS].to_dict(orient="records")
+
+
+# -------------------------------------------------
+# Vorlesungen (aus altem stundenplan.csv importiert)
+# -------------------------------------------------
+def vorlesungen_frame(rows) -> pd.DataFrame:
+    df = pd.DataFrame(rows, columns=VORLESUNG_COLS).fillna("")
+    df["datum"] = df["datum"].apply(to_date_safe)
+    df["zeit"] = df["zeit"].astype(str)
+    return df
@@ -0,0 +1,122 @@
+"""Mehrstufige Zusammenfassung des Mood-Verlaufs für schnelle Diagramme.
+
+Statt jeden einzelnen Eintrag an den Browser zu schicken, wird der Verlauf
+einmal in Tages-, Wochen- und Monatswerte (min/mean/max) verdichtet. Für
+einen Zeitraum wird dann die feinste Stufe gewählt, die unter
+``MAX_CHART_POINTS`` bleibt; reicht auch das nicht, greift LTTB.
+"""
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+MAX_CHART_POINTS = 120
+
+MOOD_METRICS = ["stimmung", "stress", "schlaf"]
+
+# Anzeigename -> Länge in Tagen (None = gesamter Verlauf)
+MOOD_RANGES = {
+    "14 Tage": 14,
+    "Monat": 31,
+    "Semester": 183,
+    "Jahr": 365,
+    "Alles": None,
+}
+
+# Stufe -> pandas-Resample-Regel, von fein nach grob
+RESOLUTIONS = [
+    ("Tag", "D"),
+    ("Woche", "W-MON"),
+    ("Monat", "MS"),
+]
+
+
+def build_mood_pyramid(mood_df: pd.DataFrame) -> dict:
+    """Verdichtet den Mood-Verlauf in Tages-, Wochen- und Monatswerte.
+
+    Ergebnis: ``{stufe: DataFrame}`` mit DatetimeIndex und Spalten wie
+    ``stimmung_min``, ``stimmung_mean``, ``stimmung_max`` – nur Perioden mit
+    mindestens einem Eintrag.
+    """
+    df = mood_df[pd.notna(mood_df["datum"])]
+    if df.empty:
+        return {name: pd.DataFrame() for name, _ in RESOLUTIONS}
+
+    series = df.set_index(pd.to_datetime(df["datum"]))[MOOD_METRICS].astype(float).sort_index()
+
+    pyramid = {}
+    for name, rule in RESOLUTIONS:
+        agg = series.resample(rule, label="left", closed="left").agg(["min", "mean", "max"])
+        agg.columns = [f"{metric}_{stat}" for metric, stat in agg.columns]
+        pyramid[name] = agg.dropna(how="all")
+    return pyramid
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: Indizes von ``n_out`` repräsentativen Punkten.
+
+    ``y`` darf zweidimensional sein (eine Spalte pro Kennzahl); die
+    Dreiecksflächen werden dann über alle Spalten aufsummiert.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if y.ndim == 1:
+        y = y[:, None]
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[nxt_lo:nxt_hi].mean()
+        avg_y = y[nxt_lo:nxt_hi].mean(axis=0)
+
+        bx = x[lo:hi]
+        by = y[lo:hi]
+        area = np.abs(
+            (x[a] - avg_x) * (by - y[a]) - (x[a] - bx)[:, None] * (avg_y - y[a])
+        ).sum(axis=1)
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def mood_chart_data(pyramid: dict, today, days, max_points: int = MAX_CHART_POINTS):
+    """Liefert ``(chart_df, stufe)`` für den Zeitraum der letzten ``days`` Tage.
+
+    ``chart_df`` hat höchstens ``max_points`` Zeilen und die Spalten
+    ``stimmung`` und ``stress`` (Mittelwerte der gewählten Stufe).
+    """
+    start = None if days is None else pd.Timestamp(today - timedelta(days=days))
+    cols = ["stimmung_mean", "stress_mean"]
+
+    window = pd.DataFrame()
+    stufe = RESOLUTIONS[0][0]
+    for stufe, _ in RESOLUTIONS:
+        level = pyramid.get(stufe)
+        if level is None or level.empty:
+            return pd.DataFrame(columns=["stimmung", "stress"]), stufe
+        pos = 0 if start is None else level.index.searchsorted(start)
+        window = level.iloc[pos:]
+        if len(window) <= max_points:
+            break
+
+    window = window[cols]
+    if len(window) > max_points:
+        x = window.index.asi8 // 86_400_000_000_000
+        idx = lttb_indices(x, window.to_numpy(), max_points)
+        window = window.iloc[idx]
+        stufe = f"{stufe} (LTTB)"
+
+    window = window.rename(columns={"stimmung_mean": "stimmung", "stress_mean": "stress"})
+    window.index = window.index.date
+    return window, stufe
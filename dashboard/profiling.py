@@ -0,0 +1,169 @@
+"""Leichtgewichtiges Profiling der Reruns (ohne Streamlit).
+
+Ein Rerun wird mit ``begin_rerun()`` / ``end_rerun()`` eingerahmt; darin
+sammeln ``span()`` (Context-Manager) und ``@timed`` (Decorator) Laufzeiten,
+``count()`` zählt z.B. geschriebene Bytes. Abgeschlossene Reruns landen in
+einem Ringpuffer pro Prozess; ``summary()`` liefert Perzentile pro Span.
+
+Standardmäßig ist alles aus: ``span()`` gibt dann ein geteiltes No-op-Objekt
+zurück und ``@timed`` ruft die Funktion direkt auf – Kosten sind ein
+Attributzugriff pro Aufruf. Einschalten per ``set_enabled(True)`` oder
+Umgebungsvariable ``DASHBOARD_PROFILE=1``; mit ``DASHBOARD_PROFILE_LOG=pfad``
+wird zusätzlich jeder Rerun als JSON-Zeile angehängt.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+HISTORY_SIZE = 500
+
+
+class _State:
+    enabled = os.environ.get("DASHBOARD_PROFILE", "") not in ("", "0")
+    log_path = os.environ.get("DASHBOARD_PROFILE_LOG") or None
+
+
+_state = _State()
+_local = threading.local()
+_lock = threading.Lock()
+_history = deque(maxlen=HISTORY_SIZE)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    __slots__ = ("name", "record", "t0")
+
+    def __init__(self, name: str, record: dict):
+        self.name = name
+        self.record = record
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        ms = (time.perf_counter() - self.t0) * 1000
+        spans = self.record["spans"]
+        spans[self.name] = spans.get(self.name, 0.0) + ms
+        return False
+
+
+def is_enabled() -> bool:
+    return _state.enabled
+
+
+def set_enabled(flag: bool, log_path: str = None):
+    """Schaltet das Profiling für den ganzen Prozess ein/aus."""
+    _state.enabled = bool(flag)
+    if log_path is not None:
+        _state.log_path = log_path or None
+
+
+def begin_rerun():
+    """Startet die Aufzeichnung eines Reruns im aktuellen Thread."""
+    if not _state.enabled:
+        _local.record = None
+        return
+    _local.record = {"ts": time.time(), "label": "", "t0": time.perf_counter(), "spans": {}, "counter": {}}
+
+
+def end_rerun(label: str = ""):
+    """Schließt den Rerun ab und legt ihn in der Historie (und ggf. im Log) ab.
+
+    Reruns, die per ``st.rerun()``/``st.stop()`` abgebrochen wurden, kommen nie
+    hier an und werden beim nächsten ``begin_rerun()`` verworfen.
+    """
+    record = getattr(_local, "record", None)
+    _local.record = None
+    if record is None:
+        return None
+    record["total_ms"] = (time.perf_counter() - record.pop("t0")) * 1000
+    record["label"] = label
+    with _lock:
+        _history.append(record)
+        if _state.log_path:
+            with open(_state.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return record
+
+
+def span(name: str):
+    """``with span("name"):`` – misst den Block im aktuellen Rerun."""
+    if not _state.enabled:
+        return _NO_SPAN
+    record = getattr(_local, "record", None)
+    if record is None:
+        return _NO_SPAN
+    return _Span(name, record)
+
+
+def timed(name: str = None):
+    """Decorator: misst jeden Aufruf als Span (Name default: Funktionsname)."""
+    def deco(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return fn(*args, **kwargs)
+            with span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+def count(name: str, n: float = 1):
+    """Erhöht einen Zähler im aktuellen Rerun (z.B. geschriebene Bytes)."""
+    if not _state.enabled:
+        return
+    record = getattr(_local, "record", None)
+    if record is not None:
+        record["counter"][name] = record["counter"].get(name, 0) + n
+
+
+def history() -> list:
+    with _lock:
+        return list(_history)
+
+
+def clear():
+    with _lock:
+        _history.clear()
+
+
+def summary(records: list = None) -> list:
+    """Perzentile pro Span über die Historie: ``[{span, n, p50, p90, p99, max}]`` (ms).
+
+    Ein Span zählt pro Rerun einmal (Summe aller Aufrufe darin); ``rerun`` ist
+    die Gesamtdauer.
+    """
+    import numpy as np
+
+    records = history() if records is None else records
+    samples = {}
+    for rec in records:
+        samples.setdefault("rerun", []).append(rec["total_ms"])
+        for key, ms in rec["spans"].items():
+            samples.setdefault(key, []).append(ms)
+
+    rows = []
+    for key, values in samples.items():
+        p50, p90, p99 = np.percentile(values, [50, 90, 99])
+        rows.append({"span": key, "n": len(values), "p50": p50, "p90": p90, "p99": p99, "max": max(values)})
+    rows.sort(key=lambda r: (r["span"] != "rerun", -r["p90"]))
+    return rows
@@ -0,0 +1,191 @@
+"""Restore aus Backups: streamend einlesen, migrieren, gegen das Schema prüfen.
+
+Backups (ZIP aus ``dashboard.backup`` oder alte JSON-Dateien) werden
+stückweise gelesen – bei Arrays Element für Element –, statt die komplette
+Datei zu dekodieren und zusätzlich als String im Speicher zu halten. Das
+Ergebnis ist ein fertiger Store plus ein Bericht je Collection; geschrieben
+wird erst, wenn der Aufrufer den Restore bestätigt.
+"""
+import io
+import json
+import re
+import zipfile
+
+from dashboard.schema import COLLECTION_SCHEMAS, SCALAR_KEYS, SCHEMA_VERSION, VERSION_KEY, migrate_record, validate_record
+
+CHUNK_SIZE = 64 * 1024
+
+_WS = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class JsonStream:
+    """Minimaler Pull-Parser über einen Text-Stream (Objekte und Arrays auf oberster Ebene)."""
+
+    def __init__(self, text, chunk_size: int = CHUNK_SIZE):
+        self._text = text
+        self._chunk = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _more(self, size: int):
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        data = self._text.read(size)
+        if data:
+            self._buf += data
+        else:
+            self._eof = True
+
+    def peek(self) -> str:
+        """Nächstes Nicht-Leerzeichen (ohne es zu konsumieren); ``""`` am Ende."""
+        while True:
+            self._pos = _WS.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if self._eof:
+                return ""
+            self._more(self._chunk)
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise ValueError(f"Ungültiges JSON: '{ch}' erwartet")
+        self._pos += 1
+
+    def value(self):
+        """Dekodiert den nächsten vollständigen JSON-Wert."""
+        if not self.peek():
+            raise ValueError("Ungültiges JSON: unerwartetes Dateiende")
+        grow = self._chunk
+        while True:
+            try:
+                val, end = _DECODER.raw_decode(self._buf, self._pos)
+                # Endet der Wert genau am Pufferende, könnte er (z.B. eine Zahl) noch weitergehen
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return val
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._more(grow)
+            grow *= 2
+
+    def _separator(self, close: str) -> bool:
+        """Konsumiert ``,`` oder das schließende Zeichen; True, wenn Ende erreicht."""
+        c = self.peek()
+        self._pos += 1
+        if c == close:
+            return True
+        if c != ",":
+            raise ValueError(f"Ungültiges JSON: ',' oder '{close}' erwartet")
+        return False
+
+    def iter_array(self):
+        """Liefert die Elemente eines Arrays einzeln."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self._separator("]"):
+                return
+
+    def iter_object_keys(self):
+        """Liefert die Keys eines Objekts; der Aufrufer liest danach jeweils den Wert."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self._separator("}"):
+                return
+
+
+def _read_value(stream: JsonStream):
+    """Arrays elementweise als Liste einsammeln, alles andere direkt dekodieren."""
+    if stream.peek() == "[":
+        return list(stream.iter_array())
+    return stream.value()
+
+
+def _read_json(fileobj) -> tuple:
+    """Altes JSON-Backup -> ``(rohdaten, schema_version)``."""
+    text = io.TextIOWrapper(fileobj, encoding="utf-8")
+    stream = JsonStream(text)
+    raw = {}
+    version = 0
+    try:
+        for key in stream.iter_object_keys():
+            if key == "schema_version":
+                version = int(stream.value())
+            elif key in COLLECTION_SCHEMAS or key in SCALAR_KEYS:
+                raw[key] = _read_value(stream)
+            else:
+                stream.value()  # unbekannte Keys überspringen
+    finally:
+        text.detach()  # Upload-Objekt nicht mitschließen
+    return raw, version
+
+
+def _read_zip(fileobj) -> tuple:
+    """ZIP-Backup -> ``(rohdaten, schema_version)``; jedes Member wird gestreamt."""
+    raw = {}
+    with zipfile.ZipFile(fileobj) as zf:
+        manifest = json.loads(zf.read("manifest.json").decode("utf-8"))
+        for key, name in manifest.get("members", {}).items():
+            if key not in COLLECTION_SCHEMAS and key not in SCALAR_KEYS:
+                continue
+            with zf.open(name) as member:
+                text = io.TextIOWrapper(member, encoding="utf-8")
+                if name.endswith(".json"):
+                    raw[key] = _read_value(JsonStream(text))
+                else:
+                    raw[key] = text.read()
+    return raw, int(manifest.get("schema_version", 1))
+
+
+def prepare_restore(fileobj) -> tuple:
+    """Liest ein Backup und bereitet den Restore vor.
+
+    Gibt ``(store, bericht)`` zurück. ``bericht`` enthält pro Collection die
+    Anzahl gelesener, übernommener, korrigierter, migrierter und verworfener
+    Datensätze sowie die Quell-Schema-Version unter ``"_version"``.
+    """
+    fileobj.seek(0)
+    is_zip = zipfile.is_zipfile(fileobj)
+    fileobj.seek(0)
+    raw, version = _read_zip(fileobj) if is_zip else _read_json(fileobj)
+
+    store = {}
+    report = {"_version": version}
+    for coll in COLLECTION_SCHEMAS:
+        rows = raw.get(coll, [])
+        if not isinstance(rows, list):
+            rows = []
+        counts = {"gelesen": len(rows), "übernommen": 0, "korrigiert": 0, "migriert": 0, "verworfen": 0}
+        clean = []
+        for rec in rows:
+            if isinstance(rec, dict) and version < SCHEMA_VERSION:
+                rec, migrated = migrate_record(coll, dict(rec), version)
+                counts["migriert"] += migrated
+            rec, fixed = validate_record(coll, rec)
+            if rec is None:
+                counts["verworfen"] += 1
+                continue
+            counts["korrigiert"] += fixed
+            clean.append(rec)
+        counts["übernommen"] = len(clean)
+        store[coll] = clean
+        report[coll] = counts
+
+    for key, default in SCALAR_KEYS.items():
+        value = raw.get(key, default)
+        store[key] = value if isinstance(value, type(default)) else default
+    store[VERSION_KEY] = SCHEMA_VERSION
+    return store, report
@@ -0,0 +1,190 @@
+"""Wochen-Lernplaner: verteilt Lernblöcke auf freie Zeitfenster.
+
+Fächer aus dem Lernplan werden nach Priorität und Nähe der zugehörigen
+Klausur gewichtet und greedy in ein Raster aus Zeitslots gelegt. Belegt sind
+Vorlesungen, Seminartermine und Klausurtage; vor einer Klausur wird nur bis
+zum Vortag geplant. Ein Block kostet O(Tage + Slots) – ein ganzes Semester
+ist in wenigen Millisekunden verplant.
+"""
+import heapq
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from dashboard.timeslots import format_minutes, parse_time_range
+
+DAY_START = 8 * 60
+DAY_END = 20 * 60
+SLOT_MINUTES = 60
+MAX_STUDY_MINUTES_PER_DAY = 6 * 60
+MAX_BLOCKS_PER_FACH_PER_DAY = 2
+STUDY_DAYS = 6  # Mo–Sa
+
+PRIORITY_WEIGHT = {1: 3.0, 2: 2.0, 3: 1.0}
+EXAM_HORIZON_DAYS = 28
+
+WEEKDAYS = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
+PLAN_COLS = ["datum", "tag", "start", "ende", "fach"]
+
+
+def busy_intervals(seminare: pd.DataFrame, klausuren: pd.DataFrame, vorlesungen: pd.DataFrame = None) -> dict:
+    """Belegte Zeiten pro Datum: ``{date: [(start_min, end_min), ...]}``.
+
+    Seminartermine und Vorlesungen ohne erkennbare Uhrzeit sowie Klausurtage
+    blockieren den ganzen Tag.
+    """
+    busy = {}
+
+    def add(d, uhrzeit):
+        if d is None or pd.isna(d):
+            return
+        span = parse_time_range(uhrzeit) or (0, 24 * 60)
+        busy.setdefault(d, []).append(span)
+
+    for row in seminare.itertuples(index=False):
+        add(row.datum, row.uhrzeit1)
+        add(row.datum2, row.uhrzeit2)
+
+    if vorlesungen is not None:
+        for row in vorlesungen.itertuples(index=False):
+            add(row.datum, row.zeit)
+
+    aktiv = klausuren[~klausuren["archiviert"]]
+    for d in aktiv["datum"]:
+        add(d, None)
+    return busy
+
+
+def _next_exams(klausuren: pd.DataFrame, week_start) -> dict:
+    """Nächste aktive Klausur ab ``week_start`` pro Fach (Name normalisiert)."""
+    aktiv = klausuren[~klausuren["archiviert"] & pd.notna(klausuren["datum"])]
+    aktiv = aktiv[aktiv["datum"] >= week_start].sort_values("datum")
+    exams = {}
+    for fach, d in zip(aktiv["fach"], aktiv["datum"]):
+        exams.setdefault(str(fach).strip().lower(), d)
+    return exams
+
+
+def subject_weight(prioritaet: int, exam_date, week_start) -> float:
+    """Gewicht eines Fachs: Priorität × Klausurnähe (bis zu 5× in der Klausurwoche)."""
+    weight = PRIORITY_WEIGHT.get(int(prioritaet), PRIORITY_WEIGHT[2])
+    if exam_date is not None:
+        days_until = (exam_date - week_start).days
+        if days_until <= EXAM_HORIZON_DAYS:
+            weight *= 1 + max(EXAM_HORIZON_DAYS - days_until, 0) / 7
+    return weight
+
+
+def _free_grid(busy: dict, week_start) -> np.ndarray:
+    """``(7, slots)``-Matrix: True = Slot ist frei."""
+    slot_start = np.arange(DAY_START, DAY_END, SLOT_MINUTES)
+    slot_end = slot_start + SLOT_MINUTES
+    free = np.ones((7, len(slot_start)), dtype=bool)
+    free[STUDY_DAYS:] = False
+
+    for day in range(7):
+        for start, end in busy.get(week_start + timedelta(days=day), ()):
+            free[day] &= ~((slot_start < end) & (slot_end > start))
+    return free
+
+
+def schedule_week(lernplan: pd.DataFrame, klausuren: pd.DataFrame, busy: dict, week_start):
+    """Plant eine Woche ab ``week_start`` (Montag).
+
+    Gibt ``(plan_df, nicht_verplant)`` zurück: ``plan_df`` mit den Spalten
+    ``PLAN_COLS`` und ein Dict ``{fach: stunden}`` für Stunden, die keinen
+    freien Slot mehr gefunden haben.
+    """
+    fach = lernplan["fach"].astype(str).tolist()
+    exams = _next_exams(klausuren, week_start)
+    exam_dates = [exams.get(f.strip().lower()) for f in fach]
+
+    weights = [
+        subject_weight(p, e, week_start)
+        for p, e in zip(lernplan["priorität"], exam_dates)
+    ]
+    # Aufrunden: angefangene Slots werden voll geplant, damit keine Lernzeit verloren geht
+    # (np.rint rundet 2,5 h auf 2 Slots ab); 1e-9 fängt Gleitkomma-Rauschen ab
+    remaining = np.ceil(
+        pd.to_numeric(lernplan["stunden_pro_woche"], errors="coerce").fillna(0.0).to_numpy()
+        * 60 / SLOT_MINUTES - 1e-9
+    ).astype(int)
+
+    free = _free_grid(busy, week_start)
+    day_load = np.zeros(7, dtype=int)
+    per_fach_day = np.zeros((len(fach), 7), dtype=int)
+    max_day_blocks = MAX_STUDY_MINUTES_PER_DAY // SLOT_MINUTES
+    day_idx = np.arange(7)
+
+    # Tage, an denen ein Fach überhaupt geplant werden darf (bis Vortag der Klausur)
+    allowed = np.ones((len(fach), 7), dtype=bool)
+    for i, e in enumerate(exam_dates):
+        if e is not None:
+            allowed[i] = day_idx < (e - week_start).days
+
+    heap = [(-weights[i] * remaining[i], i) for i in range(len(fach)) if remaining[i] > 0]
+    heapq.heapify(heap)
+
+    blocks = []
+    nicht_verplant = {}
+    while heap:
+        _, i = heapq.heappop(heap)
+
+        ok = (
+            allowed[i]
+            & free.any(axis=1)
+            & (day_load < max_day_blocks)
+            & (per_fach_day[i] < MAX_BLOCKS_PER_FACH_PER_DAY)
+        )
+        if not ok.any():
+            nicht_verplant[fach[i]] = nicht_verplant.get(fach[i], 0.0) + remaining[i] * SLOT_MINUTES / 60
+            continue
+
+        # Gleichmäßig verteilen: erst wenig Blöcke dieses Fachs, dann wenig Gesamtlast, dann früh
+        key = np.where(ok, per_fach_day[i] * 10_000 + day_load * 100 + day_idx, np.iinfo(int).max)
+        day = int(key.argmin())
+        slot = int(free[day].argmax())
+
+        free[day, slot] = False
+        day_load[day] += 1
+        per_fach_day[i, day] += 1
+        remaining[i] -= 1
+        start = DAY_START + slot * SLOT_MINUTES
+        blocks.append((day, start, fach[i]))
+
+        if remaining[i] > 0:
+            heapq.heappush(heap, (-weights[i] * remaining[i], i))
+
+    blocks.sort()
+    plan = pd.DataFrame(
+        [
+            {
+                "datum": week_start + timedelta(days=day),
+                "tag": WEEKDAYS[day],
+                "start": format_minutes(start),
+                "ende": format_minutes(start + SLOT_MINUTES),
+                "fach": f,
+            }
+            for day, start, f in blocks
+        ],
+        columns=PLAN_COLS,
+    )
+    return plan, nicht_verplant
+
+
+def schedule_range(lernplan: pd.DataFrame, klausuren: pd.DataFrame, busy: dict, first_week, weeks: int):
+    """Plant ``weeks`` aufeinanderfolgende Wochen (z.B. ein ganzes Semester)."""
+    plans = []
+    nicht_verplant = {}
+    for w in range(weeks):
+        plan, rest = schedule_week(lernplan, klausuren, busy, first_week + timedelta(weeks=w))
+        plans.append(plan)
+        for f, h in rest.items():
+            nicht_verplant[f] = nicht_verplant.get(f, 0.0) + h
+    return pd.concat(plans, ignore_index=True), nicht_verplant
+
+
+def week_start_of(d):
+    """Montag der Woche, in der ``d`` liegt."""
+    return d - timedelta(days=d.weekday())
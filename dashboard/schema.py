@@ -0,0 +1,273 @@
+"""Spalten-Schemas der Store-Collections und versionierte Migrationen.
+
+``COLLECTION_SCHEMAS`` beschreibt pro Collection die Spalten mit Typ und
+Default. ``MIGRATIONS`` (befüllt per ``@migration``) hebt Datensätze älterer
+Schema-Versionen (z.B. aus alten Backups) Schritt für Schritt auf
+``SCHEMA_VERSION``.
+
+Der Store selbst trägt seine Version unter ``VERSION_KEY``. ``upgrade_store``
+nimmt bei aktueller Version den schnellen Weg (keine Arbeit pro Datensatz);
+ältere Stores werden einmal migriert und komplett gegen das Schema geprüft –
+danach können sich die Loader darauf verlassen, dass jede Spalte da ist.
+"""
+import copy
+import math
+from datetime import date
+
+SCHEMA_VERSION = 4
+VERSION_KEY = "schema_version"
+# Monat der letzten Archivierung (siehe dashboard/archive.py); fehlt bei neuen Stores
+ARCHIVE_KEY = "archiv_stand"
+
+# Spalte -> (Typ, Default); Typen: str, int, float, bool, date (ISO-String oder "")
+COLLECTION_SCHEMAS = {
+    "klausuren": {
+        "fach": ("str", ""),
+        "datum": ("date", ""),
+        "lernordner": ("str", ""),
+        "tage_vorher": ("int", 21),
+        "archiviert": ("bool", False),
+        "note": ("str", ""),
+        "ziel_stunden": ("float", 0.0),
+        "gelernt_stunden": ("float", 0.0),
+        "ects": ("float", 0.0),
+    },
+    "todos": {
+        "text": ("str", ""),
+        "done": ("bool", False),
+        "fach": ("str", ""),
+        "wichtig": ("bool", False),
+        "faellig": ("date", ""),
+    },
+    "seminare": {
+        "titel": ("str", ""),
+        "datum": ("date", ""),
+        "uhrzeit1": ("str", ""),
+        "datum2": ("date", ""),
+        "uhrzeit2": ("str", ""),
+        "notiz": ("str", ""),
+        "punkte": ("float", 0.0),
+        "absolviert": ("bool", False),
+    },
+    "lernplan": {
+        "fach": ("str", ""),
+        "stunden_pro_woche": ("float", 0.0),
+        "priorität": ("int", 2),
+    },
+    "mood": {
+        "datum": ("date", ""),
+        "stimmung": ("int", 0),
+        "stress": ("int", 0),
+        "schlaf": ("float", 0.0),
+        "notiz": ("str", ""),
+    },
+    "vorlesungen": {
+        "datum": ("date", ""),
+        "zeit": ("str", ""),
+        "fach": ("str", ""),
+        "raum": ("str", ""),
+        "quelle": ("str", ""),
+    },
+}
+
+# Datensätze ohne gültigen Wert in diesen Spalten werden verworfen
+REQUIRED_FIELDS = {"mood": ["datum"], "vorlesungen": ["datum"]}
+
+# Nicht-tabellarische Store-Keys mit Default
+SCALAR_KEYS = {"stundenplan_html": ""}
+
+KLAUSUREN_COLS = list(COLLECTION_SCHEMAS["klausuren"])
+TODO_COLS = list(COLLECTION_SCHEMAS["todos"])
+SEMINAR_COLS = list(COLLECTION_SCHEMAS["seminare"])
+LERNPLAN_COLS = list(COLLECTION_SCHEMAS["lernplan"])
+MOOD_COLS = list(COLLECTION_SCHEMAS["mood"])
+VORLESUNG_COLS = list(COLLECTION_SCHEMAS["vorlesungen"])
+
+
+# -------------------------------------------------
+# Migrationen: (Zielversion, Collection, Funktion(record) -> record)
+# -------------------------------------------------
+MIGRATIONS = []
+
+
+def migration(version: int, collection: str):
+    """Registriert einen Migrationsschritt auf ``version`` für Datensätze einer Collection."""
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Migration auf v{version}, aber SCHEMA_VERSION ist {SCHEMA_VERSION}")
+    if collection not in COLLECTION_SCHEMAS:
+        raise ValueError(f"Unbekannte Collection {collection}")
+
+    def register(fn):
+        MIGRATIONS.append((version, collection, fn))
+        MIGRATIONS.sort(key=lambda m: m[0])
+        return fn
+
+    return register
+
+
+@migration(1, "klausuren")
+def _m1_klausuren_lernstunden(rec: dict) -> dict:
+    """v1: Klausuren bekommen geplante und gelernte Stunden."""
+    rec.setdefault("ziel_stunden", 0.0)
+    rec.setdefault("gelernt_stunden", 0.0)
+    return rec
+
+
+@migration(2, "seminare")
+def _m2_seminare_zweiter_termin(rec: dict) -> dict:
+    """v2: Seminare mit Uhrzeit und zweitem Termin; ``ort`` wandert in die Notiz."""
+    ort = rec.pop("ort", "")
+    if ort and not rec.get("notiz"):
+        rec["notiz"] = ort
+    for key in ("uhrzeit1", "datum2", "uhrzeit2"):
+        rec.setdefault(key, "")
+    return rec
+
+
+@migration(3, "klausuren")
+def _m3_klausuren_ects(rec: dict) -> dict:
+    """v3: Klausuren bekommen Leistungspunkte (0 = nicht angegeben) für den gewichteten Schnitt."""
+    rec.setdefault("ects", 0.0)
+    return rec
+
+
+@migration(4, "vorlesungen")
+def _m4_vorlesungen_quelle(rec: dict) -> dict:
+    """v4: Vorlesungen merken sich ihren Kalender-Feed (leer = manuell bzw. CSV-Import)."""
+    rec.setdefault("quelle", "")
+    return rec
+
+
+def migrate_record(collection: str, rec: dict, from_version: int) -> tuple:
+    """Wendet alle Migrationen > ``from_version`` an. Gibt ``(record, migriert?)`` zurück."""
+    migrated = False
+    for version, coll, fn in MIGRATIONS:
+        if version > from_version and coll == collection:
+            rec = fn(rec)
+            migrated = True
+    return rec, migrated
+
+
+# -------------------------------------------------
+# Validierung
+# -------------------------------------------------
+def _is_missing(value) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float) and math.isnan(value):
+        return True
+    return isinstance(value, str) and value.strip().lower() in ("", "nan", "none", "nat")
+
+
+def _coerce(typ: str, value):
+    """Wandelt ``value`` in den Spaltentyp; ``ValueError`` wenn das nicht geht."""
+    if typ == "str":
+        return str(value)
+    if typ == "float":
+        out = float(value)
+        if math.isnan(out):
+            raise ValueError("NaN")
+        return out
+    if typ == "int":
+        return int(float(value))
+    if typ == "bool":
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            low = value.strip().lower()
+            if low in ("true", "1", "ja", "yes"):
+                return True
+            if low in ("false", "0", "nein", "no"):
+                return False
+            raise ValueError(value)
+        return bool(value)
+    if typ == "date":
+        return date.fromisoformat(str(value)[:10]).isoformat()
+    raise ValueError(f"Unbekannter Typ {typ}")
+
+
+def validate_record(collection: str, rec) -> tuple:
+    """Prüft einen Datensatz gegen das Schema.
+
+    Gibt ``(record, korrigiert?)`` zurück; ``record`` ist ``None``, wenn der
+    Datensatz verworfen werden muss. Fehlende oder ungültige Werte werden
+    durch Defaults ersetzt, unbekannte Spalten entfernt.
+    """
+    if not isinstance(rec, dict):
+        return None, False
+
+    schema = COLLECTION_SCHEMAS[collection]
+    fixed = set(rec) - set(schema)
+    out = {}
+    for col, (typ, default) in schema.items():
+        value = rec.get(col)
+        if _is_missing(value):
+            if col in rec and value != default:
+                fixed.add(col)
+            out[col] = default
+            continue
+        try:
+            out[col] = _coerce(typ, value)
+        except (TypeError, ValueError):
+            out[col] = default
+            fixed.add(col)
+
+    for col in REQUIRED_FIELDS.get(collection, []):
+        if out[col] == COLLECTION_SCHEMAS[collection][col][1]:
+            return None, True
+    return out, bool(fixed)
+
+
+# -------------------------------------------------
+# Ganzer Store
+# -------------------------------------------------
+def default_store() -> dict:
+    """Leerer Store in der aktuellen Version (tiefe Kopie – Listen werden nie geteilt)."""
+    store = {coll: [] for coll in COLLECTION_SCHEMAS}
+    store.update(copy.deepcopy(SCALAR_KEYS))
+    store[VERSION_KEY] = SCHEMA_VERSION
+    return store
+
+
+def store_version(data) -> int:
+    """Version eines Stores; ohne Angabe 0 (vor Einführung von ``VERSION_KEY``)."""
+    version = data.get(VERSION_KEY, 0) if isinstance(data, dict) else 0
+    return version if isinstance(version, int) and not isinstance(version, bool) else 0
+
+
+def upgrade_store(data) -> tuple:
+    """Bringt einen Store auf ``SCHEMA_VERSION``. Gibt ``(store, migriert?)`` zurück.
+
+    Schneller Weg: Version aktuell und alle Keys vorhanden (oder neuer als
+    ``SCHEMA_VERSION``) -> ``data`` wird unverändert zurückgegeben. Sonst laufen die fehlenden Migrationen, jeder
+    Datensatz wird validiert (verworfene fallen weg) und fehlende Keys
+    bekommen Defaults. ``data`` selbst wird nie verändert.
+    """
+    version = store_version(data)
+    if version == SCHEMA_VERSION and all(k in data for k in COLLECTION_SCHEMAS) and all(k in data for k in SCALAR_KEYS):
+        return data, False
+    if version > SCHEMA_VERSION:
+        # Von einer neueren App-Version geschrieben – nichts anfassen, was wir nicht kennen
+        return data, False
+
+    data = data if isinstance(data, dict) else {}
+    store = default_store()
+    for coll in COLLECTION_SCHEMAS:
+        rows = data.get(coll)
+        if not isinstance(rows, list):
+            continue
+        clean = []
+        for rec in rows:
+            if isinstance(rec, dict) and version < SCHEMA_VERSION:
+                rec, _ = migrate_record(coll, dict(rec), version)
+            rec, _ = validate_record(coll, rec)
+            if rec is not None:
+                clean.append(rec)
+        store[coll] = clean
+    for key, default in SCALAR_KEYS.items():
+        value = data.get(key, default)
+        if isinstance(value, type(default)):
+            store[key] = value
+    if isinstance(data.get(ARCHIVE_KEY), str):
+        store[ARCHIVE_KEY] = data[ARCHIVE_KEY]
+    return store, True
@@ -0,0 +1,331 @@
+"""Session-Schicht der App: Store des eingeloggten Users und die Collections.
+
+Die eigentliche Logik (DataFrames bauen, zurückschreiben, Risiko-Ampel)
+liegt Streamlit-frei in ``dashboard.model``; hier kommen User-Zuordnung und
+Caching dazu. Der Store selbst ist ein prozessweit geteilter, unveränderlicher
+Snapshot (``dashboard.shared_store``) – alle Sessions desselben Users lesen
+denselben Stand, ``st.session_state`` hält nur noch die Revision und pro
+Collection den zuletzt gelesenen Stand (Basis für den Merge beim Speichern,
+siehe ``dashboard.merge``). Die Seiten unter ``dashboard/views`` laden nur
+die Collections, die sie wirklich anzeigen. Die daraus gebauten DataFrames
+hängen am Snapshot und gelten, solange die zugehörige Liste dieselbe ist –
+``store_collection()`` ersetzt die Liste bei jeder Änderung, ein
+Identitätsvergleich reicht also.
+"""
+import os
+import subprocess
+import sys
+import webbrowser
+from datetime import date
+
+import streamlit as st
+
+from dashboard import archive, ical, profiling, shared_store
+from dashboard.grades import GradeStats
+from dashboard.model import (
+    klausuren_frame,
+    klausuren_records,
+    lernplan_frame,
+    lernplan_records,
+    mood_frame,
+    mood_records,
+    seminare_frame,
+    seminare_records,
+    vorlesungen_frame,
+)
+from dashboard.mood_chart import build_mood_pyramid
+from dashboard.schema import ARCHIVE_KEY
+from dashboard.uploads import UploadSpool, UploadTooLarge
+
+BASE_DATA_DIR = "data"
+
+
+# -------------------------------------------------
+# Nutzerabhängige Datenpfade
+# -------------------------------------------------
+def get_user_data_dir():
+    user_ = st.session_state.get("user", "default")
+    path = os.path.join(BASE_DATA_DIR, user_)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def user_file(name: str) -> str:
+    return os.path.join(get_user_data_dir(), name)
+
+
+# -------------------------------------------------
+# ✅ ZENTRALER SPEICHER: dashboard_data.json (pro User)
+# -------------------------------------------------
+def _use_snapshot(snapshot) -> shared_store.Snapshot:
+    # Revision für Caches, die vom Store-Inhalt abhängen (z.B. Backup-Archiv)
+    st.session_state["store_rev"] = snapshot.version
+    return snapshot
+
+def get_snapshot() -> shared_store.Snapshot:
+    return _use_snapshot(shared_store.get_snapshot(get_user_data_dir()))
+
+def get_store() -> dict:
+    """Aktueller Store des Users (geteilt mit seinen anderen Sessions, nur lesen)."""
+    return get_snapshot().data
+
+def save_store(store: dict):
+    """Ersetzt den ganzen Store (Restore)."""
+    st.session_state.pop("_store_base", None)
+    _use_snapshot(shared_store.replace(get_user_data_dir(), store))
+
+def _read(key: str):
+    """``(snapshot, collection)``; merkt sich den gelesenen Stand als Basis für store_collection()."""
+    snapshot = get_snapshot()
+    rows = snapshot.data.get(key)
+    st.session_state.setdefault("_store_base", {})[key] = rows
+    return snapshot, rows
+
+def store_collection(key: str, value):
+    """Schreibt eine Collection in den Store – aber nur, wenn sie sich geändert hat.
+
+    Verglichen wird mit dem Stand, den diese Session gelesen hat; hat
+    inzwischen ein anderer Tab oder Prozess geschrieben, wird gemergt.
+    """
+    bases = st.session_state.setdefault("_store_base", {})
+    base = bases[key] if key in bases else get_store().get(key)
+    with profiling.span("store_collection"):
+        if base == value:
+            return
+    _use_snapshot(shared_store.commit(get_user_data_dir(), {key: value}, {key: base}))
+    bases[key] = value
+
+def _cached_frame(key: str, build):
+    """DataFrame einer Collection, am Snapshot gecacht (Kopie, darf verändert werden)."""
+    def build_frame(rows):
+        with profiling.span(f"load_{key}"):
+            return build(rows if rows is not None else [])
+
+    snapshot, _ = _read(key)
+    return snapshot.derived(key, key, build_frame).copy()
+
+def _with_archive(key: str, name: str, build):
+    """``build(datensätze)`` über Store und Archiv (``dashboard.archive``), am Snapshot gecacht.
+
+    Gilt, solange die Liste im Store dieselbe ist und sich kein Shard geändert hat.
+    """
+    user_dir = get_user_data_dir()
+    snapshot, _ = _read(key)
+    holder = snapshot.derived(f"{name}+archiv", key, lambda rows: {})
+    rev = archive.revision(user_dir, key)
+    value = holder.get(rev)
+    if value is None:
+        with profiling.span(f"load_{name}_archiv"):
+            value = build(archive.query(user_dir, snapshot.data, key))
+        holder.clear()
+        holder[rev] = value
+    return value
+
+
+# -------------------------------------------------
+# Hilfsfunktionen allgemein
+# -------------------------------------------------
+def safe_rerun():
+    try:
+        st.rerun()
+    except Exception:
+        try:
+            st.experimental_rerun()
+        except Exception:
+            pass
+
+def open_path_or_url(path: str):
+    """Ordner oder URL öffnen."""
+    path = str(path)
+
+    if path.startswith("http://") or path.startswith("https://"):
+        webbrowser.open(path)
+        return
+
+    if not os.path.exists(path):
+        st.error(f"Pfad nicht gefunden: {path}")
+        return
+
+    if sys.platform.startswith("win"):
+        os.startfile(path)  # type: ignore
+    elif sys.platform.startswith("darwin"):
+        subprocess.Popen(["open", path])
+    else:
+        subprocess.Popen(["xdg-open", path])
+
+
+# -------------------------------------------------
+# Uploads (Temp-Dateien pro Session, siehe dashboard/uploads.py)
+# -------------------------------------------------
+def accept_uploads(files, kind: str, container=st) -> list:
+    """Nimmt die Dateien eines ``st.file_uploader`` an und gibt ``Upload``-Objekte zurück.
+
+    Zu große Dateien werden mit Fehlermeldung übersprungen; Temp-Dateien
+    entfernter Uploads werden sofort gelöscht, der Rest mit der Session.
+    """
+    spool = st.session_state.get("_upload_spool")
+    if spool is None:
+        spool = st.session_state["_upload_spool"] = UploadSpool()
+    if files is None:
+        files = []
+    elif not isinstance(files, list):
+        files = [files]
+    spool.retain(kind, files)
+
+    accepted = []
+    for f in files:
+        try:
+            accepted.append(spool.add(f, kind))
+        except UploadTooLarge as e:
+            container.error(str(e))
+    return accepted
+
+
+# -------------------------------------------------
+# Stundenplan HTML (STORE)
+# -------------------------------------------------
+def load_stundenplan_html() -> str:
+    return _read("stundenplan_html")[1] or ""
+
+def save_stundenplan_html(html: str):
+    store_collection("stundenplan_html", html)
+
+
+# -------------------------------------------------
+# Klausuren (STORE)
+# -------------------------------------------------
+def load_klausuren(mit_archiv: bool = False):
+    """Klausuren im Store; ``mit_archiv`` ergänzt die alten archivierten aus den Shards."""
+    if mit_archiv:
+        return _with_archive("klausuren", "klausuren", klausuren_frame).copy()
+    return _cached_frame("klausuren", klausuren_frame)
+
+def save_klausuren(df, mit_archiv: bool = False):
+    """Mit ``mit_archiv`` enthält ``df`` auch das Archiv – kalte Klausuren gehen zurück in die Shards."""
+    records = klausuren_records(df)
+    if mit_archiv:
+        user_dir = get_user_data_dir()
+        records, cold = archive.split_cold("klausuren", records, archive.cutoff("klausuren", date.today()))
+        if cold != archive.cold_rows(user_dir, "klausuren"):
+            archive.replace_cold(user_dir, "klausuren", cold)
+    store_collection("klausuren", records)
+
+def get_grade_stats() -> GradeStats:
+    """Notenstatistik über alle Klausuren inkl. Archiv (``dashboard.grades``).
+
+    Der Store-Teil wird bei jeder Änderung nur um die Differenz
+    fortgeschrieben; der Archiv-Teil hängt an der Shard-Revision.
+    """
+    user_dir = get_user_data_dir()
+    snapshot = get_snapshot()
+
+    def build(rows):
+        with profiling.span("grade_stats"):
+            return GradeStats.from_rows(rows or [])
+
+    def update(stats, old_rows, rows):
+        with profiling.span("grade_stats_update"):
+            return stats.updated(old_rows or [], rows or [])
+
+    hot = snapshot.derived_update("notenstatistik", "klausuren", build, update)
+    # Am Archiv-Marker (ändert sich höchstens monatlich), damit Änderungen im Store den kalten Teil nicht verwerfen
+    holder = snapshot.derived("notenstatistik+archiv", ARCHIVE_KEY, lambda marker: {})
+    rev = archive.revision(user_dir, "klausuren")
+    cold = holder.get(rev)
+    if cold is None:
+        cold = build(archive.cold_rows(user_dir, "klausuren"))
+        holder.clear()
+        holder[rev] = cold
+    return hot + cold if cold.graded else hot
+
+
+
+# -------------------------------------------------
+# Todos (STORE)
+# -------------------------------------------------
+def load_todos():
+    # Datensätze sind schon schema-konform; kopiert wird nur, weil die Seite sie verändert
+    return [dict(t) for t in _read("todos")[1] or []]
+
+def save_todos(todos):
+    store_collection("todos", [dict(t) for t in todos])
+
+
+# -------------------------------------------------
+# Mood (STORE)
+# -------------------------------------------------
+def load_mood(mit_archiv: bool = False):
+    if mit_archiv:
+        return _with_archive("mood", "mood", mood_frame).copy()
+    return _cached_frame("mood", mood_frame)
+
+def save_mood(df):
+    store_collection("mood", mood_records(df))
+
+def get_mood_pyramid(mood_df, mit_archiv: bool = False):
+    """Tages-/Wochen-/Monatswerte des Mood-Verlaufs, am Snapshot gecacht.
+
+    save_mood() ersetzt die Liste im Store, daher reicht ein Identitätsvergleich.
+    ``mood_df`` muss zu ``mit_archiv`` passen (``load_mood(mit_archiv)``).
+    """
+    def build(rows):
+        with profiling.span("mood_pyramid"):
+            return build_mood_pyramid(mood_df)
+
+    if mit_archiv:
+        return _with_archive("mood", "mood_pyramid", build)
+    return get_snapshot().derived("mood_pyramid", "mood", build)
+
+
+# -------------------------------------------------
+# Seminare (STORE)
+# -------------------------------------------------
+def load_seminare():
+    return _cached_frame("seminare", seminare_frame)
+
+def save_seminare(df):
+    store_collection("seminare", seminare_records(df))
+
+
+# -------------------------------------------------
+# Lernplan (STORE)
+# -------------------------------------------------
+def load_lernplan():
+    return _cached_frame("lernplan", lernplan_frame)
+
+def save_lernplan(df):
+    store_collection("lernplan", lernplan_records(df))
+
+
+# -------------------------------------------------
+# Vorlesungen (STORE, aus altem stundenplan.csv bzw. Kalender-Feeds importiert)
+# -------------------------------------------------
+def load_vorlesungen():
+    return _cached_frame("vorlesungen", vorlesungen_frame)
+
+
+def import_calendar(upload) -> dict:
+    """Synchronisiert die Vorlesungen aus einem ICS-Feed (Quelle = Dateiname); gibt den Bericht zurück."""
+    rows, report = ical.parse_feed_cached(upload.open, upload.sha256, upload.name)
+    _, current = _read("vorlesungen")
+    synced, neu, entfernt = ical.sync_rows(list(current or []), upload.name, rows)
+    store_collection("vorlesungen", synced)
+    return dict(report, neu=neu, entfernt=entfernt)
+
+
+# -------------------------------------------------
+# Kalender-Export (ICS)
+# -------------------------------------------------
+def calendar_download():
+    """Callable für ``st.download_button``: baut das ICS erst beim Klick.
+
+    Läuft in einem eigenen Thread ohne ``st.session_state`` – der User-Ordner
+    wird deshalb vorher festgehalten. Unveränderte Termine kommen aus dem
+    Cache am Snapshot (``ical.calendar_parts``).
+    """
+    user_dir = get_user_data_dir()
+
+    def build() -> bytes:
+        snapshot = shared_store.get_snapshot(user_dir)
+        return ical.calendar_text(ical.calendar_parts(snapshot)).encode("utf-8")
+
+    return build
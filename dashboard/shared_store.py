@@ -0,0 +1,285 @@
+"""Prozessweit geteilte Store-Snapshots pro User (ohne Streamlit).
+
+Früher hielt jede Browser-Session eine eigene Kopie des ganzen Stores in
+``st.session_state`` – Handy, Laptop und mehrere Tabs desselben Users
+bedeuteten mehrfach dieselben Daten (inkl. Stundenplan-HTML) im Speicher.
+Jetzt gibt es pro User genau einen aktuellen ``Snapshot``, den sich alle
+Sessions teilen:
+
+- Ein Snapshot wird nie verändert (``FrozenStore`` verbietet Schreibzugriffe
+  auf oberster Ebene; die Listen darin gelten per Konvention als read-only).
+- ``commit()`` erzeugt eine neue Version, in der nur die geänderten
+  Collections neu sind – alle anderen werden per Referenz übernommen.
+- ``Snapshot.derived()`` cached daraus gebaute Objekte (DataFrames,
+  Mood-Pyramide) ebenfalls geteilt, gültig solange die Collection dieselbe ist.
+  ``derived_update()`` schreibt laufende Summen (Notenstatistik) aus der
+  Vorversion fort, statt sie neu aufzubauen.
+- Einträge werden nach ``STORE_CACHE_TTL`` Sekunden ohne Zugriff bzw. bei
+  mehr als ``STORE_CACHE_USERS`` Usern (LRU) verworfen; der nächste Zugriff
+  lädt die Datei neu. Wurde die Datei von außen geändert (mtime/Größe),
+  wird ebenfalls neu geladen.
+
+Der Speicherbedarf wächst damit mit der Zahl aktiver User, nicht mit der
+Zahl offener Tabs. Konfiguration per Umgebungsvariablen
+``DASHBOARD_STORE_CACHE`` (max. User) und ``DASHBOARD_STORE_TTL`` (Sekunden).
+
+Mehrere Prozesse: Schreiben läuft unter ``locking.user_lock()``. Hat ein
+anderer Prozess seit dem eigenen Snapshot geschrieben (Generationszähler),
+wird unter der Sperre neu gelesen und per ``merge_collection()`` nur die
+eigene Änderung übertragen – es geht kein Schreibvorgang verloren.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from dashboard import archive, locking, profiling
+from dashboard.merge import merge_collection
+from dashboard.schema import ARCHIVE_KEY, default_store
+from dashboard.store import DASHBOARD_JSON, load_user_store, read_user_store, save_user_store
+
+STORE_CACHE_USERS = int(os.environ.get("DASHBOARD_STORE_CACHE", "64"))
+STORE_CACHE_TTL = float(os.environ.get("DASHBOARD_STORE_TTL", "1800"))
+
+
+class FrozenStore(dict):
+    """Dict, das sich nach dem Anlegen nicht mehr ändern lässt (bleibt JSON-serialisierbar)."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Store-Snapshots sind unveränderlich – Änderungen über commit()")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+
+class Snapshot:
+    """Unveränderlicher Stand des Stores eines Users in einer Version."""
+
+    __slots__ = ("data", "version", "_derived")
+
+    def __init__(self, data: dict, version: int, derived: dict = None):
+        self.data = FrozenStore(data)
+        self.version = version
+        self._derived = derived if derived is not None else {}
+
+    def derived(self, name: str, collection: str, build):
+        """``build(rows)`` einmal pro Collection-Stand, geteilt über alle Sessions.
+
+        Das Ergebnis darf nicht verändert werden (ggf. ``.copy()``).
+        """
+        rows = self.data.get(collection)
+        cached = self._derived.get(name)
+        if cached is not None and cached[0] is rows:
+            return cached[1]
+        value = build(rows)
+        self._derived[name] = (rows, value)
+        return value
+
+    def derived_update(self, name: str, collection: str, build, update):
+        """Wie ``derived()``, aber ein Wert aus der Vorversion wird fortgeschrieben.
+
+        ``update(wert, alte_rows, rows)`` muss einen neuen Wert liefern (der
+        alte gehört noch älteren Snapshots); ``build(rows)`` nur ohne Vorgänger.
+        """
+        rows = self.data.get(collection)
+        cached = self._derived.get(name)
+        if cached is not None and cached[0] is rows:
+            return cached[1]
+        value = build(rows) if cached is None else update(cached[1], cached[0], rows)
+        self._derived[name] = (rows, value)
+        return value
+
+
+class _Entry:
+    __slots__ = ("snapshot", "signature", "last_used")
+
+    def __init__(self, snapshot: Snapshot, signature, last_used: float):
+        self.snapshot = snapshot
+        self.signature = signature
+        self.last_used = last_used
+
+
+def _file_signature(user_dir: str):
+    """Ändert sich bei jedem Schreiben: Generationszähler + Datei-Metadaten (auch für Fremdschreiber)."""
+    try:
+        info = os.stat(os.path.join(user_dir, DASHBOARD_JSON))
+    except OSError:
+        return None
+    return (locking.read_generation(user_dir), info.st_ino, info.st_mtime_ns, info.st_size)
+
+
+class StoreRegistry:
+    """Aktuelle Snapshots pro User-Ordner mit LRU-/TTL-Verdrängung."""
+
+    def __init__(self, max_users: int = STORE_CACHE_USERS, ttl: float = STORE_CACHE_TTL, clock=time.monotonic):
+        self.max_users = max(1, max_users)
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._user_locks = {}
+        # Versionen bleiben auch nach dem Verdrängen erhalten, damit sie pro User monoton steigen
+        self._versions = {}
+        self.counter = {"hits": 0, "misses": 0, "reloads": 0, "evicted": 0, "commits": 0, "merges": 0}
+
+    # ---------- intern ----------
+    def _user_lock(self, key: str):
+        with self._lock:
+            lock = self._user_locks.get(key)
+            if lock is None:
+                lock = self._user_locks[key] = threading.RLock()
+            return lock
+
+    def _evict(self, now: float):
+        """Erwartet gehaltenes ``self._lock``."""
+        for key in [k for k, e in self._entries.items() if now - e.last_used > self.ttl]:
+            del self._entries[key]
+            self.counter["evicted"] += 1
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+            self.counter["evicted"] += 1
+
+    def _touch(self, key: str):
+        now = self._clock()
+        with self._lock:
+            self._evict(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.last_used = now
+                self._entries.move_to_end(key)
+            return entry
+
+    def _publish(self, key: str, data: dict, signature, base: Snapshot = None) -> Snapshot:
+        with self._lock:
+            version = self._versions.get(key, 0) + 1
+            self._versions[key] = version
+        derived = dict(base._derived) if base is not None else None
+        snapshot = Snapshot(data, version, derived)
+        now = self._clock()
+        with self._lock:
+            self._entries[key] = _Entry(snapshot, signature, now)
+            self._entries.move_to_end(key)
+            self._evict(now)
+        return snapshot
+
+    def _ensure_file(self, key: str):
+        """Legt den Default-Store unter der Sperre an, damit kein paralleler Commit überschrieben wird."""
+        path = os.path.join(key, DASHBOARD_JSON)
+        if os.path.exists(path):
+            return
+        with locking.user_lock(key) as lock:
+            if not os.path.exists(path):
+                save_user_store(key, default_store())
+                lock.bump()
+
+    # ---------- API ----------
+    def get(self, user_dir: str, _lock=None) -> Snapshot:
+        """Aktueller Snapshot des Users; lädt die Datei, falls nötig.
+
+        ``_lock``: die von ``commit()`` bereits gehaltene Datei-Sperre.
+        """
+        key = os.path.abspath(user_dir)
+        if _lock is None:
+            self._ensure_file(key)
+        with self._user_lock(key):
+            entry = self._touch(key)
+            # Signatur vor dem Lesen: schreibt jemand währenddessen, passt sie beim nächsten Mal nicht
+            signature = _file_signature(key)
+            if entry is not None and entry.signature == signature:
+                self.counter["hits"] += 1
+                return entry.snapshot
+            self.counter["misses" if entry is None else "reloads"] += 1
+            with profiling.span("load_store"):
+                if _lock is not None:
+                    data, pending = load_user_store(key, _lock, save=False), False
+                else:
+                    data, pending = read_user_store(key)
+            if not pending:
+                if signature is None:
+                    signature = _file_signature(key)
+                return self._publish(key, data, signature)
+        # Migration/Archivierung speichern bzw. defekte Datei beiseitelegen – wie in
+        # commit() erst die Datei-Sperre, dann der Thread-Lock (nie umgekehrt)
+        with locking.user_lock(key) as lock, self._user_lock(key):
+            with profiling.span("load_store"):
+                data = load_user_store(key, lock)
+            return self._publish(key, data, _file_signature(key))
+
+    def commit(self, user_dir: str, changes: dict, bases: dict = None) -> Snapshot:
+        """Schreibt geänderte Collections und gibt die neue Version zurück.
+
+        ``bases`` ordnet jeder Collection den Stand zu, auf dem die Änderung
+        beruht. Ist der aktuelle Stand (nach Neulesen unter der Sperre) ein
+        anderer, wird dreiwege-gemergt; ohne ``bases`` gewinnt die Änderung.
+        """
+        key = os.path.abspath(user_dir)
+        bases = bases or {}
+        self._ensure_file(key)
+        # Reihenfolge Datei-Sperre → Thread-Lock; get() nimmt die Datei-Sperre nie unter dem Thread-Lock
+        with locking.user_lock(key) as lock, self._user_lock(key):
+            current = self.get(key, _lock=lock)
+            data = dict(current.data)
+            for coll, value in changes.items():
+                theirs = current.data.get(coll)
+                if coll in bases and bases[coll] is not theirs:
+                    with profiling.span("merge"):
+                        value = merge_collection(bases[coll], value, theirs)
+                    self.counter["merges"] += 1
+                data[coll] = value
+            with profiling.span("save_store"):
+                save_user_store(key, data)
+            lock.bump()
+            self.counter["commits"] += 1
+            return self._publish(key, data, _file_signature(key), current)
+
+    def replace(self, user_dir: str, store: dict) -> Snapshot:
+        """Ersetzt den ganzen Store (Restore); abgeleitete Caches beginnen neu.
+
+        Ohne Archiv-Marker (Backup, alter Snapshot) ist ``store`` vollständig –
+        dann ersetzt sein kalter Teil auch das Archiv. Die neuen Shards werden
+        erst nach dem Speichern des Stores eingetauscht; schlägt das Speichern
+        fehl, bleiben Store und Archiv beim alten Stand.
+        """
+        key = os.path.abspath(user_dir)
+        with locking.user_lock(key) as lock, self._user_lock(key):
+            staged = archive.StagedShards()
+            try:
+                data, _ = archive.archive_store(key, store, replace=ARCHIVE_KEY not in store, staged=staged)
+                with profiling.span("save_store"):
+                    save_user_store(key, data)
+            except BaseException:
+                staged.discard()
+                raise
+            staged.commit()
+            lock.bump()
+            self.counter["commits"] += 1
+            return self._publish(key, data, _file_signature(key))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"users": len(self._entries), **self.counter}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_registry = StoreRegistry()
+
+
+def get_snapshot(user_dir: str) -> Snapshot:
+    return _registry.get(user_dir)
+
+
+def commit(user_dir: str, changes: dict, bases: dict = None) -> Snapshot:
+    return _registry.commit(user_dir, changes, bases)
+
+
+def replace(user_dir: str, store: dict) -> Snapshot:
+    return _registry.replace(user_dir, store)
+
+
+def stats() -> dict:
+    return _registry.stats()
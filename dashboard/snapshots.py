@@ -0,0 +1,182 @@
+"""Automatische, versionierte Snapshots des Stores pro User.
+
+Ablage unter ``<userdir>/snapshots/``:
+
+- ``objects/<sha256>.json.gz`` – eine Collection, adressiert über ihren Inhalt.
+  Unveränderte Collections werden von mehreren Snapshots geteilt.
+- ``index.json`` – Liste der Snapshots mit Zeitstempel und Hash je Collection.
+
+Ein Snapshot entsteht bei jedem ``SNAPSHOT_EVERY_N_SAVES``-ten Speichern oder
+wenn der letzte älter als ``SNAPSHOT_MIN_INTERVAL`` ist. Danach greift die
+Aufbewahrung (stündlich/täglich/wöchentlich) und nicht mehr referenzierte
+Objekte werden gelöscht.
+
+``take_snapshot()`` erwartet die User-Sperre (``locking.user_lock``), weil das
+Aufräumen sonst Objekte eines parallel schreibenden Prozesses löschen kann;
+``save_user_store()`` hält sie ohnehin. Von außerhalb (Sidebar) laufen
+Snapshots über ``snapshot_locked()`` und ``restore_point()``; diese sichern
+den vollständigen Stand inkl. Archiv (``archive.full_store``), weil ein
+Restore auch die Archiv-Shards ersetzt.
+"""
+import gzip
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+
+from dashboard import archive, locking
+
+SNAPSHOT_DIR = "snapshots"
+SNAPSHOT_EVERY_N_SAVES = 20
+SNAPSHOT_MIN_INTERVAL = 60 * 60  # Sekunden
+
+# (Bucket-Länge in Sekunden, Anzahl Buckets) – pro Bucket bleibt der neueste Snapshot
+RETENTION = [
+    (60 * 60, 24),            # stündlich, 1 Tag
+    (24 * 60 * 60, 14),       # täglich, 2 Wochen
+    (7 * 24 * 60 * 60, 8),    # wöchentlich, 2 Monate
+]
+
+# Pro User-Ordner (prozessweit): [Saves seit letztem Snapshot, Zeitpunkt letzter Snapshot]
+_save_state = {}
+
+
+def _paths(user_dir: str):
+    base = os.path.join(user_dir, SNAPSHOT_DIR)
+    return base, os.path.join(base, "objects"), os.path.join(base, "index.json")
+
+
+def _hash(value) -> tuple:
+    raw = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest(), raw
+
+
+def list_snapshots(user_dir: str) -> list:
+    """Alle Snapshots, neuester zuerst: ``[{"id", "ts", "collections", "anzahl"}, ...]``."""
+    _, _, index_path = _paths(user_dir)
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            snaps = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return sorted(snaps, key=lambda s: s["ts"], reverse=True)
+
+
+def _write_index(user_dir: str, snaps: list):
+    _, _, index_path = _paths(user_dir)
+    tmp = index_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(snaps, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, index_path)
+
+
+def apply_retention(snaps: list, now: float) -> list:
+    """Wählt die zu behaltenden Snapshots (neuester Snapshot bleibt immer)."""
+    if not snaps:
+        return []
+    ordered = sorted(snaps, key=lambda s: s["ts"], reverse=True)
+    keep = {ordered[0]["id"]}
+    for bucket, count in RETENTION:
+        # Feste Zeitraster (nicht relativ zu "now"), damit die Auswahl stabil bleibt
+        current = int(now // bucket)
+        seen = set()
+        for s in ordered:
+            slot = int(s["ts"] // bucket)
+            if current - slot >= count or slot in seen:
+                continue
+            seen.add(slot)
+            keep.add(s["id"])
+    return [s for s in ordered if s["id"] in keep]
+
+
+def _collect_garbage(user_dir: str, snaps: list):
+    _, obj_dir, _ = _paths(user_dir)
+    referenced = {h for s in snaps for h in s["collections"].values()}
+    for name in os.listdir(obj_dir):
+        if name.endswith(".json.gz") and name[: -len(".json.gz")] not in referenced:
+            os.remove(os.path.join(obj_dir, name))
+
+
+def take_snapshot(user_dir: str, store: dict, now: float = None) -> dict:
+    """Legt einen Snapshot an (nur neue Collection-Inhalte werden geschrieben).
+
+    Gibt den Snapshot-Eintrag zurück; ist der Inhalt identisch mit dem
+    neuesten Snapshot, wird keiner angelegt und dieser zurückgegeben.
+    """
+    now = time.time() if now is None else now
+    _, obj_dir, _ = _paths(user_dir)
+    os.makedirs(obj_dir, exist_ok=True)
+
+    collections = {}
+    for key, value in store.items():
+        digest, raw = _hash(value)
+        collections[key] = digest
+        obj_path = os.path.join(obj_dir, f"{digest}.json.gz")
+        if not os.path.exists(obj_path):
+            tmp = obj_path + ".tmp"
+            with gzip.open(tmp, "wb") as f:
+                f.write(raw)
+            os.replace(tmp, obj_path)
+
+    snaps = list_snapshots(user_dir)
+    if snaps and snaps[0]["collections"] == collections:
+        return snaps[0]
+
+    entry = {
+        "id": datetime.fromtimestamp(now).strftime("%Y%m%d-%H%M%S-%f"),
+        "ts": now,
+        "collections": collections,
+        "anzahl": {k: len(v) for k, v in store.items() if isinstance(v, list)},
+    }
+    snaps = apply_retention([entry] + snaps, now)
+    _write_index(user_dir, snaps)
+    _collect_garbage(user_dir, snaps)
+    return entry
+
+
+def snapshot_locked(user_dir: str, store: dict) -> dict:
+    """Sichert ``store`` samt Archiv unter der User-Sperre (Sicherung vor einem Restore)."""
+    with locking.user_lock(user_dir):
+        return take_snapshot(user_dir, archive.full_store(user_dir, store))
+
+
+def restore_point(user_dir: str, snap_id: str, current: dict) -> dict:
+    """Lädt Snapshot ``snap_id`` und sichert danach ``current`` samt Archiv – beides unter der User-Sperre.
+
+    Erst laden: das Sichern wendet die Aufbewahrung an und könnte den
+    gewählten Stand sonst löschen.
+    """
+    with locking.user_lock(user_dir):
+        restored = load_snapshot(user_dir, snap_id)
+        take_snapshot(user_dir, archive.full_store(user_dir, current))
+    return restored
+
+
+def maybe_snapshot(user_dir: str, store: dict, now: float = None):
+    """Nach jedem Speichern aufrufen: Snapshot alle N Saves oder nach Ablauf des Intervalls."""
+    now = time.time() if now is None else now
+    state = _save_state.get(user_dir)
+    if state is None:
+        snaps = list_snapshots(user_dir)
+        state = _save_state[user_dir] = [0, snaps[0]["ts"] if snaps else 0.0]
+
+    state[0] += 1
+    if state[0] < SNAPSHOT_EVERY_N_SAVES and now - state[1] < SNAPSHOT_MIN_INTERVAL:
+        return None
+
+    state[0], state[1] = 0, now
+    return take_snapshot(user_dir, store, now)
+
+
+def load_snapshot(user_dir: str, snap_id: str) -> dict:
+    """Setzt den Store-Inhalt eines Snapshots wieder zusammen."""
+    _, obj_dir, _ = _paths(user_dir)
+    for s in list_snapshots(user_dir):
+        if s["id"] == snap_id:
+            out = {}
+            for key, digest in s["collections"].items():
+                with gzip.open(os.path.join(obj_dir, f"{digest}.json.gz"), "rb") as f:
+                    out[key] = json.loads(f.read().decode("utf-8"))
+            return out
+    raise KeyError(f"Snapshot {snap_id} nicht gefunden")
@@ -0,0 +1,120 @@
+"""Dateiebene des zentralen Speichers ``dashboard_data.json`` (ohne Streamlit).
+
+Beim Lesen bringt ``dashboard.schema.upgrade_store`` ältere Dateien auf die
+aktuelle Schema-Version; ``load_user_store`` schreibt das Ergebnis einmal
+unter der User-Sperre zurück, danach ist jeder weitere Ladevorgang der schnelle Weg ohne Arbeit
+pro Datensatz. Einmal im Monat verschiebt es außerdem kalte Datensätze in
+die Jahres-Shards (``dashboard.archive``), damit der Store klein bleibt.
+
+Eine unlesbare Datei wird nie überschrieben: sie wird unter der User-Sperre
+als ``dashboard_data.json.defekt-<zeit>`` beiseitegelegt (zum Wiederherstellen
+von Hand) und der User startet mit dem Default-Store.
+"""
+import json
+import os
+import time
+from datetime import date
+
+from dashboard import archive, profiling
+from dashboard.schema import default_store, upgrade_store
+from dashboard.snapshots import maybe_snapshot
+
+DASHBOARD_JSON = "dashboard_data.json"
+CORRUPT_SUFFIX = ".defekt-"
+
+
+class StoreCorrupt(ValueError):
+    """Die Store-Datei lässt sich nicht lesen (abgeschnitten, kein JSON, ...)."""
+
+
+def atomic_write_json(path: str, obj: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+        if profiling.is_enabled():
+            profiling.count("bytes_written", f.tell())
+            profiling.count("store_writes")
+    os.replace(tmp, path)
+
+
+def save_user_store(user_dir: str, store: dict):
+    """Schreibt den Store eines Users und legt bei Bedarf einen Snapshot an."""
+    atomic_write_json(os.path.join(user_dir, DASHBOARD_JSON), store)
+    maybe_snapshot(user_dir, store)
+
+
+def read_user_store(user_dir: str) -> tuple:
+    """Liest den Store ohne Sperre und ohne zu schreiben: ``(store, ausstehend?)``.
+
+    ``ausstehend``: Migration oder Archivierung müssen noch gespeichert werden
+    oder die Datei ist unlesbar (``store`` ist dann ``None``) – dann unter der
+    User-Sperre ``load_user_store()`` aufrufen.
+    """
+    try:
+        store, migrated = _read(os.path.join(user_dir, DASHBOARD_JSON))
+    except StoreCorrupt:
+        return None, True
+    return store, migrated or archive.archive_due(store, date.today())
+
+
+def load_user_store(user_dir: str, lock, save: bool = True) -> dict:
+    """Liest den Store unter der gehaltenen User-Sperre ``lock`` und erledigt Ausstehendes.
+
+    Fehlt die Datei, gibt es den Default; eine unlesbare wird beiseitegelegt.
+    Wurde migriert oder archiviert, wird das Ergebnis einmal gespeichert
+    (``save=False``: der Aufrufer schreibt ohnehin selbst).
+    """
+    path = os.path.join(user_dir, DASHBOARD_JSON)
+    if not os.path.exists(path):
+        return default_store()
+    try:
+        store, migrated = _read(path)
+    except StoreCorrupt:
+        store = _set_aside(path)
+        lock.bump()
+        return store
+    store, archived = archive.archive_store(user_dir, store, date.today())
+    if save and (migrated or archived):
+        with profiling.span("migrate_store"):
+            save_user_store(user_dir, store)
+        lock.bump()
+    return store
+
+
+def _set_aside(path: str) -> dict:
+    """Legt eine unlesbare Store-Datei beiseite (erwartet die User-Sperre); gibt den Default zurück.
+
+    Der Default wird bewusst nicht gespeichert – erst die nächste Änderung
+    des Users legt eine neue Datei an.
+    """
+    try:
+        os.replace(path, f"{path}{CORRUPT_SUFFIX}{time.strftime('%Y%m%d-%H%M%S')}")
+    except OSError:
+        pass
+    return default_store()
+
+
+def normalize_store(data: dict) -> dict:
+    """Bringt einen Store (Restore, Snapshot) auf die aktuelle Schema-Version."""
+    return upgrade_store(data)[0]
+
+
+def _read(path: str) -> tuple:
+    """``(store, migriert?)``; wirft ``StoreCorrupt``, wenn die Datei nicht lesbar ist."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise StoreCorrupt(f"{path}: {e}") from e
+    if not isinstance(data, dict):
+        raise StoreCorrupt(f"{path}: kein JSON-Objekt")
+    return upgrade_store(data)
+
+
+def read_store_file(path: str) -> dict:
+    """Liest eine Store-Datei in der aktuellen Schema-Version; fehlt sie oder ist sie kaputt, gibt es den Default."""
+    try:
+        return _read(path)[0]
+    except StoreCorrupt:
+        return default_store()
@@ -0,0 +1,282 @@
+"""Lokale, extraktive Zusammenfassung für Lernzettel (ohne Streamlit).
+
+Kein Modell, keine Cloud: Der zusammengeführte Text wird in Sätze zerlegt,
+jeder Satz als TF-IDF-Vektor dargestellt (NumPy, dünn besetzt als
+``(zeile, term, gewicht)``-Arrays statt einer Matrix) und nach Ähnlichkeit
+zum Schwerpunkt des ganzen Dokuments bewertet. Die besten Sätze bilden in
+Originalreihenfolge die Zusammenfassung. Dazu kommen Schlagworte (höchstes
+TF-IDF-Gewicht), Definitionen (Satzmuster wie "X ist ein …", "Unter X
+versteht man …") und eine Gliederung pro Quelldatei (Überschriften,
+Schlagworte, Kernsätze).
+
+Ergebnisse werden prozessweit nach SHA-256 des Textes gecacht – ein Rerun
+oder eine zweite Session mit demselben Skript rechnet nicht neu.
+"""
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from dashboard import profiling
+
+CACHE_SIZE = 16
+
+# Trennzeile, die die Lernzettel-Seite zwischen die Dateien setzt
+SOURCE_RE = re.compile(r"^##### Datei: (.+?) #####[ \t]*$", re.M)
+_BLOCK_RE = re.compile(r"\n[ \t]*\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[\"„(]?[A-ZÄÖÜ0-9])")
+_TOKEN_RE = re.compile(r"[a-zäöüß][a-zäöüß\-]{2,}")
+_HEADING_RE = re.compile(r"^(?:#{1,6}\s+|(?:\d+\.)*\d+\.?\s+|[IVX]+\.\s+|Kapitel\s+\d+)\S")
+
+# Abkürzungen, nach denen kein Satz endet
+_ABBREV = {
+    "z.", "b.", "d.", "h.", "u.", "a.", "i.", "e.", "s.", "vgl.", "bzw.", "ca.", "usw.", "etc.",
+    "nr.", "abb.", "tab.", "kap.", "dr.", "prof.", "bspw.", "ggf.", "evtl.", "inkl.", "sog.", "max.", "min.",
+}
+
+STOPWORDS = set("""
+aber alle allem allen aller alles also als am an andere anderen anders auch auf aus bei beim bereits bis bin
+bist da dabei dadurch dafür daher damit dann darauf daran darin darum das dass dem den denen denn der deren
+des dessen die dies diese diesem diesen dieser dieses doch dort durch ein eine einem einen einer eines einige
+einmal er es etwa euch für gegen gibt hat hatte hätte haben hier hin hinter ich ihr ihre ihrem ihren ihrer
+im in ins ist ja jede jedem jeden jeder jedes jedoch jetzt kann kein keine keinem keinen keiner können könnte
+man mehr mit muss müssen nach nicht noch nun nur ob oder ohne schon sehr sein seine seinem seinen seiner
+sich sie sind so solche sollen sollte sondern sowie über um und uns unter viel vom von vor war waren
+was weil welche welchem welchen welcher welches wenn wer werden wie wieder wir wird wo wurde wurden zu zum
+zur zwar zwischen sowohl ebenso etwas immer wohl beiden beide damit deshalb somit bzw usw vgl siehe
+versteht bezeichnet beschreibt heißt gilt folgt zeigt ergibt liefert
+the and for that with this from are was were have has had not but can will which their there these those
+into also such than then them they its our your all any been being more most other some only very
+""".split())
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="ignore")).hexdigest()
+
+
+# -------------------------------------------------
+# Text zerlegen
+# -------------------------------------------------
+def split_sources(text: str) -> list:
+    """``[(dateiname, text)]`` anhand der Trennzeilen; ohne Trennzeile eine Quelle."""
+    parts = SOURCE_RE.split(text)
+    sources = []
+    if parts[0].strip():
+        sources.append(("Text", parts[0]))
+    for i in range(1, len(parts) - 1, 2):
+        sources.append((parts[i].strip(), parts[i + 1]))
+    return sources
+
+
+def _is_heading(line: str) -> bool:
+    if not line or len(line) > 80 or line[-1] in ".,;:!?":
+        return False
+    if _HEADING_RE.match(line):
+        return True
+    words = line.split()
+    return len(words) <= 6 and line.isupper() and any(c.isalpha() for c in line)
+
+
+def split_sentences(text: str):
+    """``(überschriften, sätze)``; Zeilenumbrüche innerhalb eines Absatzes (PDF) werden geglättet."""
+    headings, sentences = [], []
+    for block in _BLOCK_RE.split(text):
+        lines = []
+        for line in block.splitlines():
+            line = line.strip()
+            if _is_heading(line):
+                headings.append(line.lstrip("# ").strip())
+            elif line:
+                lines.append(line)
+        if not lines:
+            continue
+        flat = re.sub(r"(\w)-\s+(?=[a-zäöüß])", r"\1", " ".join(lines))
+        pending = ""
+        for part in _SENTENCE_RE.split(flat):
+            pending = f"{pending} {part}" if pending else part
+            last = pending.rsplit(None, 1)[-1].lower()
+            if last in _ABBREV:
+                continue
+            sentences.append(pending.strip())
+            pending = ""
+        if pending:
+            sentences.append(pending.strip())
+    return headings, sentences
+
+
+def tokenize(sentence: str) -> list:
+    return [t for t in _TOKEN_RE.findall(sentence.lower()) if t not in STOPWORDS]
+
+
+# -------------------------------------------------
+# Definitionen
+# -------------------------------------------------
+_TERM = r"[A-ZÄÖÜ][\w\-äöüß]*(?:\s+[\w\-äöüß]+){0,3}?"
+_DEFINITION_RES = [
+    re.compile(rf"^(?:Definition|Def\.)\s*[(:]?\s*(?P<term>[^:()]{{2,50}}?)\s*[):]"),
+    re.compile(r"^Unter\s+(?:einem|einer|einen|dem|der|den|die|das)?\s*(?P<term>[\w\-äöüß ]{2,50}?)\s+versteht\s+man"),
+    re.compile(rf"^(?:Der|Die|Das|Ein|Eine)?\s*(?P<term>{_TERM})\s+(?:ist|sind)\s+(?:definiert\s+als|(?:ein|eine|einen|der|die|das)\b)"),
+    re.compile(rf"^(?:Der|Die|Das|Ein|Eine)?\s*(?P<term>{_TERM})\s+(?:bezeichnet|bezeichnen|beschreibt|heißt|meint)\b"),
+    re.compile(rf"^(?:Der|Die|Das)?\s*(?P<term>{_TERM})\s+wird\s+(?:als\s+.+?\s+)?(?:definiert|bezeichnet)"),
+    re.compile(r"^(?:The|An?)?\s*(?P<term>[A-Z][\w\-]*(?:\s+\w+){0,3}?)\s+(?:is|are)\s+defined\s+as\b"),
+]
+
+
+def extract_definitions(sentences: list, limit: int = 30) -> list:
+    """``[(begriff, satz)]`` – jeder Begriff nur einmal, in Textreihenfolge."""
+    found, seen = [], set()
+    for sentence in sentences:
+        if len(sentence) > 400:
+            continue
+        for pattern in _DEFINITION_RES:
+            m = pattern.match(sentence)
+            if m is None:
+                continue
+            term = m.group("term").strip(" -")
+            key = term.lower()
+            if term and key not in seen and key not in STOPWORDS:
+                seen.add(key)
+                found.append((term, sentence))
+            break
+        if len(found) >= limit:
+            break
+    return found
+
+
+# -------------------------------------------------
+# TF-IDF
+# -------------------------------------------------
+def tfidf(token_lists: list):
+    """Dünn besetzte, zeilenweise L2-normierte TF-IDF-Gewichte.
+
+    Rückgabe ``(rows, terms, weights, vocab)`` – je ein Eintrag pro
+    (Satz, Term)-Paar; ``vocab`` bildet Term -> Index ab.
+    """
+    vocab = {}
+    ids = [vocab.setdefault(tok, len(vocab)) for tokens in token_lists for tok in tokens]
+    n, v = len(token_lists), max(len(vocab), 1)
+    lengths = np.fromiter((len(t) for t in token_lists), dtype=np.int64, count=n)
+    row_of_token = np.repeat(np.arange(n, dtype=np.int64), lengths)
+
+    # Gleiche (Satz, Term)-Paare zusammenfassen = Termfrequenz
+    pairs, counts = np.unique(row_of_token * v + np.asarray(ids, dtype=np.int64), return_counts=True)
+    rows, terms = pairs // v, pairs % v
+
+    df = np.bincount(terms, minlength=v)
+    idf = np.log((1 + n) / (1 + df)) + 1.0
+    weights = (1.0 + np.log(counts)) * idf[terms]
+    norms = np.sqrt(np.bincount(rows, weights * weights, minlength=n))
+    weights /= np.where(norms > 0, norms, 1.0)[rows]
+    return rows, terms, weights, vocab
+
+
+def _top_terms(terms, weights, vocab_list, mask=None, k: int = 15) -> list:
+    if mask is not None:
+        terms, weights = terms[mask], weights[mask]
+    if not len(terms):
+        return []
+    totals = np.bincount(terms, weights, minlength=len(vocab_list))
+    top = np.argsort(-totals)[:k]
+    return [(vocab_list[i], float(totals[i])) for i in top if totals[i] > 0]
+
+
+def build_summary(text: str, max_sentences: int = 15) -> dict:
+    """Zusammenfassung, Schlagworte, Definitionen und Gliederung (ungecacht)."""
+    sources = []
+    sentences, source_of = [], []
+    for idx, (name, body) in enumerate(split_sources(text)):
+        headings, sents = split_sentences(body)
+        sources.append((name, headings, len(sentences), len(sentences) + len(sents)))
+        sentences.extend(sents)
+        source_of.extend([idx] * len(sents))
+
+    result = {"saetze": len(sentences), "zusammenfassung": [], "schlagworte": [], "definitionen": [], "gliederung": []}
+    if not sentences:
+        return result
+
+    token_lists = [tokenize(s) for s in sentences]
+    rows, terms, weights, vocab = tfidf(token_lists)
+    vocab_list = list(vocab)
+    n = len(sentences)
+
+    centroid = np.bincount(terms, weights, minlength=max(len(vocab), 1)).astype(np.float64)
+    norm = np.linalg.norm(centroid)
+    if norm > 0:
+        centroid /= norm
+    scores = np.bincount(rows, weights * centroid[terms], minlength=n).astype(np.float64)
+    # Sehr kurze Sätze (Fragmente, Formeln) abwerten, überlange leicht
+    lengths = np.fromiter((len(t) for t in token_lists), dtype=np.float64, count=n)
+    scores *= np.minimum(1.0, lengths / 6.0) / np.maximum(1.0, lengths / 40.0)
+
+    # 5 % der Sätze, mindestens 3 – ``max_sentences`` (Slider) ist die Obergrenze
+    k = min(max_sentences, max(3, math.ceil(n * 0.05)))
+    chosen, seen = [], set()
+    for i in np.argsort(-scores, kind="stable"):
+        key = sentences[i].lower()
+        if scores[i] <= 0 or key in seen:
+            continue
+        seen.add(key)
+        chosen.append(int(i))
+        if len(chosen) >= k:
+            break
+    result["zusammenfassung"] = [sentences[i] for i in sorted(chosen)]
+    result["schlagworte"] = _top_terms(terms, weights, vocab_list, k=20)
+    result["definitionen"] = extract_definitions(sentences)
+
+    source_rows = np.asarray(source_of, dtype=np.int64)
+    for idx, (name, headings, start, end) in enumerate(sources):
+        best = [int(i) for i in np.argsort(-scores[start:end], kind="stable")[:2] + start if scores[i] > 0]
+        result["gliederung"].append({
+            "datei": name,
+            "saetze": end - start,
+            "ueberschriften": headings[:40],
+            "schlagworte": [t for t, _ in _top_terms(terms, weights, vocab_list, source_rows[rows] == idx, k=8)],
+            "kernsaetze": [sentences[i] for i in sorted(best)],
+        })
+    return result
+
+
+# -------------------------------------------------
+# Cache
+# -------------------------------------------------
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def summarize(text: str, max_sentences: int = 15) -> dict:
+    """Wie ``build_summary``, aber nach Inhalts-Hash gecacht (Ergebnis nicht verändern)."""
+    key = (content_hash(text), max_sentences)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached
+    with profiling.span("lernzettel_summary"):
+        result = build_summary(text, max_sentences)
+    with _cache_lock:
+        _cache[key] = result
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
+
+
+def to_markdown(result: dict) -> str:
+    """Ergebnis als Lernzettel-Text (für das Textfeld bzw. den Word-Export)."""
+    lines = ["# Zusammenfassung", ""]
+    lines += [f"- {s}" for s in result["zusammenfassung"]]
+    if result["schlagworte"]:
+        lines += ["", "# Schlagworte", "", ", ".join(t for t, _ in result["schlagworte"])]
+    if result["definitionen"]:
+        lines += ["", "# Definitionen", ""]
+        lines += [f"- **{term}**: {sentence}" for term, sentence in result["definitionen"]]
+    if result["gliederung"]:
+        lines += ["", "# Gliederung"]
+        for part in result["gliederung"]:
+            lines += ["", f"## {part['datei']}"]
+            lines += [f"- {h}" for h in part["ueberschriften"]]
+            if part["schlagworte"]:
+                lines.append(f"Schlagworte: {', '.join(part['schlagworte'])}")
+    return "\n".join(lines)
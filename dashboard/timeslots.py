@@ -0,0 +1,44 @@
+"""Uhrzeiten aus Freitext-Feldern (``uhrzeit1``/``uhrzeit2``) in Minuten umrechnen."""
+import re
+
+import pandas as pd
+
+# Dauer, wenn nur eine Startzeit angegeben ist (z.B. "10:00")
+DEFAULT_DURATION_MINUTES = 90
+
+_TIME_RE = re.compile(r"(\d{1,2})(?:[:.h](\d{2}))?")
+
+
+def parse_time_range(text, default_minutes: int = DEFAULT_DURATION_MINUTES):
+    """``"10:00–12:00"`` -> ``(600, 720)`` in Minuten ab Mitternacht.
+
+    Versteht u.a. ``10-12``, ``10.15 - 11.45 Uhr`` und einzelne Startzeiten.
+    Gibt ``None`` zurück, wenn keine gültige Zeitspanne erkennbar ist.
+    """
+    if text is None or (isinstance(text, float) and pd.isna(text)):
+        return None
+
+    times = []
+    for h, m in _TIME_RE.findall(str(text)):
+        hour, minute = int(h), int(m or 0)
+        if hour > 24 or minute > 59:
+            continue
+        times.append(hour * 60 + minute)
+        if len(times) == 2:
+            break
+
+    if not times:
+        return None
+    if len(times) == 1:
+        start = times[0]
+        return start, min(start + default_minutes, 24 * 60)
+
+    start, end = times
+    if end <= start:
+        return None
+    return start, end
+
+
+def format_minutes(minutes: int) -> str:
+    """``630`` -> ``"10:30"``."""
+    return f"{int(minutes) // 60:02d}:{int(minutes) % 60:02d}"
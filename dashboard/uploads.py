@@ -0,0 +1,226 @@
+"""Gemeinsame Behandlung hochgeladener Dateien (ohne Streamlit).
+
+Streamlit hält jeden Upload ohnehin als Bytes im Speicher. Früher kamen pro
+Seite weitere Kopien dazu (``.read()``, ``BytesIO(file_bytes)``, ``.decode()``).
+Jetzt läuft jeder Upload einmal durch ``UploadSpool.add()``:
+
+- Größenlimit pro Art (``UPLOAD_LIMITS_MB``) wird vor dem Lesen geprüft.
+- Dateien ab ``SPOOL_THRESHOLD`` Bytes werden stückweise (ohne Kopie über
+  ``getbuffer()``) in einen Temp-Ordner der Session geschrieben und dabei
+  gehasht (SHA-256); Extraktoren und PDF-Merger bekommen den Dateipfad.
+  Kleinere teilen sich die Bytes mit dem Streamlit-Upload.
+- Derselbe Upload wird pro Session nur einmal angenommen; ``retain()`` gibt
+  Dateien frei, die nicht mehr im Uploader stehen.
+- Der Temp-Ordner verschwindet, sobald die Session (und damit der Spool)
+  freigegeben wird, spätestens beim Prozessende. Reste abgestürzter Prozesse
+  räumt ``sweep_stale()`` beim ersten Spool weg.
+
+Konfiguration per Umgebungsvariablen ``DASHBOARD_UPLOAD_MAX_MB`` (deckelt alle
+Limits) und ``DASHBOARD_UPLOAD_SPOOL_KB`` (Schwelle fürs Auslagern). Das
+Gesamtlimit von Streamlit selbst ist ``server.maxUploadSize``.
+"""
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+
+CHUNK_SIZE = 1024 * 1024
+SPOOL_THRESHOLD = int(os.environ.get("DASHBOARD_UPLOAD_SPOOL_KB", "1024")) * 1024
+_MAX_MB = float(os.environ.get("DASHBOARD_UPLOAD_MAX_MB", "200"))
+
+# Limits pro Upload-Art in MB
+UPLOAD_LIMITS_MB = {
+    "lernzettel": min(50, _MAX_MB),
+    "pdf": min(100, _MAX_MB),
+    "stundenplan": min(10, _MAX_MB),
+    "kalender": min(20, _MAX_MB),
+    "backup": min(200, _MAX_MB),
+}
+
+TEMP_PREFIX = "dashboard-upload-"
+STALE_AFTER = 24 * 3600
+
+_sweep_lock = threading.Lock()
+_swept = False
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+class Upload:
+    """Ein angenommener Upload: Name, Größe, Hash und Inhalt (Pfad oder Speicher)."""
+
+    __slots__ = ("name", "size", "sha256", "path", "_data")
+
+    def __init__(self, name: str, size: int, sha256: str, path: str = None, data: bytes = None):
+        self.name = name
+        self.size = size
+        self.sha256 = sha256
+        self.path = path
+        self._data = data
+
+    @property
+    def suffix(self) -> str:
+        return os.path.splitext(self.name)[1].lower()
+
+    def open(self):
+        """Binärer Datei-Handle (auf die Temp-Datei bzw. eine kleine Kopie im Speicher)."""
+        if self.path is not None:
+            return open(self.path, "rb")
+        return io.BytesIO(self._data)
+
+    def source(self):
+        """Für Bibliotheken, die Pfad oder Stream annehmen (PyPDF2, python-docx)."""
+        return self.path if self.path is not None else self.open()
+
+    def text(self, encoding: str = "utf-8") -> str:
+        if self.path is None:
+            return self._data.decode(encoding, errors="ignore")
+        with open(self.path, "r", encoding=encoding, errors="ignore") as f:
+            return f.read()
+
+
+def _chunks(fileobj):
+    """Inhalt stückweise – als Sicht auf den Puffer, wenn möglich (keine Kopie)."""
+    getbuffer = getattr(fileobj, "getbuffer", None)
+    if getbuffer is not None:
+        with getbuffer() as view:
+            for start in range(0, len(view), CHUNK_SIZE):
+                yield view[start:start + CHUNK_SIZE]
+        return
+    fileobj.seek(0)
+    for chunk in iter(lambda: fileobj.read(CHUNK_SIZE), b""):
+        yield chunk
+
+
+def _key(fileobj) -> str:
+    return getattr(fileobj, "file_id", None) or getattr(fileobj, "name", "upload")
+
+
+def _size(fileobj) -> int:
+    size = getattr(fileobj, "size", None)
+    if size is not None:
+        return size
+    pos = fileobj.tell()
+    fileobj.seek(0, os.SEEK_END)
+    size = fileobj.tell()
+    fileobj.seek(pos)
+    return size
+
+
+def sweep_stale(max_age: float = STALE_AFTER, root: str = None) -> int:
+    """Löscht verwaiste Temp-Ordner (z.B. nach einem Absturz); gibt die Anzahl zurück."""
+    root = root or tempfile.gettempdir()
+    removed = 0
+    now = time.time()
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return 0
+    for entry in entries:
+        if not entry.name.startswith(TEMP_PREFIX):
+            continue
+        try:
+            if entry.is_dir() and now - entry.stat().st_mtime > max_age:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def _sweep_once():
+    global _swept
+    with _sweep_lock:
+        if _swept:
+            return
+        _swept = True
+    sweep_stale()
+
+
+class UploadSpool:
+    """Uploads einer Session; ausgelagerte Dateien liegen in einem eigenen Temp-Ordner."""
+
+    def __init__(self, threshold: int = SPOOL_THRESHOLD):
+        self.threshold = threshold
+        self.dir = None
+        self._uploads = {}
+        self._finalizer = None
+
+    def _temp_dir(self) -> str:
+        if self.dir is None:
+            _sweep_once()
+            self.dir = tempfile.mkdtemp(prefix=TEMP_PREFIX)
+            # Läuft beim Freigeben des Spools (Session beendet) oder beim Prozessende
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self.dir, True)
+        return self.dir
+
+    def add(self, fileobj, kind: str) -> Upload:
+        """Nimmt einen Upload der Art ``kind`` an (``UploadTooLarge`` über dem Limit).
+
+        Derselbe Upload (gleiche ``file_id``) wird nur beim ersten Mal gelesen.
+        """
+        key = (kind, _key(fileobj))
+        cached = self._uploads.get(key)
+        if cached is not None:
+            return cached
+
+        name = getattr(fileobj, "name", "upload")
+        limit_mb = UPLOAD_LIMITS_MB.get(kind, _MAX_MB)
+        size = _size(fileobj)
+        if size > limit_mb * 1024 * 1024:
+            raise UploadTooLarge(
+                f"{name} ist {size / 1024 / 1024:.1f} MB groß – erlaubt sind höchstens {limit_mb:g} MB."
+            )
+
+        digest = hashlib.sha256()
+        if size < self.threshold:
+            # getvalue() teilt bei BytesIO die Bytes, statt sie zu kopieren
+            if hasattr(fileobj, "getvalue"):
+                data = fileobj.getvalue()
+            else:
+                fileobj.seek(0)
+                data = fileobj.read()
+            digest.update(data)
+            upload = Upload(name, size, digest.hexdigest(), data=data)
+        else:
+            fd, path = tempfile.mkstemp(suffix=os.path.splitext(name)[1], dir=self._temp_dir())
+            with os.fdopen(fd, "wb") as out:
+                for chunk in _chunks(fileobj):
+                    digest.update(chunk)
+                    out.write(chunk)
+            upload = Upload(name, size, digest.hexdigest(), path=path)
+
+        self._uploads[key] = upload
+        return upload
+
+    def retain(self, kind: str, fileobjs):
+        """Vergisst Uploads der Art, die nicht mehr im Uploader stehen, samt Temp-Dateien."""
+        keep = {(kind, _key(f)) for f in fileobjs}
+        for key in [k for k in self._uploads if k[0] == kind and k not in keep]:
+            upload = self._uploads.pop(key)
+            if upload.path is not None:
+                try:
+                    os.remove(upload.path)
+                except OSError:
+                    pass
+
+    def cleanup(self):
+        self._uploads.clear()
+        if self._finalizer is not None:
+            self._finalizer()
+        self.dir = None
+        self._finalizer = None
+
+    def stats(self) -> dict:
+        spooled = [u for u in self._uploads.values() if u.path is not None]
+        return {
+            "uploads": len(self._uploads),
+            "spooled": len(spooled),
+            "spooled_bytes": sum(u.size for u in spooled),
+        }
@@ -0,0 +1,33 @@
+"""Seiten der App – jede Seite ist ein eigenes Modul mit ``render(today)``.
+
+Ein Seitenmodul wird erst importiert, wenn die Seite zum ersten Mal
+aufgerufen wird. Schwere Abhängigkeiten (PyPDF2, python-docx, Streamlit
+Components, …) liegen in den Modulen, die sie brauchen, und kosten sonst
+weder Kaltstart noch Rerun.
+"""
+import importlib
+
+from dashboard import profiling
+
+# Sidebar-Label -> Modul (Reihenfolge = Reihenfolge in der Sidebar)
+PAGES = {
+    "Tagesübersicht": "tagesuebersicht",
+    "Stundenplan": "stundenplan",
+    "Klausuren & Lernen": "klausuren",
+    "To-Do & Hausaufgaben": "todos",
+    "Seminare & Punkte": "seminare",
+    "Lernplan Woche": "lernplan",
+    "Lernzettel erstellen": "lernzettel",
+    "PDFs zusammenfügen": "pdf_merge",
+    "PDF erstellen": "pdf_tools",
+    "LaTeX": "latex",
+    "Mood-Tracker & Stressradar": "mood",
+}
+
+
+def render_page(page: str, today):
+    """Importiert das Seitenmodul (einmal pro Prozess) und rendert die Seite."""
+    with profiling.span("import"):
+        module = importlib.import_module(f"{__name__}.{PAGES[page]}")
+    with profiling.span(f"page:{PAGES[page]}"):
+        module.render(today)
@@ -0,0 +1,84 @@
+"""🛠️ Verstecktes Admin-Panel (App mit ``?admin=1`` aufrufen): Rerun-Profiler, Store-Cache und Sperren.
+
+Nur für User aus ``DASHBOARD_ADMINS`` (kommagetrennt, Standard: niemand) –
+das Panel schaltet das Profiling für den ganzen Prozess um. Der Pfad des
+JSON-Lines-Logs kommt ausschließlich aus ``DASHBOARD_PROFILE_LOG``.
+"""
+import os
+
+import pandas as pd
+import streamlit as st
+
+from dashboard import folder_index, locking, profiling, shared_store
+
+ADMIN_USERS = frozenset(u.strip() for u in os.environ.get("DASHBOARD_ADMINS", "").split(",") if u.strip())
+
+
+def is_admin(user: str) -> bool:
+    return user in ADMIN_USERS
+
+
+def _on_toggle():
+    # Nur bei einer echten Änderung durch den Admin – ein Rerun ohne Klick schaltet nichts um
+    profiling.set_enabled(st.session_state["admin_profiling"])
+
+
+def render_profiler_panel(user: str):
+    if not is_admin(user):
+        return
+    # Zustand gehört dem Prozess: Toggle bei jedem Rerun daraus setzen (ein anderer Admin kann umgeschaltet haben)
+    aktiv = profiling.is_enabled()
+    st.session_state["admin_profiling"] = aktiv
+    with st.sidebar.expander("🛠️ Profiler", expanded=aktiv):
+        st.toggle("Profiling aktiv", key="admin_profiling", on_change=_on_toggle)
+        log_path = os.environ.get("DASHBOARD_PROFILE_LOG")
+        st.caption(f"JSON-Lines-Log: `{log_path}`" if log_path else "JSON-Lines-Log: aus (`DASHBOARD_PROFILE_LOG` nicht gesetzt)")
+        cache = shared_store.stats()
+        st.caption(
+            f"Geteilte Stores: {cache['users']} User im Speicher · {cache['hits']} Treffer · "
+            f"{cache['misses'] + cache['reloads']} Ladevorgänge · {cache['evicted']} verdrängt · {cache['merges']} Merges"
+        )
+        locks = locking.stats()
+        if locks["acquired"]:
+            st.caption(
+                f"Datei-Sperren: {locks['acquired']}× · {locks['contended']}× gewartet · "
+                f"Ø {locks['wait_ms'] / locks['acquired']:.1f} ms · max {locks['max_wait_ms']:.0f} ms"
+            )
+        index = folder_index.stats()
+        if index["ordner"]:
+            st.caption(
+                f"Lernordner-Index: {index['ordner']} Ordner · {index['scans']} Scans · "
+                f"{index['listed']} Verzeichnisse gelistet, {index['reused']} unverändert · "
+                f"{index['warteschlange']} in der Warteschlange"
+            )
+        spool = st.session_state.get("_upload_spool")
+        if spool is not None:
+            up = spool.stats()
+            st.caption(
+                f"Uploads dieser Session: {up['uploads']} · {up['spooled']} ausgelagert "
+                f"({up['spooled_bytes'] / 1024 / 1024:.1f} MB auf der Platte)"
+            )
+        if not aktiv:
+            st.caption("Aus – einschalten, um Reruns zu messen.")
+            return
+
+        records = profiling.history()
+        st.caption(f"{len(records)} Reruns aufgezeichnet (max. {profiling.HISTORY_SIZE})")
+        if not records:
+            return
+
+        st.markdown("**Perzentile (ms)**")
+        summary = pd.DataFrame(profiling.summary(records)).set_index("span")
+        st.dataframe(summary.round(1), use_container_width=True)
+
+        last = records[-1]
+        st.markdown(f"**Letzter Rerun:** {last['label']} – {last['total_ms']:.1f} ms")
+        if last["spans"]:
+            spans = pd.Series(last["spans"], name="ms").sort_values(ascending=False)
+            st.dataframe(spans.round(1), use_container_width=True)
+        if last["counter"]:
+            st.json(last["counter"])
+
+        if st.button("Historie leeren", key="admin_profiling_clear"):
+            profiling.clear()
+            st.rerun()
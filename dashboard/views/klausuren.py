@@ -0,0 +1,204 @@
+"""2️⃣ Klausuren & Lernen."""
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from dashboard import folder_index
+from dashboard.grades import parse_note, passed
+from dashboard.model import compute_exam_risk
+from dashboard.session import get_grade_stats, load_klausuren, open_path_or_url, safe_rerun, save_klausuren
+
+
+def _format_bytes(n: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def _is_local_folder(path) -> bool:
+    path = str(path or "").strip()
+    return bool(path) and not path.startswith(("http://", "https://"))
+
+
+def render_lernordner(path):
+    """Kurzinfo zum Lernordner aus dem Hintergrund-Index (blockiert nie)."""
+    if not _is_local_folder(path):
+        if str(path or "").strip():
+            st.caption("🔗 Link als Lernordner")
+        return
+    summary = folder_index.folder_summary(path)
+    if summary is None:
+        st.caption("⏳ Ordner wird indiziert …")
+        return
+    if summary["fehler"]:
+        st.caption(f"⚠️ {summary['fehler']}")
+        return
+    text = f"📁 {summary['dateien']} Dateien · {_format_bytes(summary['bytes'])}"
+    if summary["unvollstaendig"]:
+        text += " (nur teilweise erfasst)"
+    st.caption(text)
+    if summary["zuletzt"]:
+        name, _, mtime = summary["zuletzt"][0]
+        st.caption(f"Neu: {name} ({datetime.fromtimestamp(mtime).strftime('%d.%m.%Y')})")
+        with st.expander("Neueste Dateien"):
+            for name, size, mtime in summary["zuletzt"]:
+                st.caption(f"{datetime.fromtimestamp(mtime).strftime('%d.%m. %H:%M')} · {name} · {_format_bytes(size)}")
+
+
+def render_notenstatistik(container):
+    """Kennzahlen aus der fortgeschriebenen Notenstatistik (inkl. Archiv)."""
+    stats = get_grade_stats()
+    if not stats.graded:
+        return
+    container.subheader("🎓 Notenstatistik")
+    col1, col2, col3, col4 = container.columns(4)
+    col1.metric("Ø Punkte (ECTS-gewichtet)" if stats.gewichtet else "Ø Punkte", f"{stats.schnitt:.2f}")
+    col2.metric("Bestanden", f"{stats.bestehensquote:.0%}", help=f"{stats.passed} von {stats.graded} benoteten Klausuren")
+    col3.metric("ECTS erreicht", f"{stats.ects_passed:g}")
+    col4.metric("Benotet", stats.graded)
+    if stats.gewichtet:
+        container.caption("Klausuren ohne ECTS zählen im gewichteten Schnitt nicht mit.")
+
+    with container.expander("Verteilung & Verlauf pro Semester"):
+        verteilung = pd.Series(stats.verteilung_punkte(), name="Klausuren")
+        verteilung.index.name = "Punkte"
+        st.bar_chart(verteilung)
+        verlauf = pd.DataFrame(stats.verlauf(), columns=["Semester", "Ø Punkte", "Klausuren"])
+        if not verlauf.empty:
+            st.dataframe(verlauf.set_index("Semester").round(2), use_container_width=True)
+
+
+def render(today):
+    st.title("📝 Klausuren & Lernen")
+    # Wird erst nach dem Speichern gefüllt, damit neue Noten sofort mitzählen
+    statistik = st.container()
+
+    view = st.radio("Ansicht", ["Aktive Klausuren", "Archiv"])
+    # Alte archivierte Klausuren liegen in Jahres-Shards und werden nur fürs Archiv gelesen
+    mit_archiv = view == "Archiv"
+    klausuren = load_klausuren(mit_archiv=mit_archiv)
+    df_view = klausuren[~klausuren["archiviert"]] if view == "Aktive Klausuren" else klausuren[klausuren["archiviert"]]
+
+    if df_view.empty:
+        st.info("Keine Klausuren in dieser Ansicht.")
+    else:
+        for idx, row in df_view.sort_values("datum", na_position="last").iterrows():
+            st.markdown("---")
+            col1, col2 = st.columns([2, 1])
+
+            with col1:
+                st.subheader(f"📌 {row['fach']}")
+                if pd.notna(row["datum"]):
+                    st.write(f"**Datum:** {row['datum'].strftime('%d.%m.%Y')}")
+                    days_until = (row["datum"] - today).days
+                    st.write(f"**Noch:** {days_until} Tag(e)")
+                else:
+                    st.write("**Datum:** -")
+
+                if not row["archiviert"]:
+                    ziel = st.number_input(
+                        "Geplante Lernstunden insgesamt",
+                        min_value=0.0, max_value=500.0, step=0.5,
+                        value=float(row.get("ziel_stunden", 0.0) or 0.0),
+                        key=f"ziel_{idx}",
+                    )
+                    gelernt = st.number_input(
+                        "Bisher gelernte Stunden",
+                        min_value=0.0, max_value=500.0, step=0.5,
+                        value=float(row.get("gelernt_stunden", 0.0) or 0.0),
+                        key=f"gelernt_{idx}",
+                    )
+                    klausuren.at[idx, "ziel_stunden"] = ziel
+                    klausuren.at[idx, "gelernt_stunden"] = gelernt
+
+                    if ziel > 0:
+                        progress = max(min(gelernt / ziel, 1.0), 0.0)
+                        st.write("**Lernfortschritt:**")
+                        st.progress(progress)
+                        st.write(f"{gelernt:.1f} / {ziel:.1f} Stunden")
+
+                        risk, msg = compute_exam_risk(klausuren.loc[idx], today)
+                        if risk == "grün":
+                            st.success(msg)
+                        elif risk == "gelb":
+                            st.warning(msg)
+                        elif risk == "rot":
+                            st.error(msg)
+                        else:
+                            st.info(msg)
+                    else:
+                        st.info("Noch keine geplanten Lernstunden hinterlegt.")
+
+                    new_tage = st.number_input(
+                        "Empfohlene Tage vorher zu lernen",
+                        min_value=1, max_value=180,
+                        value=int(row["tage_vorher"]),
+                        key=f"tage_{idx}",
+                    )
+                    klausuren.at[idx, "tage_vorher"] = new_tage
+                else:
+                    note = st.number_input(
+                        "Note (0–15):",
+                        min_value=0.0, max_value=15.0,
+                        value=parse_note(row.get("note")), step=0.5,
+                        placeholder="noch keine Note",
+                        key=f"note_{idx}",
+                    )
+                    # Leer lassen, solange keine Note da ist – sonst zählt die Klausur als 0 Punkte
+                    klausuren.at[idx, "note"] = "" if note is None else str(note)
+                    ects = st.number_input(
+                        "ECTS",
+                        min_value=0.0, max_value=60.0, step=0.5,
+                        value=float(row.get("ects", 0.0) or 0.0),
+                        key=f"ects_{idx}",
+                    )
+                    klausuren.at[idx, "ects"] = ects
+
+                    if note is None:
+                        st.info("Noch keine Note eingetragen.")
+                    elif passed(note):
+                        st.success("Bestanden 🎉")
+                    else:
+                        st.error("Nicht bestanden ❌")
+
+            with col2:
+                st.write("**Aktionen:**")
+                if st.button("Ordner öffnen", key=f"ordner_{idx}"):
+                    open_path_or_url(row["lernordner"])
+                render_lernordner(row["lernordner"])
+
+                if not row["archiviert"]:
+                    if st.button("Archivieren", key=f"archiv_{idx}"):
+                        klausuren.at[idx, "archiviert"] = True
+                        save_klausuren(klausuren, mit_archiv=mit_archiv)
+                        safe_rerun()
+                else:
+                    if st.button("Löschen", key=f"del_{idx}"):
+                        klausuren = klausuren.drop(idx).reset_index(drop=True)
+                        save_klausuren(klausuren, mit_archiv=mit_archiv)
+                        safe_rerun()
+
+        save_klausuren(klausuren, mit_archiv=mit_archiv)
+
+    render_notenstatistik(statistik)
+
+    st.markdown("---")
+    st.subheader("➕ Neue Klausur")
+
+    new_fach = st.text_input("Fach")
+    new_datum = st.date_input("Datum", value=today)
+    new_ordner = st.text_input("Lernordner")
+    new_tage = st.number_input("Tage vorher", min_value=1, max_value=180, value=21)
+    new_ziel = st.number_input("Geplante Lernstunden (optional)", min_value=0.0, max_value=500.0, step=0.5, value=0.0)
+    new_ects = st.number_input("ECTS (optional)", min_value=0.0, max_value=60.0, step=0.5, value=0.0)
+
+    if st.button("Klausur speichern"):
+        klausuren.loc[len(klausuren)] = [
+            new_fach, new_datum, new_ordner, int(new_tage),
+            False, "", float(new_ziel), 0.0, float(new_ects)
+        ]
+        save_klausuren(klausuren, mit_archiv=mit_archiv)
+        st.success("Klausur wurde hinzugefügt!")
+        safe_rerun()
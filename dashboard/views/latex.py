@@ -0,0 +1,58 @@
+"""9️⃣ LaTeX – kurz erklärt & Formelsammlung."""
+import streamlit as st
+
+from dashboard.latex_library import load_library, search
+
+LATEX_PAGE_SIZE = 10
+TYP_LABELS = {"Alle": None, "Text, Titel & Listen": "text", "Formeln": "formel"}
+
+
+def render(today):
+    st.title("📐 LaTeX – kurz erklärt & Formelsammlung")
+
+    st.subheader("👀 Was ist LaTeX?")
+    st.markdown(
+        r"""
+LaTeX ist ein Textsatzsystem für **wissenschaftliche Arbeiten** (z.B. Bachelorarbeit, Hausarbeiten, Paper).
+
+Statt mit der Maus zu formatieren (wie in Word), schreibst du **Befehle im Text**, z.B.:
+
+Inline-Formel im Text: `$E = mc^2$`  
+Zentrierte Formel: `\[ E = mc^2 \]`
+
+LaTeX ist besonders stark, wenn du:
+- viele **Formeln** hast
+- ein sauberes **Inhaltsverzeichnis** brauchst
+- automatisch ein **Literaturverzeichnis** erzeugen willst
+"""
+    )
+
+    st.markdown("---")
+    st.subheader("📝 Snippets & 🧮 Formelsammlung")
+
+    col_q, col_t = st.columns([2, 1])
+    with col_q:
+        query = st.text_input("🔎 Suchen (Titel/Beschreibung)", key="latex_query")
+    with col_t:
+        typ_label = st.selectbox("Art", list(TYP_LABELS.keys()), key="latex_typ")
+
+    library = load_library()
+    hits = search(query, TYP_LABELS[typ_label])
+
+    if not hits:
+        st.info("Keine passenden Einträge gefunden.")
+    else:
+        n_pages = (len(hits) - 1) // LATEX_PAGE_SIZE + 1
+        seite = st.number_input(f"Seite (von {n_pages})", min_value=1, max_value=n_pages, value=1, key="latex_page")
+        st.caption(f"{len(hits)} Einträge")
+
+        for i in hits[(seite - 1) * LATEX_PAGE_SIZE : seite * LATEX_PAGE_SIZE]:
+            entry = library[i]
+            with st.expander(f"{entry['title']} – {entry['desc']}"):
+                if entry.get("typ") == "formel":
+                    st.latex(entry["latex"])
+                    st.markdown("LaTeX-Code:")
+                st.code(entry["latex"], language="latex")
+
+    st.markdown("---")
+    st.info("Tipp: Inline-Formeln: `$ ... $`, Blockformeln: `\\[ ... \\]`")
@@ -0,0 +1,102 @@
+"""5️⃣ Lernplan Woche."""
+from datetime import timedelta
+
+import pandas as pd
+import streamlit as st
+
+from dashboard.scheduler import SLOT_MINUTES, WEEKDAYS, busy_intervals, schedule_week, week_start_of
+from dashboard.session import load_klausuren, load_lernplan, load_seminare, load_vorlesungen, safe_rerun, save_lernplan
+
+
+def render(today):
+    lernplan = load_lernplan()
+
+    st.title("📆 Lernplan für die Woche")
+
+    if lernplan.empty:
+        st.info("Noch kein Lernplan angelegt. Füge unten Fächer hinzu.")
+    else:
+        st.subheader("📚 Übersicht Lernfächer")
+
+        delete_idx = None
+        for idx, row in lernplan.iterrows():
+            c1, c2, c3, c4 = st.columns([2, 1, 1, 0.5])
+            with c1:
+                fach_val = st.text_input("Fach", value=row["fach"], key=f"lp_fach_{idx}")
+                lernplan.at[idx, "fach"] = fach_val
+            with c2:
+                stunden_val = st.number_input(
+                    "Stunden/Woche",
+                    min_value=0.0, max_value=50.0, step=0.5,
+                    value=float(row["stunden_pro_woche"]),
+                    key=f"lp_stunden_{idx}",
+                )
+                lernplan.at[idx, "stunden_pro_woche"] = stunden_val
+            with c3:
+                prio_val = st.selectbox(
+                    "Priorität (1=hoch,3=niedrig)",
+                    [1, 2, 3],
+                    index={1: 0, 2: 1, 3: 2}[int(row["priorität"]) if row["priorität"] in [1, 2, 3] else 1],
+                    key=f"lp_prio_{idx}",
+                )
+                lernplan.at[idx, "priorität"] = prio_val
+            with c4:
+                if st.button("🗑️", key=f"lp_del_{idx}"):
+                    delete_idx = idx
+
+        if delete_idx is not None:
+            lernplan = lernplan.drop(delete_idx).reset_index(drop=True)
+
+        save_lernplan(lernplan)
+
+        st.markdown("---")
+        st.subheader("📊 Geplante Gesamtstunden pro Woche")
+        total_hours = lernplan["stunden_pro_woche"].sum()
+        st.write(f"**Summe:** {total_hours:.1f} Stunden/Woche")
+
+        st.markdown("### Vorschlag: Lernblöcke für die Woche")
+        st.caption(
+            "Verteilt die Stunden nach Priorität und Nähe der Klausur auf freie Zeitfenster "
+            "(Mo–Sa, 8–20 Uhr). Vorlesungen, Seminartermine und Klausurtage bleiben frei."
+        )
+
+        klausuren = load_klausuren()
+        plan_datum = st.date_input("Woche", value=today, key="lp_woche")
+        week_start = week_start_of(plan_datum)
+        plan, nicht_verplant = schedule_week(
+            lernplan, klausuren, busy_intervals(load_seminare(), klausuren, load_vorlesungen()), week_start
+        )
+
+        plan_rows = []
+        for i, d in enumerate(WEEKDAYS):
+            day_blocks = plan[plan["tag"] == d]
+            bloecke = ", ".join(f"{r['start']}–{r['ende']} {r['fach']}" for _, r in day_blocks.iterrows())
+            plan_rows.append(
+                {
+                    "Tag": f"{d} ({(week_start + timedelta(days=i)).strftime('%d.%m.')})",
+                    "Geplante Lernstunden": f"{len(day_blocks) * SLOT_MINUTES / 60:.1f} h",
+                    "Lernblöcke": bloecke or "-",
+                }
+            )
+        st.table(pd.DataFrame(plan_rows))
+
+        if nicht_verplant:
+            rest = ", ".join(f"{f}: {h:.1f} h" for f, h in nicht_verplant.items())
+            st.warning(f"Kein freier Slot mehr für: {rest}")
+
+    st.markdown("---")
+    st.subheader("➕ Neues Fach zum Lernplan hinzufügen")
+
+    lp_fach = st.text_input("Fachname")
+    lp_stunden = st.number_input("Stunden pro Woche", min_value=0.0, max_value=50.0, step=0.5, value=0.0)
+    lp_prio = st.selectbox("Priorität", [1, 2, 3], help="1 = sehr wichtig, 3 = weniger wichtig")
+
+    if st.button("Fach zum Lernplan hinzufügen"):
+        if not lp_fach.strip():
+            st.warning("Bitte Fachname eintragen.")
+        else:
+            new_row = {"fach": lp_fach.strip(), "stunden_pro_woche": float(lp_stunden), "priorität": int(lp_prio)}
+            lernplan = pd.concat([lernplan, pd.DataFrame([new_row])], ignore_index=True)
+            save_lernplan(lernplan)
+            st.success("Fach zum Lernplan hinzugefügt.")
+            safe_rerun()
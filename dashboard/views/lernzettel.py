@@ -0,0 +1,120 @@
+"""6️⃣ Lernzettel erstellen."""
+import PyPDF2
+import streamlit as st
+from docx import Document
+
+from dashboard.docx_export import DOCX_MIME, lernzettel_docx
+from dashboard.session import accept_uploads, user_file
+from dashboard.summarize import summarize, to_markdown
+
+
+# -------------------------------------------------
+# Datei-Extraktion für Lernzettel
+# -------------------------------------------------
+def extract_text_from_file(upload):
+    """Text aus einem ``Upload`` (dashboard.uploads) – große Dateien werden vom Pfad gelesen."""
+    if upload.suffix == ".txt":
+        return upload.text()
+
+    if upload.suffix == ".docx":
+        try:
+            doc = Document(upload.source())
+            return "\n".join(p.text for p in doc.paragraphs)
+        except Exception as e:
+            return f"(Fehler beim Lesen der Word-Datei: {e})"
+
+    if upload.suffix == ".pdf":
+        try:
+            reader = PyPDF2.PdfReader(upload.source())
+            return "".join(page.extract_text() or "" for page in reader.pages)
+        except Exception:
+            return "(PDF konnte nicht gelesen werden)"
+
+    return "(Dateiformat nicht unterstützt)"
+
+
+def render(today):
+    st.title("🧠 Lernzettel erstellen")
+
+    uploaded_files = st.file_uploader(
+        "Dateien hochladen (PDF, DOCX, TXT)",
+        type=["pdf", "docx", "txt"],
+        accept_multiple_files=True,
+    )
+    uploads = accept_uploads(uploaded_files, "lernzettel")
+
+    if uploads:
+        st.info(f"{len(uploads)} Datei(en) ausgewählt.")
+        if st.button("📘 Dokumente zusammenführen"):
+            combined = ""
+            for upload in uploads:
+                text = extract_text_from_file(upload)
+                combined += f"\n\n##### Datei: {upload.name} #####\n\n{text}"
+            st.session_state["combined_text"] = combined
+
+    if "combined_text" in st.session_state:
+        st.subheader("📄 Zusammengeführtes Dokument")
+        st.info("Bearbeite den Text, bevor du ihn an eine KI weitergibst.")
+
+        edited = st.text_area("Dokument bearbeiten:", st.session_state["combined_text"], height=350)
+        st.session_state["combined_text"] = edited
+
+        st.markdown("---")
+        st.subheader("🧾 Lokal zusammenfassen (offline)")
+        st.caption("Extraktiv per TF-IDF – der Text verlässt den Rechner nicht.")
+        anzahl = st.slider("Sätze in der Zusammenfassung", 5, 40, 15, key="lernzettel_summary_len")
+        if st.button("🔎 Zusammenfassung, Schlagworte & Gliederung erstellen"):
+            st.session_state["lernzettel_summary"] = True
+
+        if st.session_state.get("lernzettel_summary") and edited.strip():
+            # Nach Inhalts-Hash gecacht: Reruns ohne Textänderung kosten nichts
+            result = summarize(edited, anzahl)
+            st.markdown(f"**{len(result['zusammenfassung'])} von {result['saetze']} Sätzen**")
+            for sentence in result["zusammenfassung"]:
+                st.markdown(f"- {sentence}")
+            if result["schlagworte"]:
+                st.markdown("**Schlagworte:** " + ", ".join(t for t, _ in result["schlagworte"]))
+            if result["definitionen"]:
+                with st.expander(f"📖 Definitionen ({len(result['definitionen'])})"):
+                    for term, sentence in result["definitionen"]:
+                        st.markdown(f"- **{term}**: {sentence}")
+            with st.expander("🗂️ Gliederung pro Datei"):
+                for part in result["gliederung"]:
+                    st.markdown(f"**{part['datei']}** – {part['saetze']} Sätze")
+                    for heading in part["ueberschriften"]:
+                        st.markdown(f"- {heading}")
+                    if part["schlagworte"]:
+                        st.caption("Schlagworte: " + ", ".join(part["schlagworte"]))
+                    for sentence in part["kernsaetze"]:
+                        st.caption(f"› {sentence}")
+            if st.button("📋 Als Lernzettel übernehmen"):
+                st.session_state["combined_text"] = to_markdown(result)
+                st.session_state["lernzettel_summary"] = False
+                st.rerun()
+
+        st.markdown("---")
+        st.subheader("🤖 Mit KI weiterarbeiten")
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.link_button("➡️ ChatGPT", "https://chat.openai.com/")
+        with col2:
+            st.link_button("➡️ DeepSeek", "https://chat.deepseek.com/")
+        with col3:
+            st.link_button("➡️ Gemini", "https://gemini.google.com/app")
+
+        st.info(
+            'Tipp: Schreibe z. B.: "Bitte strukturiere den Text als Lernzettel mit '
+            'Definitionen, Beispielen und Eselsbrücken."'
+        )
+
+        # Ein Klick: gebaut wird erst beim Download, pro Inhalt nur einmal (Cache im User-Ordner)
+        text = st.session_state["combined_text"]
+        cache_dir = user_file("cache")
+        st.download_button(
+            "📥 Dokument als Word (.docx) herunterladen",
+            data=lambda: lernzettel_docx(text, cache_dir),
+            file_name="lernzettel.docx",
+            mime=DOCX_MIME,
+            on_click="ignore",
+        )
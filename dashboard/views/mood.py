@@ -0,0 +1,153 @@
+"""8️⃣ Mood-Tracker & Stressradar."""
+from datetime import timedelta
+
+import pandas as pd
+import streamlit as st
+
+from dashboard import archive
+from dashboard.mood_chart import MOOD_RANGES, mood_chart_data
+from dashboard.session import (
+    get_mood_pyramid,
+    load_klausuren,
+    load_mood,
+    load_seminare,
+    load_todos,
+    safe_rerun,
+    save_mood,
+)
+from dashboard.workload import FORECAST_COLS, peak_days, workload_forecast
+
+
+def render(today):
+    st.title("🌟 Mood-Tracker & Stressradar")
+
+    mood_df = load_mood()
+
+    st.subheader("📅 Heutiger Eintrag")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        datum = st.date_input("Datum", value=today)
+    with col2:
+        stimmung = st.slider("Stimmung (1 = schlecht, 10 = top)", 1, 10, 7)
+    with col3:
+        stress = st.slider("Stresslevel (1 = entspannt, 10 = extrem)", 1, 10, 5)
+
+    schlaf = st.slider("Schlaf letzte Nacht (Stunden)", 0.0, 12.0, 7.0, 0.5)
+    notiz = st.text_area("Notiz (optional)", "")
+
+    if st.button("Eintrag speichern"):
+        new_row = {"datum": datum, "stimmung": stimmung, "stress": stress, "schlaf": schlaf, "notiz": notiz}
+        mood_df = pd.concat([mood_df, pd.DataFrame([new_row])], ignore_index=True)
+        save_mood(mood_df)
+        st.success("Eintrag gespeichert!")
+        safe_rerun()
+
+    st.markdown("---")
+    st.subheader("📊 Verlauf")
+
+    if not mood_df.empty:
+        range_label = st.radio("Zeitraum", list(MOOD_RANGES.keys()), horizontal=True, key="mood_range")
+        days = MOOD_RANGES[range_label]
+        if archive.hot_covers("mood", days):
+            pyramid = get_mood_pyramid(mood_df)
+        else:
+            # Lange Zeiträume reichen ins Archiv (alte Einträge liegen in Jahres-Shards)
+            pyramid = get_mood_pyramid(load_mood(mit_archiv=True), mit_archiv=True)
+        chart_data, aufloesung = mood_chart_data(pyramid, today, days)
+
+        if not chart_data.empty:
+            st.line_chart(chart_data)
+            st.caption(f"Auflösung: {aufloesung} · {len(chart_data)} Punkte")
+        else:
+            st.info("Keine Einträge in diesem Zeitraum.")
+
+        mood_df = mood_df.sort_values("datum")
+        last_days = mood_df[mood_df["datum"] >= (today - timedelta(days=14))]
+
+        if not last_days.empty:
+            st.markdown("### Letzte Einträge (14 Tage)")
+            st.dataframe(last_days.tail(20), use_container_width=True)
+
+        st.markdown("---")
+        st.subheader("🗑️ Falschen Eintrag löschen")
+
+        mood_df_sorted = mood_df.sort_values("datum", ascending=False).reset_index().rename(columns={"index": "orig_index"})
+
+        options = [
+            f"{row['datum'].strftime('%d.%m.%Y')} – Stimmung: {row['stimmung']}/10, "
+            f"Stress: {row['stress']}/10, Schlaf: {row['schlaf']}h"
+            for _, row in mood_df_sorted.iterrows()
+        ]
+
+        selected_label = st.selectbox(
+            "Eintrag auswählen, der gelöscht werden soll:",
+            ["(kein Eintrag ausgewählt)"] + options,
+        )
+
+        if selected_label != "(kein Eintrag ausgewählt)":
+            selected_idx = options.index(selected_label)
+            row_to_delete = mood_df_sorted.iloc[selected_idx]
+
+            st.warning(f"Du bist dabei, den Eintrag vom {row_to_delete['datum'].strftime('%d.%m.%Y')} zu löschen.")
+
+            if st.button("❌ Ausgewählten Eintrag wirklich löschen"):
+                orig_index = int(row_to_delete["orig_index"])
+                mood_df = mood_df.drop(index=orig_index).reset_index(drop=True)
+                save_mood(mood_df)
+                st.success("Eintrag wurde gelöscht.")
+                safe_rerun()
+
+        st.markdown("---")
+        st.subheader("🧠 Analyse & Hinweise")
+
+        latest = mood_df.iloc[-1]
+        l_stress = latest["stress"]
+        l_schlaf = latest["schlaf"]
+        l_stimmung = latest["stimmung"]
+
+        if l_stress >= 8 and l_schlaf <= 5:
+            st.error("Sehr hoher Stress und wenig Schlaf.\n\n👉 Versuche heute bewusst Pausen zu machen & früher zu schlafen.")
+        elif l_stress >= 7:
+            st.warning("Dein Stresslevel ist aktuell hoch.\n\n👉 Plane kleine Pausen ein.")
+        elif l_stimmung <= 4:
+            st.info("Deine Stimmung ist etwas im Keller.\n\n👉 Vielleicht hilft Bewegung/Musik/reden.")
+        else:
+            st.success("Alles im grünen Bereich – gute Voraussetzungen fürs Lernen! 💪")
+    else:
+        st.info("Noch keine Mood-Daten vorhanden. Mach oben deinen ersten Eintrag.")
+
+    st.markdown("---")
+    st.subheader("🔮 Stressradar – Belastungsprognose")
+    st.caption(
+        "Offene Lernstunden der Klausuren (verteilt auf das Lernfenster), fällige To-Dos "
+        "und Seminartage – geschätzte Stunden pro Tag."
+    )
+
+    weeks = st.slider("Prognose (Wochen)", 1, 26, 4, key="forecast_weeks")
+    forecast = workload_forecast(load_klausuren(), load_todos(), load_seminare(), today, weeks=weeks)
+
+    col_f1, col_f2 = st.columns([2, 1])
+    with col_f1:
+        if forecast["gesamt"].sum() > 0:
+            st.bar_chart(forecast[FORECAST_COLS])
+        else:
+            st.info("Keine anstehende Belastung im gewählten Zeitraum. 🌴")
+
+    with col_f2:
+        st.markdown("**Spitzentage:**")
+        peaks = peak_days(forecast)
+        if peaks.empty:
+            st.write("-")
+        for d, row in peaks.iterrows():
+            st.write(f"- {d.strftime('%a, %d.%m.%Y')}: **{row['gesamt']:.1f} h**")
+
+        if not mood_df.empty:
+            recent = mood_df[mood_df["datum"] >= (today - timedelta(days=7))]["stress"]
+            before = mood_df[
+                (mood_df["datum"] < (today - timedelta(days=7)))
+                & (mood_df["datum"] >= (today - timedelta(days=14)))
+            ]["stress"]
+            if not recent.empty:
+                delta = f"{recent.mean() - before.mean():+.1f}" if not before.empty else None
+                st.metric("Ø Stress (7 Tage)", f"{recent.mean():.1f}/10", delta=delta, delta_color="inverse")
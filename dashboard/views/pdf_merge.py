@@ -0,0 +1,44 @@
+"""7️⃣ PDFs zusammenfügen."""
+from io import BytesIO
+
+import PyPDF2
+import streamlit as st
+
+from dashboard.session import accept_uploads
+
+
+def render(today):
+    st.title("📚 PDFs zusammenfügen")
+
+    uploaded_pdfs = st.file_uploader(
+        "Mehrere PDF-Dateien auswählen, die zu einer zusammengefügt werden sollen:",
+        type=["pdf"],
+        accept_multiple_files=True,
+    )
+    uploads = accept_uploads(uploaded_pdfs, "pdf")
+
+    if uploads:
+        st.info(f"{len(uploads)} PDF-Datei(en) ausgewählt.")
+
+        if st.button("📎 PDFs zu einer Datei zusammenfügen"):
+            merger = PyPDF2.PdfMerger()
+            for upload in uploads:
+                try:
+                    # Große Dateien liegen ausgelagert auf der Platte – PyPDF2 liest dann vom Pfad
+                    merger.append(upload.source())
+                except Exception:
+                    st.error(f"Fehler beim Verarbeiten von {upload.name}")
+            out_buffer = BytesIO()
+            merger.write(out_buffer)
+            merger.close()
+            out_buffer.seek(0)
+
+            st.success("PDFs wurden erfolgreich zusammengefügt.")
+            st.download_button(
+                "📄 Zusammengeführte PDF herunterladen",
+                out_buffer,
+                file_name="zusammengefuegt.pdf",
+                mime="application/pdf",
+            )
+    else:
+        st.info("Bitte wähle mindestens zwei PDFs aus.")
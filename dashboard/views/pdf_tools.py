@@ -0,0 +1,18 @@
+"""7.5 🧾 PDF erstellen (externes Tool)."""
+import streamlit as st
+
+
+def render(today):
+    st.title("🧾 PDF erstellen")
+
+    st.write(
+        "Zum Erstellen, Konvertieren und Bearbeiten von PDFs nutzt dieses Dashboard "
+        "das externe Tool **PDF24**."
+    )
+
+    st.link_button("➡️ PDF24 öffnen", "https://tools.pdf24.org/de/")
+
+    st.caption(
+        "Der Link öffnet sich in einem neuen Tab. Dort kannst du PDFs z.B. erstellen, "
+        "zusammenfügen, komprimieren oder in andere Formate umwandeln."
+    )
@@ -0,0 +1,151 @@
+"""4️⃣ Seminare & Punkte."""
+import pandas as pd
+import streamlit as st
+
+from dashboard.intervals import build_index, dated_intervals, describe_interval, seminar_intervals
+from dashboard.session import load_klausuren, load_seminare, load_vorlesungen, safe_rerun, save_seminare
+
+
+def render(today):
+    seminare = load_seminare()
+    klausuren = load_klausuren()
+
+    st.title("🎓 Seminare & Punkte")
+
+    if seminare.empty:
+        total_all = 0.0
+        total_done = 0.0
+    else:
+        total_all = seminare["punkte"].sum()
+        total_done = seminare.loc[seminare["absolviert"], "punkte"].sum()
+
+    col_a, col_b = st.columns(2)
+    with col_a:
+        st.metric("Gesamtpunkte (alle Seminare)", f"{total_all:.1f}")
+    with col_b:
+        st.metric("Gesammelte Punkte (absolvierte Seminare)", f"{total_done:.1f}")
+
+    st.markdown("---")
+    st.subheader("📋 Seminarübersicht")
+
+    sem_index, sem_konflikte = build_index(dated_intervals(seminare, klausuren, load_vorlesungen()))
+
+    if seminare.empty:
+        st.info("Trage unten dein erstes Seminar ein.")
+    else:
+        delete_idx = None
+
+        for idx, row in seminare.sort_values("datum", na_position="last").iterrows():
+            st.markdown("---")
+            c1, c2, c3, c4 = st.columns([2, 1, 1, 0.5])
+
+            with c1:
+                st.write(f"**Titel:** {row['titel']}")
+
+                if pd.notna(row["datum"]):
+                    line1 = row["datum"].strftime("%d.%m.%Y")
+                    if row.get("uhrzeit1", ""):
+                        line1 += f", {row['uhrzeit1']}"
+                    st.write(f"**Termin 1:** {line1}")
+                else:
+                    st.write("**Termin 1:** -")
+
+                datum2_val = row.get("datum2", pd.NaT)
+                if pd.notna(datum2_val):
+                    d2_str = datum2_val.strftime("%d.%m.%Y")
+                    if row.get("uhrzeit2", ""):
+                        d2_str += f", {row['uhrzeit2']}"
+                    st.write(f"**Termin 2:** {d2_str}")
+
+                notiz_str = str(row.get("notiz", "") or "").strip()
+                st.write(f"**Notiz:** {notiz_str if notiz_str else '-'}")
+
+                konflikte = sem_konflikte.get(("seminar", idx))
+                if konflikte:
+                    st.warning("⚠️ Überschneidung mit: " + ", ".join(sorted(set(konflikte))))
+
+            with c2:
+                punkte_val = st.number_input(
+                    "Punkte",
+                    min_value=0.0, max_value=30.0, step=0.5,
+                    value=float(row["punkte"]),
+                    key=f"sem_punkte_{idx}",
+                )
+                seminare.at[idx, "punkte"] = punkte_val
+
+            with c3:
+                absolviert_val = st.checkbox(
+                    "Absolviert?",
+                    value=bool(row["absolviert"]),
+                    key=f"sem_done_{idx}",
+                )
+                seminare.at[idx, "absolviert"] = absolviert_val
+
+            with c4:
+                if st.button("🗑️", key=f"sem_del_{idx}"):
+                    delete_idx = idx
+
+        if delete_idx is not None:
+            seminare = seminare.drop(delete_idx).reset_index(drop=True)
+
+        save_seminare(seminare)
+
+    st.markdown("---")
+    st.subheader("➕ Neues Seminar hinzufügen")
+
+    if st.session_state.get("sem_conflict_msg"):
+        st.warning(st.session_state.pop("sem_conflict_msg"))
+
+    new_titel = st.text_input("Titel des Seminars")
+
+    col_d1, col_d2 = st.columns(2)
+    with col_d1:
+        new_datum = st.date_input("Datum – Termin 1", value=today)
+    with col_d2:
+        new_uhrzeit1 = st.text_input("Uhrzeit – Termin 1 (z.B. 10:00–12:00)", value="")
+
+    second_day = st.checkbox("Seminar hat einen zweiten Termin?", value=False)
+
+    new_datum2 = pd.NaT
+    new_uhrzeit2 = ""
+    if second_day:
+        col_d3, col_d4 = st.columns(2)
+        with col_d3:
+            new_datum2 = st.date_input("Datum – Termin 2", value=today)
+        with col_d4:
+            new_uhrzeit2 = st.text_input("Uhrzeit – Termin 2", value="")
+
+    new_notiz = st.text_area("Notiz (Raum/Link/Anbieter/…)", value="")
+
+    new_punkte = st.number_input("Punkte", min_value=0.0, max_value=30.0, step=0.5, value=0.0)
+    new_done = st.checkbox("Bereits absolviert?", value=False)
+
+    if st.button("Seminar speichern"):
+        if not new_titel.strip():
+            st.warning("Bitte einen Seminartitel eingeben.")
+        else:
+            new_row = {
+                "titel": new_titel.strip(),
+                "datum": new_datum,
+                "uhrzeit1": new_uhrzeit1.strip(),
+                "datum2": new_datum2 if second_day else pd.NaT,
+                "uhrzeit2": new_uhrzeit2.strip() if second_day else "",
+                "notiz": new_notiz.strip(),
+                "punkte": float(new_punkte),
+                "absolviert": bool(new_done),
+            }
+            hits = []
+            for s, e, label in seminar_intervals(
+                new_row["titel"], new_row["datum"], new_row["uhrzeit1"], new_row["datum2"], new_row["uhrzeit2"]
+            ):
+                for o_start, o_end, (other_label, _) in sem_index.overlapping(s, e):
+                    hits.append(f"{label} ↔ {other_label} ({describe_interval(max(s, o_start), min(e, o_end))})")
+            if hits:
+                st.session_state["sem_conflict_msg"] = "⚠️ Seminar gespeichert, aber es gibt Überschneidungen:\n\n" + "\n".join(
+                    f"- {h}" for h in hits
+                )
+
+            seminare = pd.concat([seminare, pd.DataFrame([new_row])], ignore_index=True)
+            save_seminare(seminare)
+            st.success("Seminar hinzugefügt.")
+            safe_rerun()
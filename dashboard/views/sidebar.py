@@ -0,0 +1,130 @@
+"""Sidebar: Backup, Analytics-Export, Restore und Snapshots.
+
+Die schweren Teile (ZIP-Bau, pyarrow, Restore-Parser) werden erst beim
+Klick bzw. Upload importiert.
+"""
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from dashboard import archive
+from dashboard.session import accept_uploads, get_user_data_dir, safe_rerun, save_store
+from dashboard.snapshots import list_snapshots, restore_point, snapshot_locked
+from dashboard.schema import ARCHIVE_KEY
+from dashboard.store import normalize_store
+
+
+def render_sidebar(store: dict, user: str):
+    # ✅ UPGRADE: Backup/Restore in Sidebar
+    st.sidebar.divider()
+    st.sidebar.subheader("💾 Backup / Restore")
+
+    # Backup wird erst auf Knopfdruck gebaut und pro Store- und Archiv-Stand gecacht
+    # (Archiv-Ansicht und monatliches Archivieren ändern nur die Shards)
+    backup_rev = (st.session_state.get("store_rev", 0), store.get(ARCHIVE_KEY), archive.revisions(get_user_data_dir()))
+    cached_backup = st.session_state.get("backup_zip")
+    if cached_backup is not None and cached_backup[0] != backup_rev:
+        cached_backup = None
+        st.session_state.pop("backup_zip", None)
+
+    if cached_backup is None:
+        if st.sidebar.button("📦 Backup erstellen", use_container_width=True):
+            from dashboard.backup import build_backup_zip
+
+            # Backup enthält auch die archivierten Datensätze (dashboard.archive)
+            full = archive.full_store(get_user_data_dir(), store)
+            cached_backup = (backup_rev, build_backup_zip(full, user))
+            st.session_state["backup_zip"] = cached_backup
+
+    if cached_backup is not None:
+        st.sidebar.download_button(
+            "⬇️ Backup herunterladen (ZIP)",
+            data=cached_backup[1],
+            file_name=f"dashboard_backup_{st.session_state.get('user','user')}.zip",
+            mime="application/zip",
+            use_container_width=True,
+        )
+
+    cached_export = st.session_state.get("analytics_zip")
+    if cached_export is not None and cached_export[0] != backup_rev:
+        cached_export = None
+        st.session_state.pop("analytics_zip", None)
+
+    if cached_export is None:
+        if st.sidebar.button("📊 Analytics-Export erstellen (Parquet)", use_container_width=True):
+            # pyarrow erst beim ersten Export laden
+            from dashboard.analytics_export import export_tables, tables_zip
+
+            full = archive.full_store(get_user_data_dir(), store)
+            cached_export = (backup_rev, tables_zip(export_tables({user: full})))
+            st.session_state["analytics_zip"] = cached_export
+
+    if cached_export is not None:
+        st.sidebar.download_button(
+            "⬇️ Analytics-Export herunterladen (ZIP)",
+            data=cached_export[1],
+            file_name=f"dashboard_analytics_{st.session_state.get('user','user')}.zip",
+            mime="application/zip",
+            use_container_width=True,
+        )
+
+    uploaded_backup = st.sidebar.file_uploader(
+        "⬆️ Backup wiederherstellen (ZIP/JSON)",
+        type=["zip", "json"],
+        help="Lädt ein Backup und überschreibt deine aktuellen Daten.",
+    )
+
+    backups = accept_uploads(uploaded_backup, "backup", container=st.sidebar)
+
+    if backups:
+        try:
+            # Backup nur einmal pro Inhalt einlesen, prüfen und migrieren
+            upload = backups[0]
+            preview = st.session_state.get("restore_preview")
+            if preview is None or preview[0] != upload.sha256:
+                from dashboard.restore import prepare_restore
+
+                with upload.open() as f:
+                    imported, report = prepare_restore(f)
+                preview = (upload.sha256, normalize_store(imported), report)
+                st.session_state["restore_preview"] = preview
+            _, imported, report = preview
+
+            st.sidebar.caption(f"Backup-Schema v{report['_version']}")
+            report_df = pd.DataFrame({k: v for k, v in report.items() if k != "_version"}).T
+            report_df["aktuell"] = [len(store.get(k, [])) for k in report_df.index]
+            st.sidebar.dataframe(report_df, use_container_width=True)
+
+            st.sidebar.warning("Achtung: Restore überschreibt ALLE aktuellen Daten.")
+            if st.sidebar.button("✅ Restore jetzt durchführen", use_container_width=True):
+                # Aktuellen Stand sichern, dann den Store ersetzen (gilt für alle Sessions des Users)
+                snapshot_locked(get_user_data_dir(), store)
+                save_store(imported)
+                st.session_state.pop("restore_preview", None)
+                st.sidebar.success("Restore erfolgreich ✅")
+                safe_rerun()
+
+        except Exception as e:
+            st.sidebar.error(f"Backup konnte nicht geladen werden: {e}")
+
+    # Automatische Snapshots (siehe dashboard/snapshots.py)
+    snapshots = list_snapshots(get_user_data_dir())
+    if snapshots:
+        with st.sidebar.expander(f"🕓 Snapshots ({len(snapshots)})"):
+            # Auswahl über die Snapshot-ID – Labels (Minute + Anzahlen) können sich wiederholen
+            snap_labels = {
+                sn["id"]: datetime.fromtimestamp(sn["ts"]).strftime("%d.%m.%Y %H:%M")
+                + " – "
+                + (", ".join(f"{v} {k}" for k, v in sn.get("anzahl", {}).items() if v) or "leer")
+                for sn in snapshots
+            }
+            snap_choice = st.selectbox(
+                "Stand auswählen", list(snap_labels), format_func=snap_labels.get, key="snap_choice"
+            )
+            if st.button("↩️ Diesen Stand wiederherstellen", use_container_width=True):
+                # Aktuellen Stand sichern, damit der Restore rückgängig gemacht werden kann
+                restored = normalize_store(restore_point(get_user_data_dir(), snap_choice, store))
+                save_store(restored)
+                st.success("Snapshot wiederhergestellt ✅")
+                safe_rerun()
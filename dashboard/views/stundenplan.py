@@ -0,0 +1,100 @@
+"""1️⃣ Stundenplan – HTML (in dashboard_data.json)."""
+import streamlit as st
+import streamlit.components.v1 as components
+
+from dashboard.session import (
+    accept_uploads,
+    calendar_download,
+    import_calendar,
+    load_stundenplan_html,
+    load_vorlesungen,
+    safe_rerun,
+    save_stundenplan_html,
+)
+
+FRAME_HEIGHT = 800
+FRAME_WIDTH = 1200
+
+
+def render(today):
+    st.title("📅 Stundenplan (HTML)")
+
+    st.markdown(
+        "✅ Speichert jetzt in **dashboard_data.json** (pro User).\n\n"
+        "- Scrollbalken nach unten/rechts\n"
+        "- Upload → Vorschau → Speichern"
+    )
+
+    html_content = load_stundenplan_html().strip()
+
+    if html_content:
+        st.markdown("### 🔍 Aktuell gespeicherter Stundenplan")
+        components.html(html_content, height=FRAME_HEIGHT, width=FRAME_WIDTH, scrolling=True)
+    else:
+        st.info("Noch kein Stundenplan gespeichert.")
+
+    st.markdown("---")
+    st.subheader("📤 Neuen HTML-Stundenplan hochladen")
+
+    uploaded_html = st.file_uploader("HTML-Datei auswählen:", type=["html", "htm"])
+
+    uploads = accept_uploads(uploaded_html, "stundenplan")
+
+    if uploads:
+        upload = uploads[0]
+        # Nur einmal pro Datei-Inhalt dekodieren
+        if st.session_state.get("stundenplan_html_upload_hash") != upload.sha256:
+            st.session_state["stundenplan_html_upload"] = upload.text()
+            st.session_state["stundenplan_html_upload_hash"] = upload.sha256
+
+        html_upload_content = st.session_state["stundenplan_html_upload"]
+
+        st.success(f"Neue HTML-Datei `{upload.name}` geladen ✅")
+        st.markdown("### 🧾 Vorschau")
+        components.html(html_upload_content, height=FRAME_HEIGHT, width=FRAME_WIDTH, scrolling=True)
+
+        if st.button("💾 Diesen Stundenplan für meinen Account speichern"):
+            save_stundenplan_html(html_upload_content)
+            st.success("Stundenplan gespeichert ✅")
+            safe_rerun()
+    else:
+        st.info("Lade eine HTML-Datei hoch, um sie anzuschauen oder zu speichern.")
+
+    st.markdown("---")
+    st.subheader("📆 Kalender (ICS)")
+    st.caption(
+        "Export: Klausuren, Seminartermine, fällige To-Dos und Vorlesungen für Google-, Apple- "
+        "oder Outlook-Kalender. Import: Kalender-Feed der Uni als Vorlesungen übernehmen – "
+        "ein erneuter Import derselben Datei ersetzt deren Termine."
+    )
+    st.download_button(
+        "⬇️ Kalender exportieren (.ics)",
+        data=calendar_download(),
+        file_name=f"uni_dashboard_{st.session_state.get('user', 'user')}.ics",
+        mime="text/calendar",
+        on_click="ignore",
+    )
+
+    feeds = accept_uploads(st.file_uploader("Kalender-Feed importieren (.ics)", type=["ics"], key="ics_feed"), "kalender")
+    if feeds:
+        feed = feeds[0]
+        if st.button(f"🔄 Vorlesungen aus `{feed.name}` übernehmen"):
+            report = import_calendar(feed)
+            text = (
+                f"{report['vorlesungen']} Vorlesungen aus {report['termine']} Terminen "
+                f"({report['serien']} Serien, {report['abgesagt']} abgesagt)"
+            )
+            if report["neu"] or report["entfernt"]:
+                st.success(f"{text} – {report['neu']} neu, {report['entfernt']} entfernt ✅")
+            else:
+                st.info(f"{text} – keine Änderungen.")
+            if report["unlesbar"]:
+                st.warning(
+                    f"{report['unlesbar']} Termine nicht übernommen "
+                    "(nicht unterstützte Wiederholungsregel, z.B. monatlich, oder fehlende Startzeit)."
+                )
+
+    vorlesungen = load_vorlesungen()
+    if not vorlesungen.empty:
+        quellen = vorlesungen["quelle"].replace("", "manuell / CSV").value_counts()
+        st.caption("Gespeicherte Vorlesungen: " + " · ".join(f"{q}: {n}" for q, n in quellen.items()))
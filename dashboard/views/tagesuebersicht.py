@@ -0,0 +1,241 @@
+"""0️⃣ Tagesübersicht mit Lernzeit-Timer."""
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+from dashboard.model import compute_exam_risk
+from dashboard.session import load_klausuren, load_mood, load_seminare, load_todos, save_klausuren
+
+
+def render(today):
+    klausuren = load_klausuren()
+    todos = load_todos()
+    seminare = load_seminare()
+
+    st.title("🏠 Tagesübersicht")
+    st.subheader(f"Heute: {today.strftime('%A, %d.%m.%Y')}")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("### 📆 Nächste Klausuren")
+        aktive = klausuren[~klausuren["archiviert"]].copy()
+        aktive = aktive[pd.notna(aktive["datum"])]
+        aktive = aktive[aktive["datum"] >= today].sort_values("datum")
+
+        if aktive.empty:
+            st.write("Keine anstehenden Klausuren 🙌")
+        else:
+            for _, row in aktive.head(3).iterrows():
+                days_until = (row["datum"] - today).days
+                risk, msg = compute_exam_risk(row, today)
+                st.write(f"**{row['fach']}** – in {days_until} Tag(en) ({row['datum'].strftime('%d.%m.%Y')})")
+                if risk == "grün":
+                    st.success(msg)
+                elif risk == "gelb":
+                    st.warning(msg)
+                elif risk == "rot":
+                    st.error(msg)
+                else:
+                    st.info(msg)
+
+    with col2:
+        st.markdown("### ✅ Wichtige To-Dos (Top 5)")
+        open_todos = [t for t in todos if not t["done"]]
+        if not open_todos:
+            st.write("Alles erledigt, stark! 🎉")
+        else:
+            def todo_sort_key(t):
+                due = t.get("faellig") or ""
+                try:
+                    d = datetime.fromisoformat(due).date()
+                except Exception:
+                    d = today + timedelta(days=365)
+                return (not t.get("wichtig", False), d)
+
+            open_todos_sorted = sorted(open_todos, key=todo_sort_key)[:5]
+            for t in open_todos_sorted:
+                label = t["text"]
+                if t.get("fach"):
+                    label += f" ({t['fach']})"
+                if t.get("faellig"):
+                    try:
+                        d = datetime.fromisoformat(t["faellig"]).date()
+                        label += f" – bis {d.strftime('%d.%m.%Y')}"
+                    except Exception:
+                        label += f" – bis {t['faellig']}"
+                st.write(("🔴 " if t.get("wichtig") else "🟢 ") + label)
+
+    with col3:
+        st.markdown("### 🎓 Seminare & Stimmung")
+        sem_today = seminare[pd.notna(seminare["datum"])]
+        sem_today = sem_today[sem_today["datum"] == today]
+        if not sem_today.empty:
+            st.write("**Heutige Seminare:**")
+            for _, row in sem_today.iterrows():
+                info = row["titel"]
+                if row.get("uhrzeit1", ""):
+                    info += f" – {row['uhrzeit1']}"
+                if row.get("notiz", "").strip():
+                    info += f" ({row['notiz']})"
+                info += f" – {row['punkte']} Punkte"
+                st.write(f"- {info}")
+        else:
+            sem_next = seminare[pd.notna(seminare["datum"])]
+            sem_next = sem_next[sem_next["datum"] > today].sort_values("datum")
+            if not sem_next.empty:
+                nxt = sem_next.iloc[0]
+                text = f"{nxt['titel']} am {nxt['datum'].strftime('%d.%m.%Y')}"
+                if nxt.get("uhrzeit1", ""):
+                    text += f", {nxt['uhrzeit1']}"
+                if nxt.get("notiz", "").strip():
+                    text += f" ({nxt['notiz']})"
+                text += f" – {nxt['punkte']} Punkte"
+                st.write("**Nächstes Seminar:**")
+                st.write(text)
+            else:
+                st.write("Keine Seminare eingetragen.")
+
+        mood_df = load_mood()
+        if not mood_df.empty:
+            last = mood_df.sort_values("datum").iloc[-1]
+            st.write("---")
+            st.write("**Letzter Stimmungseintrag:**")
+            st.write(f"Stimmung: {last['stimmung']}/10")
+            st.write(f"Stress: {last['stress']}/10")
+            st.write(f"Schlaf: {last['schlaf']} h")
+        else:
+            st.write("Noch kein Mood-Tracking gestartet.")
+
+    st.markdown("---")
+    st.subheader("⏱️ Lernzeit-Timer (Pomodoro light)")
+
+    if "timer_mode" not in st.session_state:
+        st.session_state["timer_mode"] = None
+    if "timer_start" not in st.session_state:
+        st.session_state["timer_start"] = None
+    if "timer_duration" not in st.session_state:
+        st.session_state["timer_duration"] = 0
+    if "timer_learn_minutes" not in st.session_state:
+        st.session_state["timer_learn_minutes"] = 25
+    if "timer_break_minutes" not in st.session_state:
+        st.session_state["timer_break_minutes"] = 5
+    if "timer_sound_played" not in st.session_state:
+        st.session_state["timer_sound_played"] = False
+    if "timer_exam_index" not in st.session_state:
+        st.session_state["timer_exam_index"] = None
+    if "timer_logged_to_exam" not in st.session_state:
+        st.session_state["timer_logged_to_exam"] = False
+
+    sound_dir = "sounds"
+    available_sounds = []
+    if os.path.isdir(sound_dir):
+        for f in os.listdir(sound_dir):
+            if f.lower().endswith((".mp3", ".wav", ".ogg")):
+                available_sounds.append(f)
+
+    if "timer_sound_file" not in st.session_state:
+        st.session_state["timer_sound_file"] = available_sounds[0] if available_sounds else None
+
+    col_t1, col_t2, col_t3 = st.columns(3)
+    with col_t1:
+        st.number_input("Lernphase (Minuten)", min_value=5, max_value=180, key="timer_learn_minutes")
+    with col_t2:
+        st.number_input("Pause (Minuten)", min_value=1, max_value=60, key="timer_break_minutes")
+
+    st.markdown("### 🔊 Sound-Einstellungen")
+    col_s1, col_s2 = st.columns([2, 1])
+    with col_s1:
+        options = ["(kein Sound)"] + available_sounds if available_sounds else ["(kein Sound)"]
+        current = st.session_state.get("timer_sound_file")
+        default_index = options.index(current) if current in options else 0
+        choice = st.selectbox("Alarm-Sound", options, index=default_index)
+        st.session_state["timer_sound_file"] = None if choice == "(kein Sound)" else choice
+
+    with col_s2:
+        if st.button("Sound testen"):
+            sound_name = st.session_state.get("timer_sound_file")
+            if sound_name:
+                try:
+                    with open(os.path.join(sound_dir, sound_name), "rb") as f:
+                        audio_bytes = f.read()
+                    st.audio(audio_bytes, format="audio/mp3")
+                except FileNotFoundError:
+                    st.warning(f"Sounddatei '{sound_name}' wurde nicht gefunden.")
+            else:
+                st.info("Kein Sound ausgewählt.")
+
+    aktive_klausuren = klausuren[~klausuren["archiviert"]]
+    exam_options = {"(keine Verknüpfung)": None}
+    for idx, row in aktive_klausuren.iterrows():
+        label = f"{row['fach']} – {row['datum'].strftime('%d.%m.%Y')}" if pd.notna(row["datum"]) else f"{row['fach']} – (ohne Datum)"
+        exam_options[label] = idx
+
+    selected_label = st.selectbox("Timer mit Klausur verknüpfen (optional)", list(exam_options.keys()))
+    st.session_state["timer_exam_index"] = exam_options[selected_label]
+
+    def start_timer(mode):
+        minutes = st.session_state["timer_learn_minutes"] if mode == "Lernphase" else st.session_state["timer_break_minutes"]
+        st.session_state["timer_mode"] = mode
+        st.session_state["timer_start"] = datetime.now().isoformat()
+        st.session_state["timer_duration"] = int(minutes * 60)
+        st.session_state["timer_sound_played"] = False
+        st.session_state["timer_logged_to_exam"] = False
+
+    with col_t3:
+        if st.button("Lernphase starten"):
+            start_timer("Lernphase")
+        if st.button("Pause starten"):
+            start_timer("Pause")
+        if st.button("Timer zurücksetzen"):
+            st.session_state["timer_mode"] = None
+            st.session_state["timer_start"] = None
+            st.session_state["timer_duration"] = 0
+            st.session_state["timer_sound_played"] = False
+            st.session_state["timer_logged_to_exam"] = False
+
+    st.write("---")
+    if st.session_state["timer_mode"] and st.session_state["timer_start"]:
+        mode = st.session_state["timer_mode"]
+        start_dt = datetime.fromisoformat(st.session_state["timer_start"])
+        duration = st.session_state["timer_duration"]
+        elapsed = (datetime.now() - start_dt).total_seconds()
+        remaining = max(duration - elapsed, 0)
+        progress = min(max(elapsed / duration, 0), 1) if duration > 0 else 0
+
+        mins = int(remaining // 60)
+        secs = int(remaining % 60)
+
+        st.write(f"Aktiver Timer: **{mode}**")
+        st.progress(progress)
+
+        if remaining > 0:
+            st.write(f"Noch {mins:02d}:{secs:02d} Minuten")
+        else:
+            st.success("Fertig! ✅" if mode == "Lernphase" else "Pause vorbei! 💪")
+
+            if mode == "Lernphase" and not st.session_state["timer_logged_to_exam"]:
+                exam_idx = st.session_state.get("timer_exam_index")
+                if exam_idx is not None and exam_idx in klausuren.index:
+                    minutes = st.session_state["timer_learn_minutes"]
+                    hours = minutes / 60.0
+                    vorher = float(klausuren.at[exam_idx, "gelernt_stunden"])
+                    klausuren.at[exam_idx, "gelernt_stunden"] = vorher + hours
+                    save_klausuren(klausuren)
+                    st.success(f"{hours:.2f} h wurden für '{klausuren.at[exam_idx, 'fach']}' gutgeschrieben.")
+                st.session_state["timer_logged_to_exam"] = True
+
+            if not st.session_state["timer_sound_played"]:
+                sound_name = st.session_state.get("timer_sound_file")
+                if sound_name:
+                    try:
+                        with open(os.path.join(sound_dir, sound_name), "rb") as f:
+                            audio = f.read()
+                        st.audio(audio, format="audio/mp3")
+                    except FileNotFoundError:
+                        st.warning(f"Sounddatei '{sound_name}' wurde nicht gefunden.")
+                st.session_state["timer_sound_played"] = True
+    else:
+        st.write("Kein Timer aktiv. Starte eine Lernphase oder Pause.")
@@ -0,0 +1,52 @@
+"""3️⃣ To-Do Liste."""
+import streamlit as st
+
+from dashboard.session import load_todos, safe_rerun, save_todos
+
+
+def render(today):
+    st.title("📋 To-Do Liste")
+
+    todos = load_todos()
+    delete_index = None
+
+    for idx, todo in enumerate(todos):
+        col1, col2, col3 = st.columns([0.6, 0.2, 0.2])
+
+        with col1:
+            done = st.checkbox(todo["text"], todo["done"], key=f"done_{idx}")
+            todos[idx]["done"] = done
+
+        with col2:
+            wichtig = st.checkbox("Wichtig", todo["wichtig"], key=f"wicht_{idx}")
+            todos[idx]["wichtig"] = wichtig
+
+        with col3:
+            if st.button("🗑️", key=f"delete_{idx}"):
+                delete_index = idx
+
+    if delete_index is not None:
+        todos.pop(delete_index)
+
+    save_todos(todos)
+
+    st.markdown("---")
+    st.subheader("➕ Neue Aufgabe")
+
+    new_text = st.text_input("Aufgabe")
+    new_fach = st.text_input("Fach")
+    new_due = st.date_input("Fällig bis", value=today)
+
+    if st.button("Aufgabe hinzufügen"):
+        todos.append(
+            {
+                "text": new_text,
+                "done": False,
+                "fach": new_fach,
+                "wichtig": False,
+                "faellig": str(new_due),
+            }
+        )
+        save_todos(todos)
+        st.success("Aufgabe hinzugefügt!")
+        safe_rerun()
@@ -0,0 +1,63 @@
+"""Wärmt den Server-Prozess auf, während die Login-Seite angezeigt wird.
+
+``app.py`` ruft ``start()`` beim ersten Rerun auf; ein Hintergrund-Thread
+lädt dann einmal pro Prozess, was nach dem Login gebraucht wird:
+
+- die Stores aller User-Ordner in ``shared_store`` (prozessweiter Cache),
+- die LaTeX-Bibliothek samt Suchindex,
+- das Modul der Startseite (Tagesübersicht),
+- die Sound-Dateien (Page-Cache).
+
+Abschalten mit ``DASHBOARD_PREWARM=0`` (``run_dashboard.py --no-prewarm``).
+"""
+import importlib
+import os
+import threading
+
+from dashboard import shared_store
+from dashboard.store import DASHBOARD_JSON
+
+PREWARM_ENV = "DASHBOARD_PREWARM"
+START_PAGE = "dashboard.views.tagesuebersicht"
+
+_started = False
+_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    return os.environ.get(PREWARM_ENV, "1") not in ("0", "false", "no")
+
+
+def run(data_dir: str = "data", sound_dir: str = "sounds"):
+    """Lädt alles einmal im aufrufenden Thread (ein nicht lesbarer Store wird übersprungen)."""
+    if os.path.isdir(data_dir):
+        for entry in os.scandir(data_dir):
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, DASHBOARD_JSON)):
+                try:
+                    shared_store.get_snapshot(entry.path)
+                except Exception:
+                    pass
+
+    from dashboard.latex_library import _search_index, load_library
+    load_library()
+    _search_index()
+    importlib.import_module(START_PAGE)
+
+    if os.path.isdir(sound_dir):
+        for name in os.listdir(sound_dir):
+            if name.lower().endswith((".mp3", ".wav", ".ogg")):
+                with open(os.path.join(sound_dir, name), "rb") as f:
+                    f.read()
+
+
+def start(data_dir: str = "data") -> bool:
+    """Startet ``run()`` einmal pro Prozess im Hintergrund. ``True``, wenn der Thread jetzt gestartet wurde."""
+    global _started
+    if not enabled():
+        return False
+    with _lock:
+        if _started:
+            return False
+        _started = True
+    threading.Thread(target=run, args=(data_dir,), name="warmup", daemon=True).start()
+    return True
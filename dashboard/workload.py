@@ -0,0 +1,120 @@
+"""Belastungsprognose für den Stressradar.
+
+Aus Klausuren (Lernfenster ``tage_vorher`` und offene Stunden
+``ziel_stunden - gelernt_stunden``), offenen To-Dos und Seminarterminen wird
+eine tägliche Stundenreihe für die nächsten Wochen aufgebaut. Alles läuft
+über Differenz-Arrays bzw. ``np.bincount`` – keine Schleife pro Eintrag.
+"""
+import numpy as np
+import pandas as pd
+
+# Pauschale Annahmen, wo keine Stunden hinterlegt sind
+KLAUSUR_TAG_STUNDEN = 2.0
+TODO_STUNDEN = 1.0
+TODO_VORLAUF_TAGE = 3
+SEMINAR_TAG_STUNDEN = 3.0
+
+FORECAST_COLS = ["klausuren", "todos", "seminare"]
+
+
+def _day_offsets(values, today) -> np.ndarray:
+    """Datumswerte -> Tage ab ``today`` als float (NaN bei fehlendem Datum)."""
+    dates = pd.to_datetime(pd.Series(values, dtype=object), errors="coerce")
+    delta = (dates - pd.Timestamp(today)).dt.days
+    return delta.to_numpy(dtype=float)
+
+
+def _spread(starts, ends, hours, horizon: int) -> np.ndarray:
+    """Verteilt ``hours`` gleichmäßig auf die Tage ``[start, end)``.
+
+    Die Intervalle werden per Differenz-Array aufsummiert und erst danach
+    auf den Prognosezeitraum ``[0, horizon)`` beschnitten.
+    """
+    length = ends - starts
+    ok = (length > 0) & (hours > 0)
+    starts, ends, rate = starts[ok], ends[ok], hours[ok] / length[ok]
+
+    starts = np.clip(starts, 0, horizon).astype(int)
+    ends = np.clip(ends, 0, horizon).astype(int)
+
+    diff = np.zeros(horizon + 1)
+    np.add.at(diff, starts, rate)
+    np.add.at(diff, ends, -rate)
+    return np.cumsum(diff)[:horizon]
+
+
+def _point_load(offsets, hours, horizon: int) -> np.ndarray:
+    """Addiert ``hours`` auf einzelne Tage innerhalb des Prognosezeitraums."""
+    hours = np.broadcast_to(np.asarray(hours, dtype=float), offsets.shape)
+    ok = ~np.isnan(offsets) & (offsets >= 0) & (offsets < horizon)
+    return np.bincount(offsets[ok].astype(int), weights=hours[ok], minlength=horizon)[:horizon]
+
+
+def exam_load(klausuren: pd.DataFrame, today, horizon: int) -> np.ndarray:
+    """Lernstunden aktiver Klausuren, verteilt auf das verbleibende Lernfenster."""
+    aktiv = klausuren[~klausuren["archiviert"].astype(bool)]
+    if aktiv.empty:
+        return np.zeros(horizon)
+
+    exam_day = _day_offsets(aktiv["datum"], today)
+    window = pd.to_numeric(aktiv["tage_vorher"], errors="coerce").fillna(21).to_numpy(dtype=float)
+    remaining = np.clip(
+        pd.to_numeric(aktiv["ziel_stunden"], errors="coerce").fillna(0.0).to_numpy()
+        - pd.to_numeric(aktiv["gelernt_stunden"], errors="coerce").fillna(0.0).to_numpy(),
+        0.0,
+        None,
+    )
+
+    valid = ~np.isnan(exam_day) & (exam_day >= 0)
+    exam_day, window, remaining = exam_day[valid], window[valid], remaining[valid]
+
+    # Liegt der Fensterbeginn schon hinter uns, wird der Rest ab heute verteilt.
+    start = np.maximum(exam_day - np.maximum(window, 1), 0)
+    study = _spread(start, exam_day, remaining, horizon)
+    return study + _point_load(exam_day, KLAUSUR_TAG_STUNDEN, horizon)
+
+
+def todo_load(todos: list, today, horizon: int) -> np.ndarray:
+    """Offene To-Dos, verteilt auf die ``TODO_VORLAUF_TAGE`` vor dem Fälligkeitsdatum."""
+    offen = [t.get("faellig", "") for t in todos if not t.get("done", False)]
+    if not offen:
+        return np.zeros(horizon)
+
+    due = _day_offsets(offen, today)
+    due = due[~np.isnan(due)]
+    # Überfällige Aufgaben landen auf heute
+    due = np.maximum(due, 0)
+    start = np.maximum(due + 1 - TODO_VORLAUF_TAGE, 0)
+    return _spread(start, due + 1, np.full(len(due), TODO_STUNDEN), horizon)
+
+
+def seminar_load(seminare: pd.DataFrame, today, horizon: int) -> np.ndarray:
+    """Seminartage (Termin 1 und 2) mit pauschaler Stundenzahl."""
+    if seminare.empty:
+        return np.zeros(horizon)
+    offsets = np.concatenate([_day_offsets(seminare["datum"], today), _day_offsets(seminare["datum2"], today)])
+    return _point_load(offsets, SEMINAR_TAG_STUNDEN, horizon)
+
+
+def workload_forecast(klausuren: pd.DataFrame, todos: list, seminare: pd.DataFrame, today, weeks: int = 4) -> pd.DataFrame:
+    """Tägliche Belastung (Stunden) für die nächsten ``weeks`` Wochen.
+
+    Spalten: ``klausuren``, ``todos``, ``seminare`` und ``gesamt``; Index: Datum.
+    """
+    horizon = int(weeks) * 7
+    df = pd.DataFrame(
+        {
+            "klausuren": exam_load(klausuren, today, horizon),
+            "todos": todo_load(todos, today, horizon),
+            "seminare": seminar_load(seminare, today, horizon),
+        },
+        index=pd.date_range(pd.Timestamp(today), periods=horizon, freq="D").date,
+    )
+    df["gesamt"] = df[FORECAST_COLS].sum(axis=1)
+    return df
+
+
+def peak_days(forecast: pd.DataFrame, n: int = 5) -> pd.DataFrame:
+    """Die ``n`` Tage mit der höchsten Gesamtbelastung (nur Tage mit Last)."""
+    busy = forecast[forecast["gesamt"] > 0]
+    return busy.nlargest(n, "gesamt")
@@ -1,19 +1,172 @@
+"""Startet das Dashboard und öffnet den Browser, sobald der Server bereit ist.
+
+Statt fest zwei Sekunden zu warten, wird Streamlits Health-Endpoint
+(``/_stcore/health``) mit wachsendem Abstand abgefragt. Der Port wird frei
+gewählt (Standard 8501, falls belegt ein freier). Unbekannte Argumente gehen
+unverändert an ``streamlit run``, z.B.:
+
+    python run_dashboard.py --port 8600 --server.maxUploadSize 50
+
+Health-Abfrage und Browser gehen an ``127.0.0.1``, wenn der Server auf
+allen Adressen (``0.0.0.0``) oder auf localhost lauscht. Das Aufwärmen
+(Stores, LaTeX-Bibliothek, Startseite) übernimmt der Server-Prozess selbst,
+während die Login-Seite offen ist (``dashboard/warmup.py``); ``--no-prewarm``
+schaltet es ab. Der Launcher nutzt bewusst nur die Standardbibliothek, damit
+der PyInstaller-Build klein bleibt.
+
+Mehrprozess-Betrieb (Lerngruppe auf einem Server)
+-------------------------------------------------
+Ein Streamlit-Prozess rechnet alle Reruns unter einem GIL. Mit
+
+    python run_dashboard.py --workers 4 --host 0.0.0.0 --port 8501
+
+starten vier unabhängige Server-Prozesse auf aufeinanderfolgenden freien
+Ports über demselben ``data/``-Ordner. Davor gehört ein Reverse-Proxy mit
+WebSocket-Unterstützung und *Sticky Sessions* – Login und Session-State
+leben im jeweiligen Prozess, eine Session muss also immer beim selben
+Worker landen. Beispiel nginx::
+
+    upstream dashboard { ip_hash; server 127.0.0.1:8501; server 127.0.0.1:8502; ... }
+    location / {
+        proxy_pass http://dashboard;
+        proxy_http_version 1.1;
+        proxy_set_header Upgrade $http_upgrade;
+        proxy_set_header Connection "upgrade";
+        proxy_read_timeout 86400;
+    }
+
+Jeder Schreibvorgang läuft unter einer Datei-Sperre pro User und wird mit
+dem aktuellen Stand auf der Platte zusammengeführt (``dashboard/locking.py``,
+``dashboard/merge.py``); andere Prozesse sehen die Änderung beim nächsten
+Rerun. Messen lässt sich das mit ``python -m benchmarks.bench_multiprocess``.
+
+Die Lernordner-Übersicht listet mit ``--host 0.0.0.0`` nur Ordner unterhalb
+von ``DASHBOARD_LERNORDNER_ROOT`` (z.B. ein gemeinsamer Skripte-Ordner); beim
+lokalen Start ist ohne die Variable das Home-Verzeichnis freigegeben
+(``dashboard/folder_index.py``).
+"""
+import argparse
+import os
+import socket
 import subprocess
-import webbrowser
+import sys
 import time
-import os
+import urllib.error
+import urllib.request
+import webbrowser
 
 # Pfad zur app.py
-APP_PATH = os.path.join(os.path.dirname(__file__), "app.py")
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BASE_DIR, "app.py")
+
+DEFAULT_PORT = 8501
+HEALTH_PATH = "/_stcore/health"
+VIA_LOOPBACK = ("", "0.0.0.0", "::", "localhost")
+
+
+def pick_port(preferred: int, host: str = "localhost") -> int:
+    """``preferred``, falls frei – sonst einen vom System vergebenen freien Port."""
+    for port in (preferred, 0):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            try:
+                s.bind((host, port))
+            except OSError:
+                continue
+            return s.getsockname()[1]
+    raise RuntimeError("Kein freier Port gefunden")
+
+
+def wait_until_ready(url: str, proc=None, timeout: float = 60.0) -> bool:
+    """Fragt den Health-Endpoint mit exponentiellem Backoff ab (50 ms … 1 s)."""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        if proc is not None and proc.poll() is not None:
+            return False
+        try:
+            with urllib.request.urlopen(url, timeout=1) as resp:
+                if resp.status == 200:
+                    return True
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+    return False
+
+
+def local_url(host: str, port: int) -> str:
+    """Adresse, unter der dieser Rechner den Server erreicht (``0.0.0.0`` taugt unter Windows nicht als Ziel)."""
+    return f"http://{'127.0.0.1' if host in VIA_LOOPBACK else host}:{port}"
+
+
+def streamlit_command() -> list:
+    # Im PyInstaller-Build ist sys.executable der Launcher selbst
+    if getattr(sys, "frozen", False):
+        return ["streamlit"]
+    return [sys.executable, "-m", "streamlit"]
+
+
+def start_server(port: int, host: str, streamlit_args: list) -> subprocess.Popen:
+    cmd = streamlit_command() + [
+        "run", APP_PATH,
+        "--server.port", str(port),
+        "--server.address", host,
+        "--server.headless", "true",
+    ] + streamlit_args
+    return subprocess.Popen(cmd)
+
+
+def stop_all(procs: list):
+    for p in procs:
+        if p.poll() is None:
+            p.terminate()
+    for p in procs:
+        p.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uni-Dashboard starten.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--workers", type=int, default=1, help="Anzahl Server-Prozesse (Mehrprozess-Betrieb, s.o.)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Max. Wartezeit auf den Server (s)")
+    parser.add_argument("--no-browser", action="store_true")
+    parser.add_argument("--no-prewarm", action="store_true")
+    args, streamlit_args = parser.parse_known_args()
+    if args.no_prewarm:
+        os.environ["DASHBOARD_PREWARM"] = "0"
+
+    # Streamlit starten (ein Prozess pro Worker, Ports aufsteigend ab --port)
+    procs, urls = [], []
+    port = args.port
+    for _ in range(max(1, args.workers)):
+        port = pick_port(port, args.host)
+        procs.append(start_server(port, args.host, streamlit_args))
+        urls.append(local_url(args.host, port))
+        port += 1
+
+    try:
+        for p, url in zip(procs, urls):
+            if not wait_until_ready(url + HEALTH_PATH, p, args.timeout):
+                print(f"Dashboard unter {url} nicht erreichbar.", file=sys.stderr)
+                stop_all(procs)
+                sys.exit(p.poll() or 1)
 
-# Streamlit starten
-p = subprocess.Popen(["streamlit", "run", APP_PATH])
+        # Webseite im Browser öffnen
+        for url in urls:
+            print(f"Dashboard läuft unter {url}")
+        if len(urls) > 1:
+            print("Mehrprozess-Betrieb: Reverse-Proxy mit Sticky Sessions davorschalten (siehe run_dashboard.py).")
+        if not args.no_browser:
+            webbrowser.open(urls[0])
 
-# kurz warten
-time.sleep(2)
+        # Prozesse laufen lassen; endet einer, werden alle beendet
+        while all(p.poll() is None for p in procs):
+            time.sleep(1)
+        stop_all(procs)
+    except KeyboardInterrupt:
+        stop_all(procs)
 
-# Webseite im Browser öffnen
-webbrowser.open("http://localhost:8501")
 
-# Prozess laufen lassen
-p.wait()
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,25 @@ a = Analysis(
     ['run_dashboard.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[
+        ('app.py', '.'),
+        ('dashboard/*.py', 'dashboard'),
+        ('dashboard/views/*.py', 'dashboard/views'),
+        ('dashboard/latex_library.json', 'dashboard'),
+    ],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Der Launcher braucht nur die Standardbibliothek; alles andere läuft im
+    # Streamlit-Prozess. Weniger Module = weniger zu entpacken beim Start.
+    excludes=[
+        'streamlit', 'pandas', 'numpy', 'pyarrow', 'PyPDF2', 'docx', 'lxml',
+        'tkinter', 'unittest', 'pydoc', 'doctest', 'lib2to3', 'xmlrpc',
+        'sqlite3', 'multiprocessing', 'asyncio', 'curses', 'IPython', 'matplotlib',
+    ],
     noarchive=False,
-    optimize=0,
+    optimize=1,
 )
 pyz = PYZ(a.pure)
 